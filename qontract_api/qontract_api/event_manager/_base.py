@@ -1,41 +1,181 @@
 from __future__ import annotations
 
+import atexit
+import contextlib
 import logging
-from typing import TYPE_CHECKING
+import queue
+import threading
+from typing import TYPE_CHECKING, Any
 
 import structlog
 from qontract_utils.events import Event, RedisBroker
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from qontract_api.config import Settings
 
 log = logging.getLogger(__name__)
 
+QueuedEvent = tuple[Event, dict[str, Any] | None]
+
+# errors that mean the broker is unreachable, the batch is kept and retried
+CONNECTION_ERRORS = (OSError, RedisConnectionError, RedisTimeoutError)
+
 
 class EventManager:
     """Manages event publishing for qontract-api.
 
     Encapsulates the event publisher lifecycle and configuration.
-    Publishing failures are logged but never propagated to the caller.
+    Events are queued and published in batches by a background thread which
+    keeps a single broker connection open for the lifetime of the process.
+    Call close() to flush the queue on shutdown (also registered via atexit).
+    Publishing failures are logged but never propagated to the caller; a batch
+    that failed because the broker is unreachable is retried after reconnecting.
     """
 
-    def __init__(self, publisher: RedisBroker, stream: str) -> None:
+    def __init__(
+        self,
+        publisher: RedisBroker,
+        stream: str,
+        batch_size: int = 100,
+        max_queue_size: int = 10_000,
+        reconnect_delay: float = 1.0,
+    ) -> None:
         self._publisher = publisher
         self._stream = stream
+        self._batch_size = batch_size
+        self._reconnect_delay = reconnect_delay
+        self._queue: queue.Queue[QueuedEvent | None] = queue.Queue(
+            maxsize=max_queue_size
+        )
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self._stopped = threading.Event()
 
-    def publish_event(self, event: Event) -> None:
-        """Publish a single event. Failures are logged but do not propagate.
+    @staticmethod
+    def _headers() -> dict[str, Any] | None:
+        """Return the structlog context (e.g. request_id) as message headers.
 
-        Propagates structlog context (e.g. request_id) as message headers,
-        similar to the Celery context propagation in tasks/__init__.py.
+        Similar to the Celery context propagation in tasks/__init__.py.
         """
         context = structlog.contextvars.get_merged_contextvars(structlog.get_logger())
-        headers = {k: str(v) for k, v in context.items()} if context else None
-        with self._publisher as publisher:
+        return {k: str(v) for k, v in context.items()} if context else None
+
+    def publish_event(self, event: Event) -> None:
+        """Queue a single event for publishing. Failures are logged but do not propagate."""
+        self.publish_events([event])
+
+    def publish_events(self, events: Iterable[Event]) -> None:
+        """Queue a batch of events for publishing. Failures are logged but do not propagate."""
+        headers = self._headers()
+        batch = [(event, headers) for event in events]
+        if not self._start():
+            # already shut down, publish synchronously instead of losing events
+            self._publish_now(batch)
+            return
+        for item in batch:
             try:
-                publisher.publish(event, stream=self._stream, headers=headers)
+                self._queue.put_nowait(item)
+            except queue.Full:
+                log.warning(f"Event queue is full, dropping event {item[0].type}")
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Publish all queued events and stop the background thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is None:
+            return
+        # on a full queue the thread stops once the queue is drained
+        with contextlib.suppress(queue.Full):
+            self._queue.put_nowait(None)
+        thread.join(timeout)
+        # give up reconnecting to an unreachable broker
+        self._stopped.set()
+        if thread.is_alive():
+            log.error(
+                f"Event publisher did not finish within {timeout}s, "
+                f"{self._queue.qsize()} events are lost"
+            )
+
+    def _start(self) -> bool:
+        with self._lock:
+            if self._closed:
+                return False
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="event-manager", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.close)
+            return True
+
+    def _run(self) -> None:
+        batch: list[QueuedEvent] = []
+        stop = False
+        while batch or not stop:
+            try:
+                with self._publisher as publisher:
+                    while batch or not stop:
+                        if not batch:
+                            batch, stop = self._next_batch()
+                        self._flush(publisher, batch)
+                        batch = []
             except Exception:
-                log.exception(f"Failed to publish event {event.type}")
+                log.exception("Event broker connection failed")
+                # keep the unsent batch and the queue, retry until close() gives up
+                if self._stopped.wait(self._reconnect_delay):
+                    lost = len(batch) + self._queue.qsize()
+                    log.warning(f"{lost} queued events are lost")
+                    return
+
+    def _next_batch(self) -> tuple[list[QueuedEvent], bool]:
+        """Block for the next event and drain whatever else is queued.
+
+        After close() the queue is only drained, the sentinel may be missing
+        if the queue was full.
+        """
+        try:
+            item = self._queue.get(block=not self._closed)
+        except queue.Empty:
+            return [], True
+        if item is None:
+            return [], True
+        batch = [item]
+        while len(batch) < self._batch_size:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _flush(self, publisher: RedisBroker, batch: list[QueuedEvent]) -> None:
+        if not batch:
+            return
+        try:
+            publisher.publish_batch(batch, stream=self._stream)
+        except CONNECTION_ERRORS:
+            raise
+        except Exception:
+            log.exception(
+                f"Failed to publish events {', '.join(e.type for e, _ in batch)}"
+            )
+
+    def _publish_now(self, batch: list[QueuedEvent]) -> None:
+        try:
+            with self._publisher as publisher:
+                self._flush(publisher, batch)
+        except Exception:
+            log.exception("Event broker connection failed")
 
     @classmethod
     def from_config(cls, settings: Settings) -> EventManager | None:
@@ -1,10 +1,31 @@
+import os
+import threading
+
 from qontract_api.config import settings
 from qontract_api.event_manager._base import EventManager
 
+_lock = threading.Lock()
+# (pid, manager): the background publisher thread does not survive a fork,
+# so every (Celery prefork) worker process gets its own manager
+_instance: tuple[int, EventManager | None] | None = None
+
 
 def get_event_manager() -> EventManager | None:
-    """Create an EventManager from application settings.
+    """Get the EventManager of this process, created from application settings.
 
     Returns None if event publishing is disabled.
     """
-    return EventManager.from_config(settings=settings)
+    global _instance  # noqa: PLW0603
+    with _lock:
+        if _instance is None or _instance[0] != os.getpid():
+            _instance = (os.getpid(), EventManager.from_config(settings=settings))
+        return _instance[1]
+
+
+def shutdown_event_manager() -> None:
+    """Flush and close the EventManager of this process, if any."""
+    global _instance
+    with _lock:
+        instance, _instance = _instance, None
+    if instance and instance[0] == os.getpid() and instance[1]:
+        instance[1].close()
@@ -52,6 +52,7 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
     from qontract_api.cache.factory import get_cache  # noqa: PLC0415
     from qontract_api.event_manager._factory import (  # noqa: PLC0415
         get_event_manager,
+        shutdown_event_manager,
     )
     from qontract_api.secret_manager._factory import (  # noqa: PLC0415
         get_secret_manager,
@@ -91,6 +92,9 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
     if opa_client := getattr(_app.state, "opa_client", None):
         await opa_client.client.aclose()
 
+    # Publish queued events on shutdown
+    shutdown_event_manager()
+
     # Cleanup secret backend on shutdown
     if hasattr(_app.state, "secret_manager") and _app.state.secret_manager is not None:
         _app.state.secret_manager.close()
@@ -10,6 +10,7 @@ from kombu import Queue
 from prometheus_client import Counter, Histogram
 
 from qontract_api.config import settings
+from qontract_api.event_manager import shutdown_event_manager
 from qontract_api.logger import get_logger, setup_logger, setup_logging
 from qontract_api.models import TaskResult
 from qontract_api.tasks._deduplication import deduplicated_task
@@ -68,6 +69,15 @@ def setup_loggers(*_: Any, **__: Any) -> None:
     setup_logging()
 
 
+@celery.signals.worker_process_shutdown.connect
+def on_worker_process_shutdown(*_: Any, **__: Any) -> None:
+    """Publish queued events before the worker process exits.
+
+    Prefork worker processes exit without running atexit handlers.
+    """
+    shutdown_event_manager()
+
+
 @celery.signals.before_task_publish.connect
 def on_before_task_publish(headers: dict, *_: tuple, **__: dict) -> None:
     """Setup all necessary context before task is published.
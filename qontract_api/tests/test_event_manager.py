@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from typing import TYPE_CHECKING
 from unittest.mock import ANY, MagicMock
 
@@ -39,19 +40,135 @@ class TestEventManager:
         sample_event: Event,
     ) -> None:
         event_manager.publish_event(sample_event)
-        mock_publisher.__enter__().publish.assert_called_once_with(  # noqa: PLC2801
-            sample_event, stream="test-stream", headers=ANY
+        event_manager.close()
+        mock_publisher.__enter__().publish_batch.assert_called_once_with(  # noqa: PLC2801
+            [(sample_event, ANY)], stream="test-stream"
         )
 
+    def test_publish_events_batched(
+        self,
+        mock_publisher: MagicMock,
+        sample_event: Event,
+    ) -> None:
+        event_manager = EventManager(
+            publisher=mock_publisher, stream="test-stream", batch_size=2
+        )
+        event_manager.publish_events([sample_event] * 3)
+        event_manager.close()
+
+        # one connection for all events
+        mock_publisher.__enter__.assert_called_once()
+        publish_batch = mock_publisher.__enter__.return_value.publish_batch
+        batches = [c.args[0] for c in publish_batch.call_args_list]
+        assert sum(len(b) for b in batches) == 3
+        assert all(len(b) <= 2 for b in batches)
+
     def test_publish_event_failure_does_not_propagate(
         self,
         event_manager: EventManager,
         mock_publisher: MagicMock,
         sample_event: Event,
     ) -> None:
-        mock_publisher.__enter__().publish.side_effect = Exception("Redis error")  # noqa: PLC2801
+        mock_publisher.__enter__().publish_batch.side_effect = Exception("Redis error")  # noqa: PLC2801
         # Should not raise
         event_manager.publish_event(sample_event)
+        event_manager.close()
+
+    def test_publish_event_retries_connection(
+        self,
+        mock_publisher: MagicMock,
+        sample_event: Event,
+    ) -> None:
+        mock_publisher.__enter__.side_effect = [
+            Exception("connection refused"),
+            mock_publisher,
+        ]
+        event_manager = EventManager(
+            publisher=mock_publisher, stream="test-stream", reconnect_delay=0
+        )
+        event_manager.publish_event(sample_event)
+        event_manager.close()
+
+        mock_publisher.publish_batch.assert_called_once_with(
+            [(sample_event, ANY)], stream="test-stream"
+        )
+
+    def test_publish_event_retries_batch_after_connection_error(
+        self,
+        mock_publisher: MagicMock,
+        sample_event: Event,
+    ) -> None:
+        publish_batch = mock_publisher.__enter__.return_value.publish_batch
+        publish_batch.side_effect = [ConnectionError("connection reset"), None]
+        event_manager = EventManager(
+            publisher=mock_publisher, stream="test-stream", reconnect_delay=0
+        )
+        event_manager.publish_event(sample_event)
+        event_manager.close()
+
+        # reconnected and published the same batch again
+        assert mock_publisher.__enter__.call_count == 2
+        assert [c.args[0] for c in publish_batch.call_args_list] == [
+            [(sample_event, ANY)],
+            [(sample_event, ANY)],
+        ]
+
+    def test_close_drains_full_queue(
+        self,
+        mock_publisher: MagicMock,
+        sample_event: Event,
+    ) -> None:
+        connect = threading.Event()
+
+        def enter() -> MagicMock:
+            connect.wait()
+            return mock_publisher
+
+        mock_publisher.__enter__.side_effect = enter
+        event_manager = EventManager(
+            publisher=mock_publisher, stream="test-stream", max_queue_size=2
+        )
+        event_manager.publish_events([sample_event] * 2)
+        threading.Timer(0.1, connect.set).start()
+        event_manager.close()
+
+        publish_batch = mock_publisher.publish_batch
+        assert sum(len(c.args[0]) for c in publish_batch.call_args_list) == 2
+        assert event_manager._thread is not None
+        assert not event_manager._thread.is_alive()
+
+    def test_close_full_queue_broker_down_does_not_block(
+        self,
+        mock_publisher: MagicMock,
+        sample_event: Event,
+    ) -> None:
+        mock_publisher.__enter__.side_effect = ConnectionError("connection refused")
+        event_manager = EventManager(
+            publisher=mock_publisher,
+            stream="test-stream",
+            max_queue_size=1,
+            reconnect_delay=60,
+        )
+        event_manager.publish_events([sample_event] * 2)
+        event_manager.close(timeout=0.1)
+
+        # the thread stops waiting for the broker once close() timed out
+        assert event_manager._thread is not None
+        event_manager._thread.join(5)
+        assert not event_manager._thread.is_alive()
+        mock_publisher.publish_batch.assert_not_called()
+
+    def test_publish_event_after_close_publishes_synchronously(
+        self,
+        event_manager: EventManager,
+        mock_publisher: MagicMock,
+        sample_event: Event,
+    ) -> None:
+        event_manager.close()
+        event_manager.publish_event(sample_event)
+        mock_publisher.__enter__().publish_batch.assert_called_once_with(  # noqa: PLC2801
+            [(sample_event, ANY)], stream="test-stream"
+        )
 
     def test_from_config_disabled(self, mocker: MockerFixture) -> None:
         mock_settings = mocker.MagicMock()
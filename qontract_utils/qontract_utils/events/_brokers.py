@@ -1,5 +1,5 @@
 import asyncio
-from collections.abc import Coroutine
+from collections.abc import Coroutine, Sequence
 from typing import Any, Self
 
 from faststream.redis import RedisBroker as FastRedisBroker
@@ -12,6 +12,7 @@ class RedisBroker:
     def __init__(self, url: str) -> None:
         self._broker = FastRedisBroker(url)
         self._loop: asyncio.AbstractEventLoop | None = None
+        self._connection: Any = None
 
     def _run(self, coro: Coroutine[Any, Any, Any]) -> Any:
         if self._loop is None or self._loop.is_closed():
@@ -20,7 +21,7 @@ class RedisBroker:
 
     def __enter__(self) -> Self:
         self._loop = asyncio.new_event_loop()
-        self._run(self._broker.connect())
+        self._connection = self._run(self._broker.connect())
         return self
 
     def __exit__(self, *args: object) -> None:
@@ -30,6 +31,7 @@ class RedisBroker:
             if self._loop and not self._loop.is_closed():
                 self._loop.close()
             self._loop = None
+            self._connection = None
 
     def publish(
         self,
@@ -39,3 +41,26 @@ class RedisBroker:
     ) -> int | bytes:
         """Publish a message to a Redis Stream."""
         return self._run(self._broker.publish(message, stream=stream, headers=headers))
+
+    def publish_batch(
+        self,
+        messages: Sequence[tuple[SendableMessage, dict[str, Any] | None]],
+        stream: str,
+    ) -> list[Any]:
+        """Publish (message, headers) pairs to a Redis Stream.
+
+        All XADDs are sent in a single pipeline, i.e. one round trip.
+        """
+        return self._run(self._publish_batch(messages, stream))
+
+    async def _publish_batch(
+        self,
+        messages: Sequence[tuple[SendableMessage, dict[str, Any] | None]],
+        stream: str,
+    ) -> list[Any]:
+        async with self._connection.pipeline(transaction=False) as pipe:
+            for message, headers in messages:
+                await self._broker.publish(
+                    message, stream=stream, headers=headers, pipeline=pipe
+                )
+            return await pipe.execute()
@@ -120,3 +120,33 @@ def test_reentry_creates_new_loop(
     assert first_loop is not second_loop
     assert mock_fast_broker.connect.await_count == 2
     assert mock_fast_broker.stop.await_count == 2
+
+
+def test_publish_batch_uses_single_pipeline(
+    broker: RedisBroker, mock_fast_broker: MagicMock
+) -> None:
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[b"1-0", b"2-0"])
+    pipeline = MagicMock()
+    pipeline.__aenter__ = AsyncMock(return_value=pipe)
+    pipeline.__aexit__ = AsyncMock(return_value=None)
+    connection = MagicMock()
+    connection.pipeline.return_value = pipeline
+    mock_fast_broker.connect.return_value = connection
+
+    with broker:
+        result = broker.publish_batch(
+            [("msg-1", {"x-trace": "abc"}), ("msg-2", None)],
+            stream="test-stream",
+        )
+
+    connection.pipeline.assert_called_once_with(transaction=False)
+    assert mock_fast_broker.publish.await_args_list == [
+        (
+            ("msg-1",),
+            {"stream": "test-stream", "headers": {"x-trace": "abc"}, "pipeline": pipe},
+        ),
+        (("msg-2",), {"stream": "test-stream", "headers": None, "pipeline": pipe}),
+    ]
+    pipe.execute.assert_awaited_once()
+    assert result == [b"1-0", b"2-0"]
@@ -2,13 +2,17 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
 from collections import defaultdict
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from itertools import zip_longest
 from typing import TYPE_CHECKING
 
 from pydantic import BaseModel
 from qontract_utils.aws_api_typed.api import AWSApi, AWSStaticCredentials
 from qontract_utils.differ import diff_mappings
+from sretoolbox.utils import threaded
 
 from reconcile.gql_definitions.aws_cloudwatch_log_retention.aws_accounts import (
     AWSAccountCleanupOptionCloudWatchV1,
@@ -23,6 +27,7 @@ from reconcile.typed_queries.aws_cloudwatch_log_retention.aws_accounts import (
 )
 from reconcile.typed_queries.external_resources import get_settings
 from reconcile.utils import gql
+from reconcile.utils.constants import DEFAULT_THREAD_POOL_SIZE
 from reconcile.utils.datetime_util import utc_now
 from reconcile.utils.secret_reader import create_secret_reader
 from reconcile.utils.state import init_state
@@ -30,7 +35,7 @@ from reconcile.utils.state import init_state
 TAGS_KEY = "tags.json"
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Mapping
 
     from mypy_boto3_logs.type_defs import LogGroupTypeDef
     from qontract_utils.aws_api_typed.logs import AWSApiLogs
@@ -42,6 +47,8 @@ QONTRACT_INTEGRATION = "aws_cloudwatch_log_retention"
 MANAGED_BY_INTEGRATION_KEY = "managed_by_integration"
 MANAGED_TAG = {MANAGED_BY_INTEGRATION_KEY: QONTRACT_INTEGRATION}
 DEFAULT_RETENTION_IN_DAYS = 90
+# bounds the concurrent regions, and so the API usage, of a single account
+MAX_CONCURRENT_REGIONS_PER_ACCOUNT = 2
 
 
 class AWSCloudwatchCleanupOption(BaseModel):
@@ -200,45 +207,102 @@ def _find_desired_cleanup_option(
     return DEFAULT_AWS_CLOUDWATCH_CLEANUP_OPTION
 
 
-def _reconcile_log_groups(
-    dry_run: bool,
+@dataclass(frozen=True)
+class RegionTask:
+    account_name: str
+    credentials: AWSStaticCredentials
+    desired_cleanup_options: list[AWSCloudwatchCleanupOption]
+    desired_tags: dict[str, str]
+    last_tags: dict[str, str]
+    # shared by all regions of an account to limit its concurrent API usage
+    account_limiter: threading.BoundedSemaphore
+
+
+def build_region_tasks(
     aws_account: AWSAccountV1,
     last_tags: dict[str, str],
     default_tags: dict[str, str],
     automation_token: dict[str, str],
-) -> dict[str, str]:
+) -> list[RegionTask]:
     desired_tags = (
         default_tags | get_aws_account_tags(aws_account.organization) | MANAGED_TAG
     )
-    for (
-        region,
-        desired_cleanup_options,
-    ) in get_desired_cleanup_options_by_region(aws_account).items():
-        aws_credentials = AWSStaticCredentials(
-            access_key_id=automation_token["aws_access_key_id"],
-            secret_access_key=automation_token["aws_secret_access_key"],
-            region=region,
+    account_limiter = threading.BoundedSemaphore(MAX_CONCURRENT_REGIONS_PER_ACCOUNT)
+    return [
+        RegionTask(
+            account_name=aws_account.name,
+            credentials=AWSStaticCredentials(
+                access_key_id=automation_token["aws_access_key_id"],
+                secret_access_key=automation_token["aws_secret_access_key"],
+                region=region,
+            ),
+            desired_cleanup_options=desired_cleanup_options,
+            desired_tags=desired_tags,
+            last_tags=last_tags,
+            account_limiter=account_limiter,
         )
-        with AWSApi(aws_credentials) as aws_api:
-            aws_api_logs = aws_api.logs
-            try:
-                for log_group in aws_api_logs.get_log_groups():
-                    _reconcile_log_group(
-                        dry_run=dry_run,
-                        log_group=log_group,
-                        desired_cleanup_options=desired_cleanup_options,
-                        desired_tags=desired_tags,
-                        last_tags=last_tags,
-                        aws_api_logs=aws_api_logs,
-                    )
-            except aws_api_logs.client.exceptions.ClientError as e:
-                logging.error(
-                    "Error reconciling log groups for %s: %s",
-                    aws_account.name,
-                    e,
+        for region, desired_cleanup_options in get_desired_cleanup_options_by_region(
+            aws_account
+        ).items()
+    ]
+
+
+def _reconcile_region(task: RegionTask, dry_run: bool) -> bool:
+    """
+    Reconciles the log groups of an account region with a single session.
+    Returns False if the region could not be reconciled.
+    """
+    with task.account_limiter, AWSApi(task.credentials) as aws_api:
+        aws_api_logs = aws_api.logs
+        try:
+            for log_group in aws_api_logs.get_log_groups():
+                _reconcile_log_group(
+                    dry_run=dry_run,
+                    log_group=log_group,
+                    desired_cleanup_options=task.desired_cleanup_options,
+                    desired_tags=task.desired_tags,
+                    last_tags=task.last_tags,
+                    aws_api_logs=aws_api_logs,
                 )
-                return last_tags
-    return desired_tags
+        except aws_api_logs.client.exceptions.ClientError as e:
+            logging.error(
+                "Error reconciling log groups for %s in %s: %s",
+                task.account_name,
+                task.credentials.region,
+                e,
+            )
+            return False
+    return True
+
+
+def _reconcile_log_groups(
+    dry_run: bool,
+    tasks_by_account: Mapping[str, list[RegionTask]],
+    thread_pool_size: int,
+) -> dict[str, dict[str, str]]:
+    """
+    Reconciles all account regions concurrently and returns the tags applied
+    per account. Accounts with a failed region keep their last tags.
+    """
+    # interleave the accounts, so the regions of a single account don't
+    # occupy the thread pool while waiting for the account limiter
+    tasks = [
+        task
+        for region_tasks in zip_longest(*tasks_by_account.values())
+        for task in region_tasks
+        if task is not None
+    ]
+    results = threaded.run(_reconcile_region, tasks, thread_pool_size, dry_run=dry_run)
+    failed_accounts = {
+        task.account_name for task, ok in zip(tasks, results, strict=True) if not ok
+    }
+    return {
+        account_name: region_tasks[0].last_tags
+        if account_name in failed_accounts
+        else region_tasks[0].desired_tags
+        for account_name, region_tasks in tasks_by_account.items()
+        if region_tasks
+    }
 
 
 def get_active_aws_accounts(gql_api: GqlApi) -> list[AWSAccountV1]:
@@ -261,7 +325,7 @@ def get_default_tags(gql_api: GqlApi) -> dict[str, str]:
         return {}
 
 
-def run(dry_run: bool) -> None:
+def run(dry_run: bool, thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE) -> None:
     gql_api = gql.get_api()
     aws_accounts = get_active_aws_accounts(gql_api)
     vault_settings = get_app_interface_vault_settings(query_func=gql_api.query)
@@ -273,9 +337,8 @@ def run(dry_run: bool) -> None:
         secret_reader=secret_reader,
     ) as state:
         last_tags = state.get(TAGS_KEY, {})
-        desired_tags = {
-            aws_account.name: _reconcile_log_groups(
-                dry_run=dry_run,
+        tasks_by_account = {
+            aws_account.name: build_region_tasks(
                 aws_account=aws_account,
                 last_tags=last_tags.get(aws_account.name, {}),
                 default_tags=default_tags,
@@ -285,5 +348,10 @@ def run(dry_run: bool) -> None:
             )
             for aws_account in aws_accounts
         }
+        desired_tags = _reconcile_log_groups(
+            dry_run=dry_run,
+            tasks_by_account=tasks_by_account,
+            thread_pool_size=thread_pool_size,
+        )
         if not dry_run and desired_tags != last_tags:
             state.add(TAGS_KEY, desired_tags, force=True)
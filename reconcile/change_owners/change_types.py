@@ -6,6 +6,7 @@ from abc import (
 )
 from collections import defaultdict
 from collections.abc import (
+    Iterable,
     MutableMapping,
     Sequence,
 )
@@ -239,6 +240,8 @@ class PathExpression:
     def __init__(self, jsonpath_expression: str) -> None:
         self.jsonpath_expression = jsonpath_expression
         self.parsed_jsonpath = None
+        # rendered and parsed templates by context file path
+        self._parsed_jsonpath_for_context: dict[str, jsonpath_ng.JSONPath] = {}
         if "{{" in jsonpath_expression:
             env = jinja2.Environment()
             ast = env.parse(self.jsonpath_expression)
@@ -256,10 +259,11 @@ class PathExpression:
         if self.parsed_jsonpath:
             return self.parsed_jsonpath
 
-        expr = self.template.render({
-            self.CTX_FILE_PATH_VAR_NAME: ctx.context_file.path,
-        })
-        return parse_jsonpath(expr)
+        file_path = ctx.context_file.path
+        if file_path not in self._parsed_jsonpath_for_context:
+            expr = self.template.render({self.CTX_FILE_PATH_VAR_NAME: file_path})
+            self._parsed_jsonpath_for_context[file_path] = parse_jsonpath(expr)
+        return self._parsed_jsonpath_for_context[file_path]
 
     def __eq__(self, obj: object) -> bool:
         return (
@@ -694,6 +698,41 @@ class ChangeTypeProcessor:
         return self._heritage.union({self.name})
 
 
+class ChangeTypeProcessorIndex:
+    """
+    Finds the ChangeTypeProcessors that can react to a changed file without
+    asking every processor. A processor reacts to files of its context schema
+    and of the change schemas of its change detectors. Processors without a
+    context schema react to every file.
+    """
+
+    def __init__(self, processors: Iterable[ChangeTypeProcessor]) -> None:
+        self._processors = list(processors)
+        self._any_schema: list[int] = []
+        self._by_schema: dict[str | None, list[int]] = defaultdict(list)
+        for i, ctp in enumerate(self._processors):
+            if ctp.context_schema is None:
+                self._any_schema.append(i)
+                continue
+            schemas = {ctp.context_schema} | {
+                c.change_schema for c in ctp.change_detectors
+            }
+            for schema in schemas:
+                self._by_schema[schema].append(i)
+        self._lookup_cache: dict[str | None, list[ChangeTypeProcessor]] = {}
+
+    def for_file(self, file_ref: FileRef) -> list[ChangeTypeProcessor]:
+        """
+        Returns the processors that can react to a change of the file, in the
+        order they were indexed.
+        """
+        schema = file_ref.schema
+        if schema not in self._lookup_cache:
+            indexes = sorted({*self._any_schema, *self._by_schema.get(schema, [])})
+            self._lookup_cache[schema] = [self._processors[i] for i in indexes]
+        return self._lookup_cache[schema]
+
+
 def build_ownership_context(
     file_diff_resolver: FileDiffResolver,
     selector: jsonpath_ng.JSONPath,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import bisect
 import copy
 import itertools
 import logging
@@ -11,6 +12,7 @@ from dataclasses import (
 from typing import TYPE_CHECKING, Any
 
 import anymarkup
+import jsonpath_ng
 
 from reconcile.change_owners.bundle import (
     DATAFILE_PATH_FIELD_NAME,
@@ -20,6 +22,7 @@ from reconcile.change_owners.bundle import (
     QontractServerDiff,
 )
 from reconcile.change_owners.change_types import (
+    JSON_PATH_ROOT,
     ChangeTypeContext,
     ChangeTypePriority,
     ChangeTypeProcessor,
@@ -42,6 +45,47 @@ The path used to represent a metadata only change.
 """
 
 
+class DiffPathIndex:
+    """
+    Finds the diffs a change-type path can cover, either entirely or by
+    splitting them, without comparing the path to every diff of a file. The
+    matching follows `DiffCoverage.changed_path_covered_by_path` and
+    `DiffCoverage.path_under_changed_path`, which compare path strings by
+    prefix.
+    """
+
+    def __init__(self, diffs: Sequence[DiffCoverage]) -> None:
+        self._diffs = list(diffs)
+        self._position = {dc.diff.path_str(): i for i, dc in enumerate(self._diffs)}
+        self._sorted_paths = sorted(self._position)
+
+    def __bool__(self) -> bool:
+        return bool(self._diffs)
+
+    def related_to(self, path: jsonpath_ng.JSONPath) -> list[DiffCoverage]:
+        """
+        Returns the diffs located under the path and the diffs the path is
+        located under, in their original order.
+        """
+        path_str = str(path)
+        if path_str == JSON_PATH_ROOT or JSON_PATH_ROOT in self._position:
+            return self._diffs
+
+        positions = set()
+        # diffs under the path
+        i = bisect.bisect_left(self._sorted_paths, path_str)
+        while i < len(self._sorted_paths) and self._sorted_paths[i].startswith(
+            path_str
+        ):
+            positions.add(self._position[self._sorted_paths[i]])
+            i += 1
+        # diffs the path is under
+        for i in range(1, len(path_str)):
+            if (position := self._position.get(path_str[:i])) is not None:
+                positions.add(position)
+        return [self._diffs[i] for i in sorted(positions)]
+
+
 @dataclass
 class BundleFileChange:
     """
@@ -60,6 +104,12 @@ class BundleFileChange:
     new_backrefs: set[FileRef] = field(default_factory=set)
     metadata_only_change: bool = False
     _diff_coverage: dict[str, DiffCoverage] = field(init=False, default_factory=dict)
+    _diff_indexes: dict[frozenset[DiffType], DiffPathIndex] = field(
+        init=False, default_factory=dict, compare=False
+    )
+    _allowed_paths: dict[
+        tuple[int, str, str], tuple[ChangeTypeProcessor, list[jsonpath_ng.JSONPath]]
+    ] = field(init=False, default_factory=dict, compare=False)
 
     def __post_init__(self) -> None:
         self._diff_coverage = {d.path_str(): DiffCoverage(d, []) for d in self.diffs}
@@ -131,34 +181,50 @@ class BundleFileChange:
         # observe the new state for added fields or list items or entire object sutrees
         covered_diffs.update(
             self._cover_changes_for_diffs(
-                self._filter_diffs([DiffType.ADDED, DiffType.CHANGED]),
-                self.new,
+                self._diff_index(DiffType.ADDED, DiffType.CHANGED),
+                "new",
                 change_type_context,
             )
         )
         # look at the old state for removed fields or list items or object subtrees
         covered_diffs.update(
             self._cover_changes_for_diffs(
-                self._filter_diffs([DiffType.REMOVED]), self.old, change_type_context
+                self._diff_index(DiffType.REMOVED), "old", change_type_context
             )
         )
 
         return covered_diffs
 
+    def _allowed_changed_paths(
+        self, side: str, change_type_context: ChangeTypeContext
+    ) -> list[jsonpath_ng.JSONPath]:
+        """
+        The allowed paths of a change-type only depend on the file content and
+        the context file, so they are shared by all contexts (e.g. roles) that
+        bind the same change-type to the same context file.
+        """
+        ctp = change_type_context.change_type_processor
+        key = (id(ctp), side, change_type_context.context_file.path)
+        cached = self._allowed_paths.get(key)
+        if cached is None or cached[0] is not ctp:
+            paths = ctp.allowed_changed_paths(
+                self.fileref,
+                self.new if side == "new" else self.old,
+                change_type_context,
+            )
+            cached = self._allowed_paths[key] = (ctp, paths)
+        return cached[1]
+
     def _cover_changes_for_diffs(
         self,
-        diffs: list[DiffCoverage],
-        file_content: Any,
+        diffs: DiffPathIndex,
+        side: str,
         change_type_context: ChangeTypeContext,
     ) -> dict[str, Diff]:
         covered_diffs = {}
         if diffs:
-            for (
-                allowed_path
-            ) in change_type_context.change_type_processor.allowed_changed_paths(
-                self.fileref, file_content, change_type_context
-            ):
-                for dc in diffs:
+            for allowed_path in self._allowed_changed_paths(side, change_type_context):
+                for dc in diffs.related_to(allowed_path):
                     if dc.changed_path_covered_by_path(allowed_path):
                         covered_diffs[dc.diff.path_str()] = dc.diff
                         dc.coverage.append(change_type_context)
@@ -182,6 +248,12 @@ class BundleFileChange:
             d for d in self._diff_coverage.values() if d.diff.diff_type in diff_types
         ]
 
+    def _diff_index(self, *diff_types: DiffType) -> DiffPathIndex:
+        key = frozenset(diff_types)
+        if key not in self._diff_indexes:
+            self._diff_indexes[key] = DiffPathIndex(self._filter_diffs(list(key)))
+        return self._diff_indexes[key]
+
     def all_changes_covered(self) -> bool:
         return all(d.is_covered() for d in self.diff_coverage)
 
@@ -88,7 +88,7 @@ IDENTIFIER_FIELD_NAME = "__identifier"
 REF_FIELD_NAME = "$ref"
 
 
-def _extract_identifier_from_object(obj: Any) -> str | None:
+def extract_identifier_from_object(obj: Any) -> str | None:
     if isinstance(obj, dict):
         if IDENTIFIER_FIELD_NAME in obj:
             return obj.get(IDENTIFIER_FIELD_NAME)
@@ -122,8 +122,8 @@ def compare_object_ctx_identifier(
     of matching properties and values. this situation is signaled back to
     deepdiff by raising the CannotCompare exception.
     """
-    x_id = _extract_identifier_from_object(x)
-    y_id = _extract_identifier_from_object(y)
+    x_id = extract_identifier_from_object(x)
+    y_id = extract_identifier_from_object(y)
     if x_id and y_id:
         # if both have an identifier, they are the same if the identifiers are the same
         return x_id == y_id
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
 from reconcile.change_owners.change_types import (
     ChangeTypeContext,
     ChangeTypeProcessor,
+    ChangeTypeProcessorIndex,
     FileChange,
 )
 from reconcile.gql_definitions.change_owners.queries.change_types import (
@@ -40,8 +42,13 @@ def change_type_contexts_for_implicit_ownership(
     processors_with_implicit_ownership = [
         ctp for ctp in change_type_processors if ctp.implicit_ownership
     ]
+    change_type_index = ChangeTypeProcessorIndex(processors_with_implicit_ownership)
+    bundle_changes_by_processor: dict[str, list[BundleFileChange]] = defaultdict(list)
+    for bc in bundle_changes:
+        for ctp in change_type_index.for_file(bc.fileref):
+            bundle_changes_by_processor[ctp.name].append(bc)
     for ctp in processors_with_implicit_ownership:
-        for bc in bundle_changes:
+        for bc in bundle_changes_by_processor[ctp.name]:
             for ownership in ctp.find_context_file_refs(
                 change=FileChange(
                     file_ref=bc.fileref,
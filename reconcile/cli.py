@@ -733,11 +733,12 @@ def aws_saml_idp(
 
 
 @integration.command(short_help="Configures the teams and members in a GitHub org.")
+@threaded()
 @click.pass_context
-def github(ctx: click.Context) -> None:
+def github(ctx: click.Context, thread_pool_size: int) -> None:
     import reconcile.github_org
 
-    run_integration(reconcile.github_org, ctx)
+    run_integration(reconcile.github_org, ctx, thread_pool_size)
 
 
 @integration.command(short_help="Configures owners in a GitHub org via qontract-api.")
@@ -1273,13 +1274,15 @@ def aws_ami_cleanup(ctx: click.Context, thread_pool_size: int) -> None:
 
 
 @integration.command(short_help="Set up retention period and tags for Cloudwatch logs.")
+@threaded()
 @click.pass_context
-def aws_cloudwatch_log_retention(ctx: click.Context) -> None:
+def aws_cloudwatch_log_retention(ctx: click.Context, thread_pool_size: int) -> None:
     import reconcile.aws_cloudwatch_log_retention.integration
 
     run_integration(
         reconcile.aws_cloudwatch_log_retention.integration,
         ctx,
+        thread_pool_size,
     )
 
 
@@ -1868,12 +1871,13 @@ def quay_membership(ctx: click.Context) -> None:
 
 
 @integration.command(short_help="Mirrors external images into GCP Artifact Registry.")
+@threaded()
 @click.pass_context
 @binary(["skopeo"])
-def gcp_image_mirror(ctx: click.Context) -> None:
+def gcp_image_mirror(ctx: click.Context, thread_pool_size: int) -> None:
     import reconcile.container_registry_mirror.gcp
 
-    run_integration(reconcile.container_registry_mirror.gcp, ctx)
+    run_integration(reconcile.container_registry_mirror.gcp, ctx, thread_pool_size)
 
 
 @integration.command(short_help="Mirrors external images into Quay.")
@@ -1910,6 +1914,7 @@ def gcp_image_mirror(ctx: click.Context) -> None:
     help="excludes this repository  to mirror. It can be specified multiple times.",
     multiple=True,
 )
+@threaded()
 @click.pass_context
 @binary(["skopeo"])
 def quay_mirror(
@@ -1919,6 +1924,7 @@ def quay_mirror(
     compare_tags_interval: int,
     repository_url: Iterable[str] | None,
     exclude_repository_url: Iterable[str] | None,
+    thread_pool_size: int,
 ) -> None:
     import reconcile.container_registry_mirror.quay
 
@@ -1930,6 +1936,7 @@ def quay_mirror(
         compare_tags_interval,
         repository_url,
         exclude_repository_url,
+        thread_pool_size,
     )
 
 
@@ -3519,11 +3526,12 @@ def parse_image_tag_from_ref(
 
 
 @integration.command(short_help="Allow vault to replicate secrets to other instances.")
+@threaded()
 @click.pass_context
-def vault_replication(ctx: click.Context) -> None:
+def vault_replication(ctx: click.Context, thread_pool_size: int) -> None:
     import reconcile.vault_replication
 
-    run_integration(reconcile.vault_replication, ctx)
+    run_integration(reconcile.vault_replication, ctx, thread_pool_size)
 
 
 @integration.command(short_help="Manages Qontract Reconcile integrations.")
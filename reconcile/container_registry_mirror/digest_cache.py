@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+
+_LOG = logging.getLogger(__name__)
+
+
+class DigestCache:
+    """Remembers the upstream digest that was last mirrored for each
+    source tag and destination.
+
+    A deep sync has to fetch both manifests of every tag to detect
+    drift on mutable tags. When the upstream digest of a tag equals the
+    digest that was mirrored before, the destination manifest does not
+    need to be fetched and compared at all. The cache is stored as a
+    JSON file next to the deep sync control file, so it survives pod
+    restarts when that directory is a persistent volume."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._digests: dict[str, str] | None = None
+        self._seen: set[str] = set()
+
+    @classmethod
+    def from_dir(cls, cache_dir: str | None, cache_file_name: str) -> DigestCache:
+        """Construct a cache with the file path resolved from a directory
+        and filename, defaulting to the temporary directory."""
+        if cache_dir:
+            if not os.path.isdir(cache_dir):
+                raise FileNotFoundError(
+                    f"'{cache_dir}' does not exist or it is not a directory"
+                )
+            return cls(os.path.join(cache_dir, cache_file_name))
+        return cls(os.path.join(tempfile.gettempdir(), cache_file_name))
+
+    @staticmethod
+    def key(source: str, destination: str) -> str:
+        return f"{source} -> {destination}"
+
+    def get(self, source: str, destination: str) -> str | None:
+        """Return the digest last mirrored from source to destination."""
+        key = self.key(source, destination)
+        with self._lock:
+            self._seen.add(key)
+            return self._load().get(key)
+
+    def set(self, source: str, destination: str, digest: str) -> None:
+        key = self.key(source, destination)
+        with self._lock:
+            self._seen.add(key)
+            self._load()[key] = digest
+
+    def save(self, prune: bool = False) -> None:
+        """Write the cache to disk. With prune, entries that were not
+        looked up or set since the cache was loaded are dropped, e.g.
+        tags removed upstream or mirrors removed from app-interface."""
+        with self._lock:
+            digests = self._load()
+            if prune:
+                digests = {k: v for k, v in digests.items() if k in self._seen}
+            try:
+                fd, tmp = tempfile.mkstemp(
+                    dir=os.path.dirname(self.path), prefix=".tmp-"
+                )
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(digests, f)
+                os.replace(tmp, self.path)
+            except OSError as e:
+                _LOG.warning("unable to write digest cache %s: %s", self.path, e)
+
+    def _load(self) -> dict[str, str]:
+        if self._digests is None:
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self._digests = dict(json.load(f))
+            except FileNotFoundError, ValueError, TypeError:
+                # First run, volume wipe, or corrupt file.
+                self._digests = {}
+        return self._digests
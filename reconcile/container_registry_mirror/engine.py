@@ -1,22 +1,47 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
+from dataclasses import dataclass
+from itertools import zip_longest
 from typing import TYPE_CHECKING, Any
 
+import requests
 from sretoolbox.container.image import (
     ImageComparisonError,
     ImageContainsError,
 )
 from sretoolbox.container.skopeo import SkopeoCmdError
+from sretoolbox.utils import threaded
 
+from reconcile.container_registry_mirror.mirror_spec import MirrorSpec
+from reconcile.utils import metrics
 from reconcile.utils.quay_mirror import sync_tag
 
 if TYPE_CHECKING:
     from reconcile.container_registry_mirror.deep_sync_timer import DeepSyncTimer
-    from reconcile.container_registry_mirror.mirror_spec import MirrorSpec
+    from reconcile.container_registry_mirror.digest_cache import DigestCache
 
 _LOG = logging.getLogger(__name__)
 
+# Concurrent comparisons and copies per destination registry, so a
+# large sync does not trip the registry's rate limits.
+MAX_CONCURRENCY_PER_REGISTRY = 4
+
+
+@dataclass(frozen=True)
+class TagTask:
+    """A source tag of a spec that passed the tag filters, queued for
+    comparison and copy."""
+
+    spec: MirrorSpec
+    tag: str
+    upstream: Any
+    downstream: Any
+    exists: bool
+    registry_limiter: threading.BoundedSemaphore
+
 
 class MirrorEngine:
     """Runs the tag sync algorithm against a list of MirrorSpecs.
@@ -32,6 +57,9 @@ class MirrorEngine:
         image_class: type | None = None,
         response_cache: dict | None = None,
         session: Any | None = None,
+        digest_cache: DigestCache | None = None,
+        thread_pool_size: int = 1,
+        max_concurrency_per_registry: int = MAX_CONCURRENCY_PER_REGISTRY,
     ) -> None:
         self.skopeo = skopeo
         self.dry_run = dry_run
@@ -52,6 +80,13 @@ class MirrorEngine:
         self._image_class = image_class
         self._response_cache = response_cache
         self._session = session
+        # Optional, remembers the upstream digests mirrored by previous
+        # deep syncs so unchanged tags are not compared again.
+        self._digest_cache = digest_cache
+        self._thread_pool_size = thread_pool_size
+        self._max_concurrency_per_registry = max_concurrency_per_registry
+        self._registry_limiters: dict[str, threading.BoundedSemaphore] = {}
+        self._registry_limiters_lock = threading.Lock()
 
     def _build_images(self, spec: MirrorSpec) -> tuple[Any, Any]:
         """Build source and destination Image objects for a spec.
@@ -98,107 +133,29 @@ class MirrorEngine:
 
     def sync(self, specs: list[MirrorSpec]) -> None:
         """Process all mirror specs: enumerate tags, filter, compare,
-        and copy. Individual copy failures are collected and raised as
+        and copy. Tags of all specs are put on a single work queue that
+        is processed by thread_pool_size workers, with at most
+        max_concurrency_per_registry tags in flight per destination
+        registry. Individual copy failures are collected and raised as
         an ExceptionGroup at the end so that one broken mirror does not
         prevent the rest from syncing."""
-        errors: list[Exception] = []
-
-        for spec in specs:
-            source_image, dest_image = self._build_images(spec)
-
-            for tag in source_image:
-                if not sync_tag(
-                    tags=spec.tag_include,
-                    tags_exclude=spec.tag_exclude,
-                    candidate=tag,
-                ):
-                    continue
-
-                upstream = source_image[tag]
-                downstream = dest_image[tag]
-
-                # Fast path: tag does not exist at destination, so it
-                # must be copied regardless of deep sync mode.
-                if tag not in dest_image:
-                    _LOG.debug(
-                        "Image %s does not exist. Syncing from %s",
-                        downstream,
-                        upstream,
-                    )
-                    try:
-                        self.skopeo.copy(
-                            src_image=str(upstream),
-                            src_creds=spec.source_creds,
-                            dst_image=str(downstream),
-                            dest_creds=spec.destination_creds,
-                        )
-                    except SkopeoCmdError as details:
-                        _LOG.error("skopeo command error: '%s'", details)
-                        errors.append(details)
-                    continue
-
-                # Slow path: tag exists at destination. Only compare
-                # manifests when deep sync is active, to detect drift
-                # on mutable tags.
-                if not self.is_deep_sync:
-                    _LOG.debug(
-                        "Fast mode: skipping comparison of %s and %s",
-                        downstream,
-                        upstream,
-                    )
-                    continue
-
-                should_copy = False
-                try:
-                    if downstream == upstream:
-                        _LOG.debug(
-                            "Image %s and mirror %s are in sync",
-                            downstream,
-                            upstream,
-                        )
-                        continue
-                    # Multi-arch case: destination may be a single-arch
-                    # component of the upstream multi-arch manifest list.
-                    if downstream.is_part_of(upstream):
-                        _LOG.debug(
-                            "Image %s is part of multi-arch image %s",
-                            downstream,
-                            upstream,
-                        )
-                        continue
-                    should_copy = True
-                except ImageComparisonError as details:
-                    # Manifest could not be fetched (network/auth/404).
-                    # Skip this tag rather than failing the entire run.
-                    _LOG.error(
-                        "Error comparing %s and %s: %s",
-                        downstream,
-                        upstream,
-                        details,
-                    )
-                    continue
-                except ImageContainsError:
-                    # Manifest types are incompatible for is_part_of
-                    # (e.g., both single-arch). The images are
-                    # structurally different, so copy.
-                    should_copy = True
-
-                if should_copy:
-                    _LOG.debug(
-                        "Image %s and mirror %s are out of sync",
-                        downstream,
-                        upstream,
-                    )
-                    try:
-                        self.skopeo.copy(
-                            src_image=str(upstream),
-                            src_creds=spec.source_creds,
-                            dst_image=str(downstream),
-                            dest_creds=spec.destination_creds,
-                        )
-                    except SkopeoCmdError as details:
-                        _LOG.error("skopeo command error: '%s'", details)
-                        errors.append(details)
+        tasks_per_spec = threaded.run(self._build_tasks, specs, self._thread_pool_size)
+
+        # Interleave the tasks of all specs and registries, so workers
+        # are not all waiting for the semaphore of one registry.
+        tasks = [
+            task
+            for tasks in zip_longest(*tasks_per_spec)
+            for task in tasks
+            if task is not None
+        ]
+        results = threaded.run(self._sync_tag, tasks, self._thread_pool_size)
+        errors = [error for error in results if error is not None]
+
+        # Only a deep sync looks up every existing tag, so only then
+        # entries of tags that were not seen are stale.
+        if self._digest_cache and not self.dry_run:
+            self._digest_cache.save(prune=self.is_deep_sync)
 
         # Raise before recording the timestamp so that a failed deep
         # sync is not marked as successful. Otherwise, failed images
@@ -210,3 +167,156 @@ class MirrorEngine:
         # completed without errors and not in dry-run mode.
         if self._deep_sync_timer and self.is_deep_sync and not self.dry_run:
             self._deep_sync_timer.record()
+
+    def _build_tasks(self, spec: MirrorSpec) -> list[TagTask]:
+        """List the source tags of a spec that match its filters. The
+        destination tags are listed here as well, so workers never
+        race on the first tag listing of the shared Image objects."""
+        source_image, dest_image = self._build_images(spec)
+        registry = spec.destination_url.split("/", maxsplit=1)[0]
+        with self._registry_limiters_lock:
+            limiter = self._registry_limiters.setdefault(
+                registry,
+                threading.BoundedSemaphore(self._max_concurrency_per_registry),
+            )
+
+        return [
+            TagTask(
+                spec=spec,
+                tag=tag,
+                upstream=source_image[tag],
+                downstream=dest_image[tag],
+                exists=tag in dest_image,
+                registry_limiter=limiter,
+            )
+            for tag in source_image
+            if sync_tag(
+                tags=spec.tag_include,
+                tags_exclude=spec.tag_exclude,
+                candidate=tag,
+            )
+        ]
+
+    def _sync_tag(self, task: TagTask) -> SkopeoCmdError | None:
+        """Sync a single tag and account for it in the per-spec
+        metrics. Returns the copy error, if any."""
+        spec = task.spec
+        start = time.monotonic()
+        with task.registry_limiter:
+            result, error = self._compare_and_copy(task)
+        metrics.container_registry_mirror_tags.labels(
+            source=spec.source_url,
+            destination=spec.destination_url,
+            result=result,
+        ).inc()
+        metrics.container_registry_mirror_sync_seconds.labels(
+            source=spec.source_url,
+            destination=spec.destination_url,
+        ).inc(time.monotonic() - start)
+        return error
+
+    def _compare_and_copy(self, task: TagTask) -> tuple[str, SkopeoCmdError | None]:
+        upstream = task.upstream
+        downstream = task.downstream
+
+        # Fast path: tag does not exist at destination, so it
+        # must be copied regardless of deep sync mode.
+        if not task.exists:
+            _LOG.debug(
+                "Image %s does not exist. Syncing from %s",
+                downstream,
+                upstream,
+            )
+            return self._copy(task, digest=None)
+
+        # Slow path: tag exists at destination. Only compare
+        # manifests when deep sync is active, to detect drift
+        # on mutable tags.
+        if not self.is_deep_sync:
+            _LOG.debug(
+                "Fast mode: skipping comparison of %s and %s",
+                downstream,
+                upstream,
+            )
+            return "skipped", None
+
+        # The upstream digest is a single manifest request (a HEAD
+        # request for registries that support cached responses). When
+        # it is the digest that was mirrored before, the destination
+        # manifest does not need to be fetched and compared.
+        digest = None
+        if self._digest_cache:
+            try:
+                digest = upstream.digest
+            except requests.RequestException as details:
+                _LOG.error("Error fetching digest of %s: %s", upstream, details)
+                return "compare_error", None
+            if self._digest_cache.get(str(upstream), str(downstream)) == digest:
+                _LOG.debug(
+                    "Image %s and mirror %s are in sync (cached digest)",
+                    downstream,
+                    upstream,
+                )
+                return "cached", None
+
+        try:
+            if downstream == upstream:
+                _LOG.debug(
+                    "Image %s and mirror %s are in sync",
+                    downstream,
+                    upstream,
+                )
+                self._remember_digest(task, digest)
+                return "in_sync", None
+            # Multi-arch case: destination may be a single-arch
+            # component of the upstream multi-arch manifest list.
+            if downstream.is_part_of(upstream):
+                _LOG.debug(
+                    "Image %s is part of multi-arch image %s",
+                    downstream,
+                    upstream,
+                )
+                self._remember_digest(task, digest)
+                return "in_sync", None
+        except ImageComparisonError as details:
+            # Manifest could not be fetched (network/auth/404).
+            # Skip this tag rather than failing the entire run.
+            _LOG.error(
+                "Error comparing %s and %s: %s",
+                downstream,
+                upstream,
+                details,
+            )
+            return "compare_error", None
+        except ImageContainsError:
+            # Manifest types are incompatible for is_part_of
+            # (e.g., both single-arch). The images are
+            # structurally different, so copy.
+            pass
+
+        _LOG.debug(
+            "Image %s and mirror %s are out of sync",
+            downstream,
+            upstream,
+        )
+        return self._copy(task, digest=digest)
+
+    def _copy(
+        self, task: TagTask, digest: str | None
+    ) -> tuple[str, SkopeoCmdError | None]:
+        try:
+            self.skopeo.copy(
+                src_image=str(task.upstream),
+                src_creds=task.spec.source_creds,
+                dst_image=str(task.downstream),
+                dest_creds=task.spec.destination_creds,
+            )
+        except SkopeoCmdError as details:
+            _LOG.error("skopeo command error: '%s'", details)
+            return "copy_failed", details
+        self._remember_digest(task, digest)
+        return "copied", None
+
+    def _remember_digest(self, task: TagTask, digest: str | None) -> None:
+        if self._digest_cache and digest is not None and not self.dry_run:
+            self._digest_cache.set(str(task.upstream), str(task.downstream), digest)
@@ -9,9 +9,11 @@ import reconcile.gql_definitions.gcp.gcp_projects as gql_gcp_projects
 from reconcile import queries
 from reconcile.container_registry_mirror import register
 from reconcile.container_registry_mirror.deep_sync_timer import DeepSyncTimer
+from reconcile.container_registry_mirror.digest_cache import DigestCache
 from reconcile.container_registry_mirror.engine import MirrorEngine
 from reconcile.container_registry_mirror.mirror_spec import MirrorSpec
 from reconcile.utils import gql
+from reconcile.utils.constants import DEFAULT_THREAD_POOL_SIZE
 from reconcile.utils.instrumented_wrappers import InstrumentedSkopeo as Skopeo
 from reconcile.utils.secret_reader import SecretReader
 
@@ -193,9 +195,10 @@ QONTRACT_INTEGRATION = "gcp-image-mirror"
 # to detect mutable tag drift at the GCP fallback registry.
 CONTROL_FILE_NAME = "qontract-reconcile-gcp-image-mirror.timestamp"
 DEEP_SYNC_INTERVAL = 28800  # 8 hours
+DIGEST_CACHE_FILE_NAME = "qontract-reconcile-gcp-image-mirror.digests.json"
 
 
-def run(dry_run: bool) -> None:
+def run(dry_run: bool, thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE) -> None:
     """Module-level entry point called by the integration framework."""
     impl = GcpMirror()
     timer = DeepSyncTimer.from_dir(
@@ -203,10 +206,16 @@ def run(dry_run: bool) -> None:
         control_file_name=CONTROL_FILE_NAME,
         interval=DEEP_SYNC_INTERVAL,
     )
+    digest_cache = DigestCache.from_dir(
+        cache_dir=None,
+        cache_file_name=DIGEST_CACHE_FILE_NAME,
+    )
     specs = impl.discover_mirrors()
     engine = MirrorEngine(
         skopeo=Skopeo(dry_run),
         dry_run=dry_run,
         deep_sync_timer=timer,
+        digest_cache=digest_cache,
+        thread_pool_size=thread_pool_size,
     )
     engine.sync(specs)
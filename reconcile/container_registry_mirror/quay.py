@@ -10,9 +10,11 @@ from sretoolbox.container import Image
 from reconcile import queries
 from reconcile.container_registry_mirror import register
 from reconcile.container_registry_mirror.deep_sync_timer import DeepSyncTimer
+from reconcile.container_registry_mirror.digest_cache import DigestCache
 from reconcile.container_registry_mirror.engine import MirrorEngine
 from reconcile.container_registry_mirror.mirror_spec import MirrorSpec
 from reconcile.utils import gql
+from reconcile.utils.constants import DEFAULT_THREAD_POOL_SIZE
 from reconcile.utils.instrumented_wrappers import InstrumentedImage
 from reconcile.utils.instrumented_wrappers import InstrumentedSkopeo as Skopeo
 from reconcile.utils.secret_reader import SecretReader
@@ -213,6 +215,7 @@ register("quay-mirror", QuayMirror)
 # and early-exit cache keys.
 QONTRACT_INTEGRATION = "quay-mirror"
 CONTROL_FILE_NAME = "qontract-reconcile-quay-mirror.timestamp"
+DIGEST_CACHE_FILE_NAME = "qontract-reconcile-quay-mirror.digests.json"
 
 
 def run(
@@ -222,6 +225,7 @@ def run(
     compare_tags_interval: int,
     repository_urls: Iterable[str] | None,
     exclude_repository_urls: Iterable[str] | None,
+    thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE,
 ) -> None:
     """Module-level entry point called by the integration framework.
     Parameters map directly to CLI options in reconcile/cli.py."""
@@ -235,6 +239,12 @@ def run(
         interval=compare_tags_interval,
         compare_tags_override=compare_tags,
     )
+    # Kept next to the control file, so that the digests of the last
+    # deep sync survive pod restarts as well.
+    digest_cache = DigestCache.from_dir(
+        cache_dir=control_file_dir,
+        cache_file_name=DIGEST_CACHE_FILE_NAME,
+    )
     specs = impl.discover_mirrors()
     # InstrumentedImage counts manifest fetches via the
     # registry_reachouts Prometheus counter. The shared cache and
@@ -250,6 +260,8 @@ def run(
             image_class=InstrumentedImage,
             response_cache=response_cache,
             session=session,
+            digest_cache=digest_cache,
+            thread_pool_size=thread_pool_size,
         )
         engine.sync(specs)
     finally:
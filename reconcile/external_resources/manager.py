@@ -40,7 +40,7 @@ from reconcile.external_resources.state import (
 from reconcile.utils.datetime_util import utc_now
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Mapping
 
     from reconcile.external_resources.reconciler import (
         ExternalResourcesReconciler,
@@ -272,8 +272,8 @@ class ExternalResourcesManager:
     def _get_deleted_objects_reconciliations(self) -> set[Reconciliation]:
         to_reconcile: set[Reconciliation] = set()
         deleted_keys = (k for k, v in self.er_inventory.items() if v.marked_to_delete)
-        for key in deleted_keys:
-            state = self.state_mgr.get_external_resource_state(key)
+        states = self.state_mgr.get_external_resource_states(deleted_keys)
+        for key, state in states.items():
             if state.resource_status == ResourceStatus.NOT_EXISTS:
                 logging.debug("Resource has already been removed. key: %s", key)
                 continue
@@ -350,11 +350,23 @@ class ExternalResourcesManager:
 
         return reconciliation_status
 
+    def _prefetch_states(
+        self, reconciliations: Iterable[Reconciliation]
+    ) -> dict[ExternalResourceKey, ExternalResourceState]:
+        """Fetch the states of all reconciliations and their linked resources
+        in as few DynamoDB requests as possible."""
+        keys: set[ExternalResourceKey] = set()
+        for r in reconciliations:
+            keys.add(r.key)
+            keys.update(r.linked_resources or ())
+        return self.state_mgr.get_external_resource_states(keys)
+
     def _update_resource_state(
         self,
         r: Reconciliation,
         state: ExternalResourceState,
         reconciliation_status: ReconciliationStatus,
+        states: Mapping[ExternalResourceKey, ExternalResourceState] | None = None,
     ) -> None:
         if not state.reconciliation_needs_state_update(reconciliation_status):
             logging.debug("Reconciliation does not need a state update.")
@@ -362,16 +374,27 @@ class ExternalResourcesManager:
 
         if reconciliation_status.resource_status == ResourceStatus.DELETED:
             self.state_mgr.del_external_resource_state(r.key)
+            if states is not None:
+                states.pop(r.key, None)
         else:
             state.update_resource_status(reconciliation_status)
             self.state_mgr.set_external_resource_state(state)
 
             if r.linked_resources:
-                for lr in r.linked_resources:
-                    lrs = self.state_mgr.get_external_resource_state(lr)
-                    if not lrs.resource_status.is_in_progress:
-                        lrs.resource_status = ResourceStatus.RECONCILIATION_REQUESTED
-                        self.state_mgr.set_external_resource_state(lrs)
+                if states is None:
+                    states = {}
+                if missing := [lr for lr in r.linked_resources if lr not in states]:
+                    states.update(self.state_mgr.get_external_resource_states(missing))
+                linked_states = {lr: states[lr] for lr in r.linked_resources}
+                requested = [
+                    lrs
+                    for lrs in linked_states.values()
+                    if not lrs.resource_status.is_in_progress
+                ]
+                for lrs in requested:
+                    lrs.resource_status = ResourceStatus.RECONCILIATION_REQUESTED
+                if requested:
+                    self.state_mgr.set_external_resource_states(requested)
 
     def _set_resource_reconciliation_in_progress(
         self, r: Reconciliation, state: ExternalResourceState
@@ -430,10 +453,14 @@ class ExternalResourcesManager:
         desired_r = self._get_desired_objects_reconciliations()
         deleted_r = self._get_deleted_objects_reconciliations()
         to_sync_keys: set[ExternalResourceKey] = set()
-        for r in desired_r.union(deleted_r):
-            state = self.state_mgr.get_external_resource_state(r.key)
+        reconciliations = desired_r.union(deleted_r)
+        # states are fetched once and updated in place, so a linked resource
+        # marked for reconciliation is seen by its own reconciliation later on
+        states = self._prefetch_states(reconciliations)
+        for r in reconciliations:
+            state = states[r.key]
             reconciliation_status = self._get_reconciliation_status(r, state)
-            self._update_resource_state(r, state, reconciliation_status)
+            self._update_resource_state(r, state, reconciliation_status, states)
 
             if reconciliation_status.resource_status.needs_secret_sync:
                 to_sync_keys.add(r.key)
@@ -458,13 +485,14 @@ class ExternalResourcesManager:
         self.dry_runs_validator.validate()
         desired_r = self._get_desired_objects_reconciliations()
         deleted_r = self._get_deleted_objects_reconciliations()
+        reconciliations = desired_r.union(deleted_r)
+        states = self.state_mgr.get_external_resource_states(
+            r.key for r in reconciliations
+        )
         triggered = {
             r
-            for r in desired_r.union(deleted_r)
-            if self._reconciliation_needs_dry_run_run(
-                r,
-                self.state_mgr.get_external_resource_state(key=r.key),
-            )
+            for r in reconciliations
+            if self._reconciliation_needs_dry_run_run(r, states[r.key])
         }
 
         threaded.run(
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import logging
+import time
 from datetime import datetime
 from enum import StrEnum
 from hashlib import sha256
@@ -22,17 +23,27 @@ from reconcile.utils.datetime_util import to_utc_microseconds_iso_format, utc_no
 from reconcile.utils.json import json_dumps
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterable, Mapping
 
     from qontract_utils.aws_api_typed.api import AWSApi
 
 DATE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 
+# DynamoDB limits for BatchGetItem and BatchWriteItem requests
+BATCH_GET_MAX_KEYS = 100
+BATCH_WRITE_MAX_ITEMS = 25
+BATCH_MAX_ATTEMPTS = 8
+BATCH_RETRY_BASE_DELAY_SECONDS = 0.05
+
 
 class StateNotFoundError(Exception):
     pass
 
 
+class StateBatchError(Exception):
+    pass
+
+
 class ReconcileStatus(StrEnum):
     SUCCESS = "SUCCESS"
     ERROR = "ERROR"
@@ -284,6 +295,10 @@ class ExternalResourcesStateDynamoDB:
         )
         if "Item" in data:
             return self.adapter.deserialize(data["Item"])
+        return self._not_exists_state(key)
+
+    @staticmethod
+    def _not_exists_state(key: ExternalResourceKey) -> ExternalResourceState:
         return ExternalResourceState(
             key=key,
             ts=utc_now(),
@@ -292,6 +307,46 @@ class ExternalResourcesStateDynamoDB:
             reconciliation_errors=0,
         )
 
+    def get_external_resource_states(
+        self,
+        keys: Iterable[ExternalResourceKey],
+    ) -> dict[ExternalResourceKey, ExternalResourceState]:
+        """Fetch the states of many keys with BatchGetItem. Keys without
+        state are returned with the NOT_EXISTS status, like
+        get_external_resource_state does."""
+        keys_by_path = {key.state_path: key for key in keys}
+        paths = list(keys_by_path)
+        states: dict[ExternalResourceKey, ExternalResourceState] = {}
+        for i in range(0, len(paths), BATCH_GET_MAX_KEYS):
+            request: dict[str, Any] = {
+                self._table: {
+                    "Keys": [
+                        {self.adapter.ER_KEY_HASH: {"S": path}}
+                        for path in paths[i : i + BATCH_GET_MAX_KEYS]
+                    ],
+                    "ConsistentRead": True,
+                }
+            }
+            for attempt in range(BATCH_MAX_ATTEMPTS):
+                data = self.aws_api.dynamodb.boto3_client.batch_get_item(
+                    RequestItems=request
+                )
+                for item in data.get("Responses", {}).get(self._table, []):
+                    path = item[self.adapter.ER_KEY_HASH]["S"]
+                    states[keys_by_path[path]] = self.adapter.deserialize(item)
+                request = data.get("UnprocessedKeys") or {}
+                if not request:
+                    break
+                self._backoff(attempt)
+            else:
+                raise StateBatchError(
+                    f"BatchGetItem on {self._table} left unprocessed keys"
+                )
+        for key in keys_by_path.values():
+            if key not in states:
+                states[key] = self._not_exists_state(key)
+        return states
+
     def set_external_resource_state(
         self,
         state: ExternalResourceState,
@@ -300,6 +355,40 @@ class ExternalResourcesStateDynamoDB:
             TableName=self._table, Item=self.adapter.serialize(state)
         )
 
+    def set_external_resource_states(
+        self,
+        states: Iterable[ExternalResourceState],
+    ) -> None:
+        """Store many states with BatchWriteItem."""
+        # a batch must not contain the same key twice, the last state wins
+        items = [
+            self.adapter.serialize(state)
+            for state in {state.key: state for state in states}.values()
+        ]
+        for i in range(0, len(items), BATCH_WRITE_MAX_ITEMS):
+            request: dict[str, Any] = {
+                self._table: [
+                    {"PutRequest": {"Item": item}}
+                    for item in items[i : i + BATCH_WRITE_MAX_ITEMS]
+                ]
+            }
+            for attempt in range(BATCH_MAX_ATTEMPTS):
+                data = self.aws_api.dynamodb.boto3_client.batch_write_item(
+                    RequestItems=request
+                )
+                request = data.get("UnprocessedItems") or {}
+                if not request:
+                    break
+                self._backoff(attempt)
+            else:
+                raise StateBatchError(
+                    f"BatchWriteItem on {self._table} left unprocessed items"
+                )
+
+    @staticmethod
+    def _backoff(attempt: int) -> None:
+        time.sleep(BATCH_RETRY_BASE_DELAY_SECONDS * 2**attempt)
+
     def del_external_resource_state(self, key: ExternalResourceKey) -> None:
         self.aws_api.dynamodb.boto3_client.delete_item(
             TableName=self._table,
@@ -4,9 +4,13 @@ import logging
 import os
 from typing import TYPE_CHECKING, Any
 
+import requests
 from github import Github
 from github.GithubObject import NotSet  # type: ignore
-from sretoolbox.utils import retry
+from sretoolbox.utils import (
+    retry,
+    threaded,
+)
 
 from reconcile import (
     openshift_users,
@@ -20,7 +24,11 @@ from reconcile.utils.aggregated_list import (
     AggregatedDiffRunner,
     AggregatedList,
 )
-from reconcile.utils.raw_github_api import RawGithubApi
+from reconcile.utils.constants import DEFAULT_THREAD_POOL_SIZE
+from reconcile.utils.raw_github_api import (
+    GithubGraphQLError,
+    RawGithubApi,
+)
 from reconcile.utils.secret_reader import SecretReader
 
 if TYPE_CHECKING:
@@ -159,7 +167,7 @@ class GHApiStore:
             managed_teams = org_config.get("managed_teams", None)
             self._orgs[org_name] = (
                 Github(token, base_url=GH_BASE_URL),
-                RawGithubApi(token),
+                RawGithubApi(token, org=org_name),
                 managed_teams,
             )
 
@@ -176,7 +184,41 @@ class GHApiStore:
         return self._orgs[org_name][2]
 
 
-def fetch_current_state(gh_api_store: GHApiStore) -> AggregatedList:
+def get_team_members(
+    gh_api_store: GHApiStore,
+    org_name: str,
+    managed_teams: Iterable[str],
+    thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE,
+) -> dict[str, list[str]]:
+    """
+    Returns the members and pending invitations of the managed teams of an
+    org. They are fetched in bulk via GraphQL. If that fails, the teams are
+    fetched via REST concurrently.
+    """
+    raw_gh_api = gh_api_store.raw_github_api(org_name)
+    try:
+        teams = raw_gh_api.team_members(org_name)
+    except (requests.RequestException, GithubGraphQLError) as e:
+        logging.warning(
+            f"unable to fetch teams of {org_name} via GraphQL, falling back to REST: {e}"
+        )
+    else:
+        return {name: m for name, m in teams.items() if name in managed_teams}
+
+    g = gh_api_store.github(org_name)
+    org, teams_iter = get_org_and_teams(g, org_name)
+    managed = [team for team in teams_iter if team.name in managed_teams]
+
+    def get_members_and_invitations(team: Team) -> list[str]:
+        return get_members(team) + raw_gh_api.team_invitations(org.id, team.id)
+
+    members = threaded.run(get_members_and_invitations, managed, thread_pool_size)
+    return {team.name: m for team, m in zip(managed, members, strict=True)}
+
+
+def fetch_current_state(
+    gh_api_store: GHApiStore, thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE
+) -> AggregatedList:
     state = AggregatedList()
 
     for org_name in gh_api_store.orgs():
@@ -184,22 +226,16 @@ def fetch_current_state(gh_api_store: GHApiStore) -> AggregatedList:
         if not managed_teams:
             continue
 
-        g = gh_api_store.github(org_name)
-        raw_gh_api = gh_api_store.raw_github_api(org_name)
-        org, teams = get_org_and_teams(g, org_name)
-
+        team_members = get_team_members(
+            gh_api_store, org_name, managed_teams, thread_pool_size
+        )
         all_team_members = []
-        for team in teams:
-            if team.name not in managed_teams:
-                continue
-
-            members = get_members(team)
-            members.extend(raw_gh_api.team_invitations(org.id, team.id))
-            members = [m.lower() for m in members]
+        for team_name, team_logins in team_members.items():
+            members = [m.lower() for m in team_logins]
             all_team_members.extend(members)
 
             state.add(
-                {"service": "github-org-team", "org": org_name, "team": team.name},
+                {"service": "github-org-team", "org": org_name, "team": team_name},
                 members,
             )
         all_team_members = list(set(all_team_members))
@@ -409,11 +445,11 @@ def service_is(service: str) -> Callable:
     return lambda params: params.get("service") == service
 
 
-def run(dry_run: bool) -> None:
+def run(dry_run: bool, thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE) -> None:
     config = get_config()
     gh_api_store = GHApiStore(config)
 
-    current_state = fetch_current_state(gh_api_store)
+    current_state = fetch_current_state(gh_api_store, thread_pool_size)
     desired_state = fetch_desired_state()
 
     # Ensure current_state and desired_state match orgs
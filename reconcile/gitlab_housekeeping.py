@@ -62,7 +62,6 @@ if TYPE_CHECKING:
     )
 
     from gitlab.v4.objects import (
-        ProjectCommit,
         ProjectIssue,
         ProjectMergeRequest,
         ProjectMergeRequestPipeline,
@@ -488,16 +487,8 @@ def is_good_to_merge(labels: Iterable[str]) -> bool:
 
 
 def is_rebased(mr: ProjectMergeRequest, gl: GitLabApi) -> bool:
-    target_branch = mr.target_branch
-    head = cast(
-        "list[ProjectCommit]",
-        gl.project.commits.list(
-            ref_name=target_branch,
-            per_page=1,
-            page=1,
-        ),
-    )[0].id
-    result = cast("dict", gl.project.repository_compare(mr.sha, head))
+    # compare resolves the branch to its head, no need to look it up first
+    result = cast("dict", gl.project.repository_compare(mr.sha, mr.target_branch))
     return len(result["commits"]) == 0
 
 
@@ -834,9 +825,8 @@ def _form_omm_group(
     Only MRs that are eligible (have tenant labels), don't overlap with
     already-merged labels, and have an active pipeline are considered.
 
-    Note: this makes one get_merge_request_pipelines API call per candidate,
-    proportional to queue length. Acceptable because it runs at most once per
-    reconcile loop (after the first merge).
+    The pipelines of the candidates are served from the merge requests
+    snapshot loaded at the start of the run.
     """
     candidates: list[ProjectMergeRequest] = []
     group_labels = set(merged_labels)
@@ -1297,6 +1287,8 @@ def merge_merge_requests(
 ) -> None:
     if reload_toggle.reload:
         project_merge_requests = gl.get_merge_requests(state=MRState.OPENED)
+        # pipelines we insisted on have progressed since the snapshot
+        gl.load_merge_requests_snapshot()
     merge_requests = preprocess_merge_requests(
         dry_run=dry_run,
         gl=gl,
@@ -1645,6 +1637,7 @@ def run(dry_run: bool, wait_for_pipeline: bool) -> None:
                 "issue",
             )
             opened_merge_requests = gl.get_merge_requests(state=MRState.OPENED)
+            gl.load_merge_requests_snapshot()
             handle_stale_items(
                 dry_run,
                 gl,
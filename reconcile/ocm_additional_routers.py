@@ -30,10 +30,11 @@ def fetch_current_state(
     )
 
     current_state = []
-    for cluster in clusters:
-        cluster_name = cluster["name"]
-        ocm = ocm_map.get(cluster_name)
-        routers = ocm.get_additional_routers(cluster_name)
+    cluster_routers = ocm_map.get_for_clusters(
+        [c["name"] for c in clusters],
+        lambda ocm, cluster: ocm.get_additional_routers(cluster),
+    )
+    for cluster_name, routers in cluster_routers.items():
         for router in routers:
             router["cluster"] = cluster_name
             current_state.append(router)
@@ -26,6 +26,7 @@ def get_allowed_labels_for_cluster(cluster: Mapping[str, Any]) -> set[str]:
 
 def fetch_current_state(
     clusters: Iterable[Mapping[str, Any]],
+    thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE,
 ) -> tuple[OCMMap, list[dict[str, Any]]]:
     settings = queries.get_app_interface_settings()
     ocm_map = OCMMap(
@@ -33,11 +34,15 @@ def fetch_current_state(
     )
 
     current_state = []
+    cluster_labels = ocm_map.get_for_clusters(
+        [c["name"] for c in clusters],
+        lambda ocm, cluster: ocm.get_external_configuration_labels(cluster),
+        thread_pool_size,
+    )
     for cluster in clusters:
         cluster_name = cluster["name"]
         allowed_labels = get_allowed_labels_for_cluster(cluster)
-        ocm = ocm_map.get(cluster_name)
-        labels = ocm.get_external_configuration_labels(cluster_name)
+        labels = cluster_labels[cluster_name]
         for key, value in labels.items():
             if key not in allowed_labels:
                 continue
@@ -135,7 +140,7 @@ def run(
         )
         sys.exit(ExitCodes.SUCCESS)
 
-    ocm_map, current_state = fetch_current_state(clusters)
+    ocm_map, current_state = fetch_current_state(clusters, thread_pool_size)
     desired_state = fetch_desired_state(clusters)
     diffs, err = calculate_diff(current_state, desired_state)
     act(dry_run, diffs, ocm_map)
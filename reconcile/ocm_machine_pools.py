@@ -9,6 +9,7 @@ from typing import Any, Self
 
 from pydantic import BaseModel, Field, SerializeAsAny, model_validator
 from qontract_utils.differ import diff_mappings
+from sretoolbox.utils import threaded
 
 from reconcile import queries
 from reconcile.gql_definitions.common.clusters import (
@@ -17,6 +18,7 @@ from reconcile.gql_definitions.common.clusters import (
     ClusterV1,
 )
 from reconcile.typed_queries.clusters import get_clusters
+from reconcile.utils.constants import DEFAULT_THREAD_POOL_SIZE
 from reconcile.utils.disabled_integrations import integration_is_enabled
 from reconcile.utils.json import json_dumps
 from reconcile.utils.ocm import (
@@ -356,11 +358,15 @@ class DesiredMachinePool(BaseModel):
 def fetch_current_state(
     ocm_map: OCMMap,
     clusters: Iterable[ClusterV1],
+    thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE,
 ) -> Mapping[str, list[AbstractPool]]:
-    return {
-        c.name: fetch_current_state_for_cluster(c, ocm_map.get(c.name))
-        for c in clusters
-    }
+    clusters = list(clusters)
+    results = threaded.run(
+        lambda c: fetch_current_state_for_cluster(c, ocm_map.get(c.name)),
+        clusters,
+        thread_pool_size,
+    )
+    return {c.name: pools for c, pools in zip(clusters, results, strict=True)}
 
 
 def _classify_cluster_type(cluster: ClusterV1) -> ClusterType:
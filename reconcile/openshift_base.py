@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import itertools
 import logging
-from collections import Counter
+import os
+from collections import Counter, defaultdict
 from collections.abc import (
     Iterable,
+    Iterator,
     Mapping,
     MutableMapping,
     Sequence,
@@ -20,6 +22,7 @@ from typing import (
 )
 
 import yaml
+from kubernetes.client.exceptions import ApiException
 from qontract_utils.differ import DiffPair, diff_mappings
 from sretoolbox.utils import (
     retry,
@@ -67,6 +70,11 @@ RECYCLE_POD_ANNOTATIONS = [
     "kubectl.kubernetes.io/restartedAt",
     "openshift.openshift.io/restartedAt",
 ]
+# number of managed namespaces on a cluster above which the current state
+# of a kind is fetched with a single all-namespaces LIST
+CLUSTER_WIDE_FETCH_NAMESPACE_THRESHOLD = int(
+    os.environ.get("CLUSTER_WIDE_FETCH_NAMESPACE_THRESHOLD", "50")
+)
 
 
 class ValidationError(Exception):
@@ -97,6 +105,21 @@ class DesiredStateSpec(BaseStateSpec):
     privileged: bool = False
 
 
+@dataclass
+class ClusterCurrentStateSpec:
+    """Fetch the current state of a kind for many namespaces of a cluster
+    with a single all-namespaces LIST.
+
+    `specs` holds the per-namespace specs this spec replaces. They define
+    which namespaces and resource names are kept and are used as fallback
+    if the cluster-wide LIST is not permitted."""
+
+    oc: OCClient = field(compare=False, repr=False)
+    cluster: str
+    kind: str
+    specs: list[CurrentStateSpec] = field(repr=False)
+
+
 StateSpec = CurrentStateSpec | DesiredStateSpec
 
 
@@ -339,7 +362,7 @@ def populate_current_state(
         logging.warning(msg)
         return
     try:
-        for item in spec.oc.get_items(
+        for item in spec.oc.iter_items(
             spec.kind,
             namespace=spec.namespace,
             resource_names=spec.resource_names,
@@ -360,6 +383,127 @@ def populate_current_state(
         logging.error(f"[{spec.cluster}/{spec.namespace}] {e!s}")
 
 
+def _is_cluster_wide_fetchable(spec: CurrentStateSpec) -> bool:
+    if spec.namespace == "cluster":
+        return False
+    try:
+        return spec.oc.is_kind_namespaced(spec.kind)
+    except KindNotFoundError, AmbiguousResourceTypeError, RuntimeError:
+        # unknown kinds are handled (and reported) by populate_current_state
+        return False
+
+
+def merge_current_state_specs(
+    state_specs: Iterable[StateSpec],
+    namespace_threshold: int = CLUSTER_WIDE_FETCH_NAMESPACE_THRESHOLD,
+) -> list[StateSpec | ClusterCurrentStateSpec]:
+    """Replace the per-namespace current state specs of a cluster with one
+    ClusterCurrentStateSpec per kind, if more than `namespace_threshold`
+    namespaces of that cluster are managed. All other specs are returned
+    unchanged."""
+    specs: list[StateSpec | ClusterCurrentStateSpec] = []
+    candidates: dict[tuple[str, OCClient], list[CurrentStateSpec]] = defaultdict(list)
+    for spec in state_specs:
+        if isinstance(spec, CurrentStateSpec) and _is_cluster_wide_fetchable(spec):
+            candidates[spec.cluster, spec.oc].append(spec)
+        else:
+            specs.append(spec)
+
+    for (cluster, oc), cluster_specs in candidates.items():
+        if len({s.namespace for s in cluster_specs}) <= namespace_threshold:
+            specs.extend(cluster_specs)
+            continue
+        specs_by_kind: dict[str, list[CurrentStateSpec]] = defaultdict(list)
+        for spec in cluster_specs:
+            specs_by_kind[spec.kind].append(spec)
+        specs.extend(
+            ClusterCurrentStateSpec(oc=oc, cluster=cluster, kind=kind, specs=ks)
+            for kind, ks in specs_by_kind.items()
+        )
+
+    return specs
+
+
+def iter_cluster_current_state(
+    spec: ClusterCurrentStateSpec,
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """List all items of the spec's kind across all namespaces and yield
+    (namespace, item) for the items a per-namespace fetch would have
+    returned, i.e. only managed namespaces and, if set, managed names."""
+    resource_names: dict[str, set[str] | None] = {
+        s.namespace: set(s.resource_names) if s.resource_names else None
+        for s in spec.specs
+    }
+    for item in spec.oc.iter_items(spec.kind, all_namespaces=True):
+        metadata = item.get("metadata") or {}
+        namespace = metadata.get("namespace")
+        if namespace not in resource_names:
+            continue
+        names = resource_names[namespace]
+        if names is not None and metadata.get("name") not in names:
+            continue
+        yield namespace, item
+
+
+def populate_cluster_current_state(
+    spec: ClusterCurrentStateSpec,
+    ri: ResourceInventory,
+    integration: str,
+    integration_version: str,
+    caller: str | None = None,
+) -> None:
+    fetched = False
+    try:
+        for namespace, item in iter_cluster_current_state(spec):
+            fetched = True
+            openshift_resource = OR(item, integration, integration_version)
+            if caller and openshift_resource.caller != caller:
+                continue
+            ri.add_current(
+                spec.cluster,
+                namespace,
+                spec.kind,
+                openshift_resource.name,
+                openshift_resource,
+            )
+    # ForbiddenError and a 410 Gone from an expired continue token are
+    # ApiExceptions of the dynamic client, not StatusCodeErrors
+    except (StatusCodeError, ApiException) as e:
+        if fetched:
+            ri.register_error(cluster=spec.cluster)
+            logging.error(f"[{spec.cluster}] {e!s}")
+            return
+        logging.info(
+            f"[{spec.cluster}] cluster-wide LIST of {spec.kind} failed, "
+            f"falling back to per-namespace fetch: {e!s}"
+        )
+        for namespace_spec in spec.specs:
+            populate_current_state(
+                namespace_spec, ri, integration, integration_version, caller=caller
+            )
+
+
+def _populate_state(
+    spec: StateSpec | ClusterCurrentStateSpec,
+    ri: ResourceInventory,
+    integration: str,
+    integration_version: str,
+    caller: str | None = None,
+) -> None:
+    if isinstance(spec, ClusterCurrentStateSpec):
+        populate_cluster_current_state(
+            spec, ri, integration, integration_version, caller=caller
+        )
+    else:
+        populate_current_state(
+            spec,  # type: ignore[arg-type]
+            ri,
+            integration,
+            integration_version,
+            caller=caller,
+        )
+
+
 def fetch_current_state(
     namespaces: Iterable[Mapping] | None = None,
     clusters: Iterable[Mapping] | None = None,
@@ -373,6 +517,7 @@ def fetch_current_state(
     caller: str | None = None,
     init_projects: bool = False,
     cluster_scope_resource_validation: bool = False,
+    cluster_wide_fetch_threshold: int | None = CLUSTER_WIDE_FETCH_NAMESPACE_THRESHOLD,
 ) -> tuple[ResourceInventory, OC_Map]:
     ri = ResourceInventory()
     settings = queries.get_app_interface_settings()
@@ -396,9 +541,14 @@ def fetch_current_state(
         cluster_admin=cluster_admin,
         cluster_scope_resource_validation=cluster_scope_resource_validation,
     )
+    specs_to_fetch: Sequence[StateSpec | ClusterCurrentStateSpec] = state_specs
+    if cluster_wide_fetch_threshold is not None:
+        specs_to_fetch = merge_current_state_specs(
+            state_specs, namespace_threshold=cluster_wide_fetch_threshold
+        )
     threaded.run(
-        populate_current_state,
-        state_specs,
+        _populate_state,
+        specs_to_fetch,
         thread_pool_size,
         ri=ri,
         integration=integration,
@@ -425,6 +575,7 @@ def apply(
     wait_for_namespace: bool,
     recycle_pods: bool = True,
     privileged: bool = False,
+    already_applied: bool = False,
 ) -> None:
     logging.info([
         "apply",
@@ -440,7 +591,7 @@ def apply(
     except OCLogMsg as ex:
         logging.log(level=ex.log_level, msg=ex.message)
         return
-    if not dry_run:
+    if not dry_run and not already_applied:
         annotated = resource.annotate()
         # skip if namespace does not exist (as it will soon)
         # do not skip if this is a cluster scoped integration
@@ -652,6 +803,9 @@ class ApplyOptions:
     all_callers: Sequence[str] | None
     privileged: bool | None
     enable_deletion: bool | None
+    # when set, apply_action queues (resource_type, resource, privileged)
+    # here instead of applying, see apply_pending
+    pending_applies: list[tuple[str, OR, bool]] | None = None
 
 
 def should_apply(
@@ -686,8 +840,8 @@ def should_apply(
         return False
 
     if logging.getLogger().isEnabledFor(logging.DEBUG):
-        logging.debug("CURRENT: " + OR.serialize(OR.canonicalize(current.body)))
-        logging.debug("DESIRED: " + OR.serialize(OR.canonicalize(desired.body)))
+        logging.debug("CURRENT: " + current.canonical_json())
+        logging.debug("DESIRED: " + desired.canonical_json())
 
     return True
 
@@ -864,6 +1018,7 @@ def patch_desired_resource_for_recycle_annotations(
         desired.body["spec"]["template"]["metadata"]["annotations"] = (
             patch_annotations | desired_annotations
         )
+        desired.invalidate_cache()
     return desired
 
 
@@ -964,7 +1119,15 @@ def apply_action(
     resource_type: str,
     resource: OR,
     options: ApplyOptions,
+    already_applied: bool = False,
 ) -> None:
+    if options.pending_applies is not None:
+        options.pending_applies.append((
+            resource_type,
+            resource,
+            bool(options.privileged),
+        ))
+        return
     try:
         apply(
             dry_run=options.dry_run,
@@ -976,6 +1139,7 @@ def apply_action(
             wait_for_namespace=options.wait_for_namespace,
             recycle_pods=options.recycle_pods,
             privileged=bool(options.privileged),
+            already_applied=already_applied,
         )
 
     except StatusCodeError as e:
@@ -989,6 +1153,52 @@ def apply_action(
         logging.error(msg)
 
 
+def is_batch_apply_enabled(oc_map: ClusterMap, cluster: str) -> bool:
+    oc = oc_map.get(cluster)
+    return not isinstance(oc, OCLogMsg) and getattr(oc, "batch_apply", False) is True
+
+
+def apply_pending(
+    oc_map: ClusterMap,
+    ri: ResourceInventory,
+    cluster: str,
+    namespace: str,
+    pending: Iterable[tuple[str, OR, bool]],
+    options: ApplyOptions,
+) -> None:
+    """Apply the queued resources of a namespace with one `oc apply` per
+    client. Resources the batch did not apply go through apply_action one
+    by one, so errors are handled exactly like without batching."""
+    pending_by_privileged: dict[bool, list[tuple[str, OR]]] = defaultdict(list)
+    for resource_type, resource, privileged in pending:
+        pending_by_privileged[privileged].append((resource_type, resource))
+
+    for privileged, resources in pending_by_privileged.items():
+        applied: set[str] = set()
+        oc = oc_map.get(cluster, privileged)
+        if not isinstance(oc, OCLogMsg) and (
+            namespace == "cluster" or oc.project_exists(namespace)
+        ):
+            try:
+                applied = oc.apply_batch(
+                    namespace, [resource.annotate() for _, resource in resources]
+                )
+            except StatusCodeError as e:
+                logging.debug(f"[{cluster}/{namespace}] batch apply failed: {e}")
+        options.privileged = privileged
+        for resource_type, resource in resources:
+            apply_action(
+                oc_map=oc_map,
+                ri=ri,
+                cluster=cluster,
+                namespace=namespace,
+                resource_type=resource_type,
+                resource=resource,
+                options=options,
+                already_applied=resource.name in applied,
+            )
+
+
 def delete_action(
     oc_map: ClusterMap,
     ri: ResourceInventory,
@@ -1076,6 +1286,9 @@ def _realize_resource_data_3way_diff(
         data["current"], data["desired"], equal=three_way_diff_using_hash
     )
 
+    if not options.dry_run and is_batch_apply_enabled(oc_map, cluster):
+        options.pending_applies = []
+
     # identical resources need to be checked
     # for take_overs and saas file deprecations
     actions.extend(
@@ -1117,6 +1330,17 @@ def _realize_resource_data_3way_diff(
         )
     )
 
+    if options.pending_applies is not None:
+        pending, options.pending_applies = options.pending_applies, None
+        apply_pending(
+            oc_map=oc_map,
+            ri=ri,
+            cluster=cluster,
+            namespace=namespace,
+            pending=pending,
+            options=options,
+        )
+
     actions.extend(
         handle_deleted_resources(
             oc_map=oc_map,
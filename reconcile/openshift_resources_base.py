@@ -27,6 +27,7 @@ from unittest.mock import DEFAULT, patch
 
 import anymarkup
 from deepdiff import DeepHash
+from kubernetes.client.exceptions import ApiException
 from sretoolbox.utils import (
     threaded,
 )
@@ -494,6 +495,7 @@ def fetch_provider_route(
 
         msg = f"Route secret '{tls_path}' key '{k}' not in valid keys {valid_keys}"
         _locked_info_log(msg)
+    openshift_resource.invalidate_cache()
 
     host = openshift_resource.body["spec"].get("host")
     certificate = openshift_resource.body["spec"]["tls"].get("certificate")
@@ -664,36 +666,74 @@ def fetch_current_state(
     if not oc.is_kind_supported(kind):
         logging.warning(f"[{cluster}] cluster has no API resource {kind}.")
         return
-    for item in oc.get_items(kind, namespace=namespace, resource_names=resource_names):
-        openshift_resource = OR(
-            item, QONTRACT_INTEGRATION, QONTRACT_INTEGRATION_VERSION
+    for item in oc.iter_items(kind, namespace=namespace, resource_names=resource_names):
+        _add_current_item(ri, cluster, namespace, kind, item)
+
+
+def fetch_cluster_current_state(
+    spec: ob.ClusterCurrentStateSpec,
+    ri: ResourceInventory,
+    cache: Jinja2TemplateCache,
+) -> None:
+    _locked_debug_log(
+        f"Fetching {spec.kind} from {len(spec.specs)} namespaces of {spec.cluster}"
+    )
+    fetched = False
+    try:
+        for namespace, item in ob.iter_cluster_current_state(spec):
+            fetched = True
+            _add_current_item(ri, spec.cluster, namespace, spec.kind, item)
+    # ForbiddenError and a 410 Gone from an expired continue token are
+    # ApiExceptions of the dynamic client, not StatusCodeErrors
+    except (StatusCodeError, ApiException) as e:
+        if fetched:
+            # the items fetched so far are incomplete, there is nothing to
+            # fall back to without fetching them twice
+            ri.register_error(cluster=spec.cluster)
+            logging.error(f"[{spec.cluster}] {e!s}")
+            return
+        logging.info(
+            f"[{spec.cluster}] cluster-wide LIST of {spec.kind} failed, "
+            f"falling back to per-namespace fetch: {e!s}"
         )
-        labels = openshift_resource.body.get("metadata", {}).get("labels", {})
-        # Skip resources managed by the ArgoCD Operator (not ArgoCD Application CRs).
-        # This is determined by the presence of the label:
-        #   app.kubernetes.io/part-of=argocd
-        #
-        # Details:
-        # - The ArgoCD Operator sets this label on resources it manages directly.
-        # - ArgoCD Application CRs do NOT set this label.
-        # - See:
-        #     https://argo-cd.readthedocs.io/en/latest/user-guide/resource_tracking/
-        #     https://kubernetes.io/docs/concepts/overview/working-with-objects/common-labels/
-        #     https://github.com/argoproj-labs/argocd-operator/blob/master/common/keys.go#L98
-        if labels.get("app.kubernetes.io/part-of") == "argocd":
-            _locked_debug_log(
-                f"Skipping {openshift_resource.kind} {openshift_resource.name} in current state "
-                f"for cluster '{cluster}' namespace '{namespace}' because it is managed by the ArgoCD Operator "
-                "(not by an ArgoCD Application CR)."
-            )
-            continue
-        ri.add_current(
-            cluster,
-            namespace,
-            kind,
-            openshift_resource.name,
-            openshift_resource,
+        for s in spec.specs:
+            fetch_states(s, ri, cache=cache)
+
+
+def _add_current_item(
+    ri: ResourceInventory,
+    cluster: str,
+    namespace: str,
+    kind: str,
+    item: Mapping[str, Any],
+) -> None:
+    openshift_resource = OR(item, QONTRACT_INTEGRATION, QONTRACT_INTEGRATION_VERSION)
+    labels = openshift_resource.body.get("metadata", {}).get("labels", {})
+    # Skip resources managed by the ArgoCD Operator (not ArgoCD Application CRs).
+    # This is determined by the presence of the label:
+    #   app.kubernetes.io/part-of=argocd
+    #
+    # Details:
+    # - The ArgoCD Operator sets this label on resources it manages directly.
+    # - ArgoCD Application CRs do NOT set this label.
+    # - See:
+    #     https://argo-cd.readthedocs.io/en/latest/user-guide/resource_tracking/
+    #     https://kubernetes.io/docs/concepts/overview/working-with-objects/common-labels/
+    #     https://github.com/argoproj-labs/argocd-operator/blob/master/common/keys.go#L98
+    if labels.get("app.kubernetes.io/part-of") == "argocd":
+        _locked_debug_log(
+            f"Skipping {openshift_resource.kind} {openshift_resource.name} in current state "
+            f"for cluster '{cluster}' namespace '{namespace}' because it is managed by the ArgoCD Operator "
+            "(not by an ArgoCD Application CR)."
         )
+        return
+    ri.add_current(
+        cluster,
+        namespace,
+        kind,
+        openshift_resource.name,
+        openshift_resource,
+    )
 
 
 def fetch_desired_state(
@@ -756,12 +796,14 @@ def fetch_desired_state(
 
 
 def fetch_states(
-    spec: ob.StateSpec,
+    spec: ob.StateSpec | ob.ClusterCurrentStateSpec,
     ri: ResourceInventory,
     cache: Jinja2TemplateCache,
     settings: Mapping[str, Any] | None = None,
 ) -> None:
     try:
+        if isinstance(spec, ob.ClusterCurrentStateSpec):
+            fetch_cluster_current_state(spec, ri, cache=cache)
         if isinstance(spec, ob.CurrentStateSpec):
             fetch_current_state(
                 spec.oc,
@@ -817,7 +859,7 @@ def fetch_data(
     )
     threaded.run(
         fetch_states,
-        state_specs,
+        ob.merge_current_state_specs(state_specs),
         thread_pool_size,
         ri=ri,
         settings=settings,
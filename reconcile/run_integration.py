@@ -9,10 +9,13 @@ import os
 import shlex
 import sys
 import time
+from enum import StrEnum
 from importlib import metadata
 from typing import TYPE_CHECKING
+from urllib.parse import urlparse
 
 import click
+import requests
 from prometheus_client import (
     push_to_gateway,
     start_http_server,
@@ -20,6 +23,8 @@ from prometheus_client import (
 from prometheus_client.exposition import basic_auth_handler
 
 from reconcile.status import ExitCodes
+from reconcile.utils.config import init_from_toml
+from reconcile.utils.gql import get_git_commit_info, get_sha
 from reconcile.utils.metrics import (
     execution_counter,
     pushgateway_registry,
@@ -27,6 +32,8 @@ from reconcile.utils.metrics import (
     pushgateway_run_time,
     run_status,
     run_time,
+    run_trigger_counter,
+    run_trigger_latency,
 )
 from reconcile.utils.runtime.environment import (
     LOG_DATEFMT,
@@ -35,6 +42,7 @@ from reconcile.utils.runtime.environment import (
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from urllib.parse import ParseResult
 
 SHARDS = int(os.environ.get("SHARDS", "1"))
 SHARD_ID = int(os.environ.get("SHARD_ID", "0"))
@@ -58,6 +66,7 @@ LOG_FILE = os.environ.get("LOG_FILE")
 LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
 SLEEP_DURATION_SECS = int(os.environ.get("SLEEP_DURATION_SECS", "600"))
 SLEEP_ON_ERROR = int(os.environ.get("SLEEP_ON_ERROR", "10"))
+SHA_POLL_INTERVAL_SECS = int(os.environ.get("SHA_POLL_INTERVAL_SECS", "0"))
 
 PUSHGATEWAY_ENABLED = bool(os.environ.get("PUSHGATEWAY_ENABLED"))
 
@@ -194,6 +203,88 @@ def _push_gateway_basic_auth_handler(
     return basic_auth_handler(url, method, timeout, headers, data, username, password)
 
 
+class RunTrigger(StrEnum):
+    STARTUP = "startup"
+    SHA_CHANGE = "sha_change"
+    PERIODIC = "periodic"
+    ERROR_RETRY = "error_retry"
+
+
+class ShaWatcher:
+    """
+    Polls the cheap /sha256 endpoint of the GraphQL server to start a run
+    as soon as a new bundle is published.
+    """
+
+    def __init__(
+        self, server: ParseResult, token: str | None, poll_interval: float
+    ) -> None:
+        self.server = server
+        self.token = token
+        self.poll_interval = poll_interval
+        self.last_sha: str | None = None
+        self.changed_at: float | None = None
+
+    @classmethod
+    def from_config(cls, configfile: str, poll_interval: float) -> ShaWatcher:
+        config = init_from_toml(configfile)
+        return cls(
+            urlparse(config["graphql"]["server"]),
+            config["graphql"].get("token"),
+            poll_interval,
+        )
+
+    def current_sha(self) -> str | None:
+        try:
+            return get_sha(self.server, self.token)
+        except requests.exceptions.RequestException as e:
+            LOG.warning(f"Unable to fetch bundle sha: {e}")
+            return None
+
+    def commit_time(self, sha: str) -> float | None:
+        try:
+            timestamp = get_git_commit_info(sha, self.server, self.token).get(
+                "timestamp"
+            )
+        except requests.exceptions.RequestException as e:
+            LOG.warning(f"Unable to fetch commit info of bundle sha {sha}: {e}")
+            return None
+        return float(timestamp) if timestamp else None
+
+    def start_run(self) -> float | None:
+        """
+        Remember the sha the upcoming run is based on. Returns the seconds
+        passed since the sha change that triggered this run.
+        """
+        if not self.last_sha:
+            # the first run, later runs are based on the sha seen by wait()
+            self.last_sha = self.current_sha()
+        latency = None
+        if self.changed_at is not None:
+            latency = max(0.0, time.time() - self.changed_at)
+            self.changed_at = None
+        return latency
+
+    def wait(self, timeout: float) -> RunTrigger:
+        """
+        Block until the bundle sha changes or timeout seconds have passed.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            sha = self.current_sha()
+            if sha and self.last_sha and sha != self.last_sha:
+                # the sha changed at commit time, or latest at this poll
+                self.changed_at = self.commit_time(sha) or time.time()
+                self.last_sha = sha
+                return RunTrigger.SHA_CHANGE
+            if sha and not self.last_sha:
+                self.last_sha = sha
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return RunTrigger.PERIODIC
+            time.sleep(min(self.poll_interval, remaining))
+
+
 def main() -> None:
     """
     This entry point script expects certain env variables
@@ -223,6 +314,10 @@ def main() -> None:
       amount of seconds to sleep between successful integration runs
     * SLEEP_ON_ERROR (default 10)
       amount of seconds to sleep before another integration run is started
+    * SHA_POLL_INTERVAL_SECS (default 0, disabled)
+      if set, poll the bundle sha every SHA_POLL_INTERVAL_SECS seconds while
+      sleeping and start a new run as soon as it changes. SLEEP_DURATION_SECS
+      then is the maximum time between two runs.
     * PUSHGATEWAY_ENABLED (defaults to false)
       send metrics to a Prometheus Pushgateway after the run. In expects
       "PUSHGATEWAY_USERNAME", "PUSHGATEWAY_PASSWORD" and "PUSHGATEWAY_URL" to be defined.
@@ -242,17 +337,33 @@ def main() -> None:
     start_http_server(int(PROMETHEUS_PORT))
 
     command = build_entry_point_func(COMMAND_NAME)
+    sha_watcher = (
+        ShaWatcher.from_config(CONFIG, SHA_POLL_INTERVAL_SECS)
+        if SHA_POLL_INTERVAL_SECS > 0 and not RUN_ONCE
+        else None
+    )
+    trigger = RunTrigger.STARTUP
     while True:
         args = build_entry_point_args(
             command, CONFIG, DRY_RUN, INTEGRATION_NAME, INTEGRATION_EXTRA_ARGS
         )
         sleep = SLEEP_DURATION_SECS
+        if sha_watcher and (latency := sha_watcher.start_run()) is not None:
+            run_trigger_latency.labels(
+                integration=INTEGRATION_NAME, shards=SHARDS, shard_id=SHARD_ID_LABEL
+            ).observe(latency)
         start_time = time.monotonic()
         # Running the integration via Click, so we don't have to replicate
         # the CLI logic here
         execution_counter.labels(
             integration=INTEGRATION_NAME, shards=SHARDS, shard_id=SHARD_ID_LABEL
         ).inc()
+        run_trigger_counter.labels(
+            integration=INTEGRATION_NAME,
+            shards=SHARDS,
+            shard_id=SHARD_ID_LABEL,
+            trigger=trigger,
+        ).inc()
         try:
             with command.make_context(info_name=COMMAND_NAME, args=args) as ctx:  # type: ignore
                 ctx.ensure_object(dict)
@@ -311,7 +422,15 @@ def main() -> None:
         if RUN_ONCE:
             sys.exit(return_code)
 
-        time.sleep(int(sleep))
+        if sha_watcher and sleep == SLEEP_DURATION_SECS:
+            trigger = sha_watcher.wait(sleep)
+        else:
+            time.sleep(int(sleep))
+            trigger = (
+                RunTrigger.PERIODIC
+                if sleep == SLEEP_DURATION_SECS
+                else RunTrigger.ERROR_RETRY
+            )
 
 
 if __name__ == "__main__":
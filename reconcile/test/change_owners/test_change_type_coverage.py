@@ -12,6 +12,7 @@ from reconcile.change_owners.change_types import (
 )
 from reconcile.change_owners.changes import (
     METADATA_CHANGE_PATH,
+    DiffPathIndex,
     aggregate_file_moves,
 )
 from reconcile.change_owners.diff import (
@@ -26,6 +27,8 @@ from reconcile.test.change_owners.fixtures import (
 )
 
 if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
     from reconcile.gql_definitions.change_owners.queries.change_types import (
         ChangeTypeV1,
     )
@@ -339,3 +342,75 @@ def test_no_diff_but_file_move(saas_file_changetype: ChangeTypeV1) -> None:
     dc = saas_file_move.diff_coverage[0]
     assert dc.diff.path_str() == METADATA_CHANGE_PATH
     assert dc.coverage == [ctx]
+
+
+def test_cover_changes_reuses_allowed_paths(
+    mocker: MockerFixture, saas_file_changetype: ChangeTypeV1, saas_file: StubFile
+) -> None:
+    saas_file_change = saas_file.create_bundle_change({
+        "resourceTemplates[0].targets[0].ref": "new-ref"
+    })
+    processor = change_type_to_processor(saas_file_changetype)
+    allowed_changed_paths = mocker.spy(processor, "allowed_changed_paths")
+    contexts = [
+        ChangeTypeContext(
+            change_type_processor=processor,
+            context=f"RoleV1 - role-{i}",
+            origin="",
+            approvers=[Approver(org_username=f"user-{i}")],
+            context_file=saas_file.file_ref(),
+        )
+        for i in range(3)
+    ]
+    for ctx in contexts:
+        saas_file_change.cover_changes(ctx)
+
+    assert saas_file_change.diff_coverage[0].coverage == contexts
+    allowed_changed_paths.assert_called_once()
+
+
+#
+# diff path index
+#
+
+
+def diff_coverage(path: str) -> DiffCoverage:
+    return DiffCoverage(
+        Diff(
+            path=jsonpath_ng.parse(path),
+            diff_type=DiffType.CHANGED,
+            old=None,
+            new=None,
+        ),
+        [],
+    )
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        # diffs under the path
+        ("a", ["a.b", "a.c.[0]", "ab"]),
+        ("a.c", ["a.c.[0]"]),
+        # diffs the path is under
+        ("a.b.x", ["a.b"]),
+        ("a.c.[0].x", ["a.c.[0]"]),
+        ("a.b", ["a.b"]),
+        ("d", []),
+        ("$", ["a.b", "a.c.[0]", "ab", "x"]),
+    ],
+)
+def test_diff_path_index(path: str, expected: list[str]) -> None:
+    index = DiffPathIndex([diff_coverage(p) for p in ("a.b", "a.c.[0]", "ab", "x")])
+
+    assert [dc.diff.path_str() for dc in index.related_to(jsonpath_ng.parse(path))] == (
+        expected
+    )
+
+
+def test_diff_path_index_root_diff() -> None:
+    index = DiffPathIndex([diff_coverage("$")])
+
+    assert [
+        dc.diff.path_str() for dc in index.related_to(jsonpath_ng.parse("a.b"))
+    ] == ["$"]
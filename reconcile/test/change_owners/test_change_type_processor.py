@@ -5,10 +5,11 @@ from typing import TYPE_CHECKING
 import pytest
 from jsonpath_ng.exceptions import JsonPathParserError
 
-from reconcile.change_owners.bundle import BundleFileType
+from reconcile.change_owners.bundle import BundleFileType, FileRef
 from reconcile.change_owners.change_types import (
     ChangeTypeContext,
     ChangeTypeProcessor,
+    ChangeTypeProcessorIndex,
 )
 from reconcile.test.change_owners.fixtures import (
     StubFile,
@@ -144,3 +145,38 @@ def test_change_type_processor_allowed_paths_conditions_ct_without_schema_file_w
     )
 
     assert {str(p) for p in paths} == {"$"}
+
+
+#
+# change type processor index
+#
+
+
+def test_change_type_processor_index() -> None:
+    namespace = build_change_type(
+        "namespace", ["a"], context_schema="/openshift/namespace-1.yml"
+    )
+    user_via_role = build_change_type(
+        "user-via-role",
+        ["roles"],
+        change_schema="/access/user-1.yml",
+        context_schema="/access/role-1.yml",
+    )
+    any_resource = build_change_type(
+        "any-resource", ["$"], context_type=BundleFileType.RESOURCEFILE
+    )
+    index = ChangeTypeProcessorIndex([namespace, user_via_role, any_resource])
+
+    def names(schema: str | None) -> list[str]:
+        return [
+            ctp.name
+            for ctp in index.for_file(
+                FileRef(BundleFileType.DATAFILE, path="/file.yml", schema=schema)
+            )
+        ]
+
+    assert names("/openshift/namespace-1.yml") == ["namespace", "any-resource"]
+    assert names("/access/user-1.yml") == ["user-via-role", "any-resource"]
+    assert names("/access/role-1.yml") == ["user-via-role", "any-resource"]
+    assert names("/app-sre/app-1.yml") == ["any-resource"]
+    assert names(None) == ["any-resource"]
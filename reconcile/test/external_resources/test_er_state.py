@@ -1,17 +1,23 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock
 
 from pytest import fixture
 
+from reconcile.external_resources.model import ResourceStatus
 from reconcile.external_resources.state import (
+    BATCH_WRITE_MAX_ITEMS,
     DynamoDBStateAdapter,
+    ExternalResourcesStateDynamoDB,
     ExternalResourceState,
 )
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from pytest_mock import MockerFixture
+
 
 @fixture
 def dynamodb_serialized_values() -> dict[str, Any]:
@@ -114,3 +120,65 @@ def test_dynamodb_deserialize(
         == state.reconciliation.module_configuration.reconcile_timeout_minutes
     )
     # the rest of the fields are not stored in the state
+
+
+TABLE = "state_table"
+
+
+@fixture
+def aws_api(mocker: MockerFixture) -> MagicMock:
+    mocker.patch("reconcile.external_resources.state.time.sleep")
+    aws_api = MagicMock()
+    aws_api.dynamodb.boto3_client.get_paginator.return_value.paginate.return_value = []
+    return aws_api
+
+
+def test_get_external_resource_states_retries_unprocessed_keys(
+    aws_api: MagicMock,
+    state: ExternalResourceState,
+    dynamodb_serialized_values: dict[str, Any],
+) -> None:
+    missing_key = state.key.model_copy(update={"identifier": "missing"})
+    unprocessed = {TABLE: {"Keys": [{"external_resource_key_hash": "..."}]}}
+    client = aws_api.dynamodb.boto3_client
+    client.batch_get_item.side_effect = [
+        {"Responses": {TABLE: []}, "UnprocessedKeys": unprocessed},
+        {"Responses": {TABLE: [dynamodb_serialized_values]}, "UnprocessedKeys": {}},
+    ]
+    state_mgr = ExternalResourcesStateDynamoDB(aws_api, TABLE)
+
+    states = state_mgr.get_external_resource_states([state.key, missing_key])
+
+    assert states[state.key].reconciliation.input == state.reconciliation.input
+    assert states[missing_key].resource_status == ResourceStatus.NOT_EXISTS
+    assert client.batch_get_item.call_count == 2
+    assert client.batch_get_item.call_args.kwargs == {"RequestItems": unprocessed}
+
+
+def test_set_external_resource_states_batches(
+    aws_api: MagicMock,
+    state: ExternalResourceState,
+) -> None:
+    states = [
+        state.model_copy(
+            update={"key": state.key.model_copy(update={"identifier": f"id-{i}"})}
+        )
+        for i in range(BATCH_WRITE_MAX_ITEMS + 1)
+    ]
+    unprocessed = {TABLE: [{"PutRequest": {"Item": {}}}]}
+    client = aws_api.dynamodb.boto3_client
+    client.batch_write_item.side_effect = [
+        {"UnprocessedItems": unprocessed},
+        {"UnprocessedItems": {}},
+        {},
+    ]
+    state_mgr = ExternalResourcesStateDynamoDB(aws_api, TABLE)
+
+    state_mgr.set_external_resource_states([*states, states[0]])
+
+    requests = [
+        c.kwargs["RequestItems"] for c in client.batch_write_item.call_args_list
+    ]
+    assert len(requests[0][TABLE]) == BATCH_WRITE_MAX_ITEMS
+    assert requests[1] == unprocessed
+    assert len(requests[2][TABLE]) == 1
@@ -283,3 +283,42 @@ def test_update_resource_state_deletes_state(
     manager.state_mgr = cast("Mock", manager.state_mgr)
     manager.state_mgr.del_external_resource_state.assert_called_once()
     manager.state_mgr.set_external_resource_state.assert_not_called()
+
+
+def test_update_resource_state_requests_linked_resources_from_prefetched_states(
+    manager: ExternalResourcesManager,
+    reconciliation: Reconciliation,
+    reconciliation_status: ReconciliationStatus,
+    state: ExternalResourceState,
+) -> None:
+    linked_in_progress = state.model_copy(
+        update={
+            "key": state.key.model_copy(update={"identifier": "in-progress"}),
+            "resource_status": ResourceStatus.IN_PROGRESS,
+        }
+    )
+    linked_created = state.model_copy(
+        update={
+            "key": state.key.model_copy(update={"identifier": "created"}),
+            "resource_status": ResourceStatus.CREATED,
+        }
+    )
+    reconciliation = reconciliation.model_copy(
+        update={
+            "linked_resources": frozenset({
+                linked_in_progress.key,
+                linked_created.key,
+            })
+        }
+    )
+    states = {s.key: s for s in (state, linked_in_progress, linked_created)}
+
+    manager._update_resource_state(reconciliation, state, reconciliation_status, states)
+
+    manager.state_mgr = cast("Mock", manager.state_mgr)
+    manager.state_mgr.get_external_resource_states.assert_not_called()
+    manager.state_mgr.set_external_resource_states.assert_called_once_with([
+        linked_created
+    ])
+    assert linked_created.resource_status == ResourceStatus.RECONCILIATION_REQUESTED
+    assert linked_in_progress.resource_status == ResourceStatus.IN_PROGRESS
@@ -6,7 +6,10 @@ import pytest
 
 from reconcile.test.ocm.fixtures import OcmUrl
 from reconcile.test.ocm.test_utils_ocm_get_json import build_paged_ocm_response
-from reconcile.utils.ocm_base_client import OCMBaseClient
+from reconcile.utils.ocm_base_client import (
+    OCMBaseClient,
+    next_pages,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -85,3 +88,41 @@ def test_get_json_pagination_max_pages(
 
     ocm_calls = find_all_ocm_http_requests("GET", "/api")
     assert len(ocm_calls) == max_pages
+
+
+@pytest.mark.parametrize(
+    "page, total, page_size, max_pages, expected",
+    [
+        (1, 10, 3, None, [2, 3, 4]),
+        (1, 10, 10, None, [2]),
+        (1, None, 10, None, [2]),
+        (1, 10, 3, 2, [2]),
+        (4, 10, 3, None, [5]),
+    ],
+)
+def test_next_pages(
+    page: int,
+    total: int | None,
+    page_size: int,
+    max_pages: int | None,
+    expected: list[int],
+) -> None:
+    assert list(next_pages(page, total, page_size, max_pages)) == expected
+
+
+def test_get_paginated_outdated_total(
+    ocm_api: OCMBaseClient,
+    register_ocm_url_responses: Callable[[list[OcmUrl], int], int],
+    find_all_ocm_http_requests: Callable[[str, str], list[Request]],
+) -> None:
+    responses = build_paged_ocm_response(nr_of_items=10, page_size=3)
+    for r in responses:
+        r["total"] = 4
+    register_ocm_url_responses(
+        [OcmUrl(method="GET", uri="/api", responses=responses)], 3
+    )
+
+    resp = list(ocm_api.get_paginated("/api", max_page_size=3))
+
+    assert resp == [{"id": i} for i in range(10)]
+    assert len(find_all_ocm_http_requests("GET", "/api")) == 4
@@ -1,28 +1,21 @@
 from __future__ import annotations
 
-from time import sleep
 from typing import TYPE_CHECKING, Any
 
-import jsonpath_ng
 import pytest
 
 from reconcile.change_owners.diff import (
     IDENTIFIER_FIELD_NAME,
-    Diff,
     DiffType,
 )
-from reconcile.utils.runtime import desired_state_diff
 from reconcile.utils.runtime.desired_state_diff import (
-    DiffDetectionFailureError,
-    DiffDetectionTimeoutError,
+    HashTree,
     build_desired_state_diff,
-    extract_diffs_with_timeout,
+    diff_hash_trees,
 )
 from reconcile.utils.runtime.integration import DesiredStateShardConfig
 
 if TYPE_CHECKING:
-    from pytest_mock.plugin import MockerFixture
-
     from reconcile.test.runtime.fixtures import (
         ShardableTestIntegration,
         SimpleTestIntegration,
@@ -99,123 +92,120 @@ def test_desired_state_diff_building_shardable_integration(
     assert desired_state_diff.affected_shards == {"b"}
 
 
-def diff_extration_with_3_second_sleep(
-    old_file_content: Any, new_file_content: Any
-) -> list[Diff]:
-    sleep(3)
+#
+# hash trees
+#
+
+
+def test_hash_tree_ignores_list_order() -> None:
+    assert (
+        HashTree.build({"data": [{"a": 1}, {"b": [1, 2]}]}).digest
+        == HashTree.build({"data": [{"b": [2, 1]}, {"a": 1}]}).digest
+    )
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        {"data": [{"a": "1"}]},
+        {"data": [{"a": True}]},
+        {"data": [{"a": 1}, {"a": 1}]},
+        {"data": {"a": 1}},
+        {"data": [{"a": 1}], "more": None},
+    ],
+)
+def test_hash_tree_detects_changes(other: dict[str, Any]) -> None:
+    assert HashTree.build({"data": [{"a": 1}]}).digest != HashTree.build(other).digest
+
+
+def test_hash_tree_shares_unchanged_subtrees() -> None:
+    old = HashTree.build({"a": {"x": 1}, "b": {"y": 1}})
+    new = HashTree.build({"a": {"x": 1}, "b": {"y": 2}})
+    assert isinstance(old.children, dict)
+    assert isinstance(new.children, dict)
+    assert old.children["a"].digest == new.children["a"].digest
+    assert old.children["b"].digest != new.children["b"].digest
+
+
+def diff_strs(old: Any, new: Any) -> list[tuple[str, DiffType, Any, Any]]:
     return [
-        Diff(
-            diff_type=DiffType.CHANGED,
-            path=jsonpath_ng.parse("shards[1].value"),
-            old="old",
-            new="new",
-        )
+        (d.path_str(), d.diff_type, d.old, d.new)
+        for d in diff_hash_trees(HashTree.build(old), HashTree.build(new))
     ]
 
 
-def diff_extration_with_endless_recursion(
-    old_file_content: Any, new_file_content: Any
-) -> list[Diff]:
-    return diff_extration_with_endless_recursion(old_file_content, new_file_content)
+def test_diff_hash_trees_dict() -> None:
+    assert diff_strs(
+        {"a": 1, "b": {"c": 1, "d": 1}, "e": 1},
+        {"a": 1, "b": {"c": 2, "d": 1}, "f": 1},
+    ) == [
+        ("b.c", DiffType.CHANGED, 1, 2),
+        ("e", DiffType.REMOVED, 1, None),
+        ("f", DiffType.ADDED, None, 1),
+    ]
 
 
-def diff_extration_with_exception(
-    old_file_content: Any, new_file_content: Any
-) -> list[Diff]:
-    raise Exception("something went wrong")
+def test_diff_hash_trees_type_change() -> None:
+    assert diff_strs({"a": [1]}, {"a": {"b": 1}}) == [
+        ("a", DiffType.CHANGED, [1], {"b": 1})
+    ]
 
 
-def test_desired_state_diff_building_time(
-    mocker: MockerFixture, shardable_test_integration: ShardableTestIntegration
-) -> None:
-    extract_diffs_with_timeout_mock = mocker.patch.object(
-        desired_state_diff, "extract_diffs_with_timeout"
-    )
-    extract_diffs_with_timeout_mock.side_effect = DiffDetectionTimeoutError()
-    diff = build_desired_state_diff(
-        shardable_test_integration.get_desired_state_shard_config(),
-        previous_desired_state={
-            "shards": [
-                {"shard": "a", "value": "old"},
-                {"shard": "b", "value": "old"},
-            ]
-        },
-        current_desired_state={
-            "shards": [
-                {"shard": "a", "value": "old"},
-                {"shard": "b", "value": "new"},
-            ]
-        },
-    )
-    assert diff.affected_shards == set()
+def test_diff_hash_trees_list_reordered() -> None:
+    assert not diff_strs({"a": [1, 2, {"b": 3}]}, {"a": [{"b": 3}, 2, 1]})
 
 
-#
-# extract diffs
-#
+def test_diff_hash_trees_list_items() -> None:
+    assert diff_strs(
+        {"a": [{"v": 1}, {"v": 2}, {"v": 3}]},
+        {"a": [{"v": 1}, {"v": 4}, {"v": 3}, {"v": 5}]},
+    ) == [
+        ("a.[1].v", DiffType.CHANGED, 2, 4),
+        ("a.[3]", DiffType.ADDED, None, {"v": 5}),
+    ]
 
 
-def test_extract_diffs_with_timeout() -> None:
-    """
-    test timeout behaviour of diff extraction
-    """
-    previous_desired_state = {
-        "shards": [
-            {"shard": "a", "value": "old"},
-            {"shard": "b", "value": "old"},
-        ]
-    }
-    current_desired_state = {
-        "shards": [
-            {"shard": "a", "value": "old"},
-            {"shard": "b", "value": "new"},
-        ]
-    }
-
-    # the timeout is lower than the extraction duration -> TIMEOUT
-    with pytest.raises(DiffDetectionTimeoutError):
-        extract_diffs_with_timeout(
-            diff_extration_with_3_second_sleep,
-            previous_desired_state=previous_desired_state,
-            current_desired_state=current_desired_state,
-            timeout_seconds=1,
-        )
-
-    # the timeout is higher than the extraction duration -> NO TIMEOUT
-    diffs = extract_diffs_with_timeout(
-        diff_extration_with_3_second_sleep,
-        previous_desired_state=previous_desired_state,
-        current_desired_state=current_desired_state,
-        timeout_seconds=5,
-    )
-    assert diffs
-    assert isinstance(diffs[0], Diff)
+def test_diff_hash_trees_list_items_by_identifier() -> None:
+    a = {IDENTIFIER_FIELD_NAME: "a", "v": 1}
+    b = {IDENTIFIER_FIELD_NAME: "b", "v": 1}
+    b_changed = {IDENTIFIER_FIELD_NAME: "b", "v": 2}
+    # changed in place
+    assert diff_strs({"l": [a, b]}, {"l": [a, b_changed]}) == [
+        ("l.[1].v", DiffType.CHANGED, 1, 2)
+    ]
+    # changed and moved
+    assert diff_strs({"l": [a, b]}, {"l": [b_changed, a]}) == [
+        ("l.[1]", DiffType.REMOVED, b, None),
+        ("l.[0]", DiffType.ADDED, None, b_changed),
+    ]
 
 
-def test_extract_diffs_with_recursion_issue() -> None:
-    """
-    test if a max recursion issue is caught properly
-    """
-    with pytest.raises(DiffDetectionFailureError):
-        extract_diffs_with_timeout(
-            diff_extration_with_endless_recursion,
-            previous_desired_state={},
-            current_desired_state={},
-            timeout_seconds=100,
-        )
+def test_diff_hash_trees_list_items_with_duplicate_identifiers() -> None:
+    b = {IDENTIFIER_FIELD_NAME: "b", "v": 1}
+    b2 = {IDENTIFIER_FIELD_NAME: "b", "v": 2}
+    b3 = {IDENTIFIER_FIELD_NAME: "b", "v": 3}
+    assert diff_strs({"l": [b]}, {"l": [b2, b3]}) == [
+        ("l.[0].v", DiffType.CHANGED, 1, 2),
+        ("l.[1]", DiffType.ADDED, None, b3),
+    ]
+    assert diff_strs({"l": [b, b]}, {"l": [b2, b3]}) == [
+        ("l.[0].v", DiffType.CHANGED, 1, 2),
+        ("l.[1].v", DiffType.CHANGED, 1, 3),
+    ]
 
 
-def test_extract_diffs_with_exception() -> None:
-    """
-    test with exception
-    """
-    with pytest.raises(DiffDetectionFailureError):
-        extract_diffs_with_timeout(
-            diff_extration_with_exception,
-            previous_desired_state={},
-            current_desired_state={},
-            timeout_seconds=100,
-        )
+@pytest.mark.parametrize(
+    "old, new, expected",
+    [
+        ({"a": 1}, {}, [("$", DiffType.REMOVED, {"a": 1}, None)]),
+        ({}, {"a": 1}, [("$", DiffType.ADDED, None, {"a": 1})]),
+        ({}, {}, []),
+    ],
+)
+def test_diff_hash_trees_empty(
+    old: dict[str, Any], new: dict[str, Any], expected: list
+) -> None:
+    assert diff_strs(old, new) == expected
 
 
 #
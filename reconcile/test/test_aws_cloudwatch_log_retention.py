@@ -718,3 +718,45 @@ def test_run_with_multiple_regions_account(
         ],
         any_order=True,
     )
+
+
+def test_run_keeps_last_tags_of_account_with_failed_region(
+    mocker: MockerFixture,
+    test_cloudwatch_account: AWSAccountV1,
+    cloudwatch_account_with_multiple_regions: AWSAccountV1,
+    managed_by_aws_cloudwatch_log_retention_tags: dict[str, str],
+    stale_tags: dict[str, str],
+) -> None:
+    mocks = setup_mocks(
+        mocker,
+        aws_accounts=[
+            test_cloudwatch_account,
+            cloudwatch_account_with_multiple_regions,
+        ],
+        log_groups=[],
+        tags={},
+        last_tags={cloudwatch_account_with_multiple_regions.name: stale_tags},
+    )
+    failing_aws_api = MagicMock()
+    failing_aws_api_logs = failing_aws_api.__enter__.return_value.logs
+    failing_aws_api_logs.client.exceptions.ClientError = ClientError
+    failing_aws_api_logs.get_log_groups.side_effect = ClientError(
+        error_response={"Error": {"Code": "ThrottlingException"}},
+        operation_name="DescribeLogGroups",
+    )
+    aws_api = mocks["aws_api"].return_value
+    mocks["aws_api"].side_effect = lambda credentials: (
+        failing_aws_api if credentials.region == "us-west-2" else aws_api
+    )
+
+    run(dry_run=False)
+
+    assert mocks["aws_api"].call_count == 3
+    mocks["state"].add.assert_called_once_with(
+        "tags.json",
+        {
+            test_cloudwatch_account.name: managed_by_aws_cloudwatch_log_retention_tags,
+            cloudwatch_account_with_multiple_regions.name: stale_tags,
+        },
+        force=True,
+    )
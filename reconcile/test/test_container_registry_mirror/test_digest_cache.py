@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from reconcile.container_registry_mirror.digest_cache import DigestCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_digests_survive_restarts(tmp_path: Path) -> None:
+    cache = DigestCache.from_dir(str(tmp_path), "digests.json")
+    cache.set("src:v1", "dst:v1", "sha256:a")
+    cache.save()
+
+    cache = DigestCache.from_dir(str(tmp_path), "digests.json")
+    assert cache.get("src:v1", "dst:v1") == "sha256:a"
+    assert cache.get("src:v2", "dst:v2") is None
+
+
+def test_prune_drops_unseen_entries(tmp_path: Path) -> None:
+    path = str(tmp_path / "digests.json")
+    cache = DigestCache(path)
+    cache.set("src:v1", "dst:v1", "sha256:a")
+    cache.set("src:v2", "dst:v2", "sha256:b")
+    cache.save()
+
+    cache = DigestCache(path)
+    cache.get("src:v1", "dst:v1")
+    cache.save(prune=True)
+
+    cache = DigestCache(path)
+    assert cache.get("src:v1", "dst:v1") == "sha256:a"
+    assert cache.get("src:v2", "dst:v2") is None
+
+
+def test_corrupt_file_is_ignored(tmp_path: Path) -> None:
+    path = tmp_path / "digests.json"
+    path.write_text("{not json", encoding="utf-8")
+    assert DigestCache(str(path)).get("src:v1", "dst:v1") is None
+
+
+def test_from_dir_requires_directory(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        DigestCache.from_dir(str(tmp_path / "missing"), "digests.json")
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import threading
+import time
+from typing import TYPE_CHECKING
 from unittest.mock import (
     MagicMock,
     patch,
 )
 
 import pytest
+from prometheus_client import REGISTRY
 from sretoolbox.container.image import (
     ImageComparisonError,
     ImageContainsError,
@@ -13,9 +17,13 @@ from sretoolbox.container.image import (
 from sretoolbox.container.skopeo import SkopeoCmdError
 
 from reconcile.container_registry_mirror.deep_sync_timer import DeepSyncTimer
+from reconcile.container_registry_mirror.digest_cache import DigestCache
 from reconcile.container_registry_mirror.engine import MirrorEngine
 from reconcile.container_registry_mirror.mirror_spec import MirrorSpec
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 def _make_spec(
     source_url: str = "docker.io/upstream/image",
@@ -873,3 +881,153 @@ class TestTimerRecordOnSuccess:
             engine.sync([spec])
 
         timer.record.assert_not_called()
+
+
+class TestDigestCache:
+    """With a digest cache, deep sync only compares tags whose upstream
+    digest differs from the digest mirrored before."""
+
+    def _engine(self, skopeo: MagicMock, cache: DigestCache) -> MirrorEngine:
+        return MirrorEngine(
+            skopeo=skopeo,
+            dry_run=False,
+            is_deep_sync=True,
+            digest_cache=cache,
+        )
+
+    def test_cached_digest_skips_comparison(
+        self, skopeo: MagicMock, tmp_path: Path
+    ) -> None:
+        cache = DigestCache(str(tmp_path / "digests.json"))
+        cache.set("docker.io/upstream/image:v1.0", "quay.io/org/image:v1.0", "sha256:a")
+        engine = self._engine(skopeo, cache)
+        source = _make_source_image(["v1.0"])
+        dest = _make_dest_image({"v1.0"})
+        source["v1.0"].digest = "sha256:a"
+        dest_tag = dest["v1.0"]
+        dest_tag.__eq__ = MagicMock(return_value=False)
+
+        with patch.object(engine, "_build_images", return_value=(source, dest)):
+            engine.sync([_make_spec()])
+
+        dest_tag.__eq__.assert_not_called()
+        skopeo.copy.assert_not_called()
+
+    def test_changed_digest_is_copied_and_remembered(
+        self, skopeo: MagicMock, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "digests.json"
+        cache = DigestCache(str(path))
+        cache.set("docker.io/upstream/image:v1.0", "quay.io/org/image:v1.0", "sha256:a")
+        cache.set("docker.io/upstream/image:gone", "quay.io/org/image:gone", "sha256:c")
+        cache.save()
+        engine = self._engine(skopeo, DigestCache(str(path)))
+        source = _make_source_image(["v1.0"])
+        dest = _make_dest_image({"v1.0"})
+        source["v1.0"].digest = "sha256:b"
+        dest_tag = dest["v1.0"]
+        dest_tag.__eq__ = MagicMock(return_value=False)
+        dest_tag.is_part_of = MagicMock(return_value=False)
+
+        with patch.object(engine, "_build_images", return_value=(source, dest)):
+            engine.sync([_make_spec()])
+
+        skopeo.copy.assert_called_once()
+        # the deep sync prunes tags that no longer exist upstream
+        assert DigestCache(str(path))._load() == {
+            "docker.io/upstream/image:v1.0 -> quay.io/org/image:v1.0": "sha256:b"
+        }
+
+    def test_failed_copy_is_not_remembered(
+        self, skopeo: MagicMock, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "digests.json"
+        cache = DigestCache(str(path))
+        skopeo.copy.side_effect = SkopeoCmdError("failed")
+        engine = self._engine(skopeo, cache)
+        source = _make_source_image(["v1.0"])
+        dest = _make_dest_image({"v1.0"})
+        source["v1.0"].digest = "sha256:b"
+        dest_tag = dest["v1.0"]
+        dest_tag.__eq__ = MagicMock(return_value=False)
+        dest_tag.is_part_of = MagicMock(return_value=False)
+
+        with (
+            patch.object(engine, "_build_images", return_value=(source, dest)),
+            pytest.raises(ExceptionGroup),
+        ):
+            engine.sync([_make_spec()])
+
+        assert DigestCache(str(path))._load() == {}
+
+
+class TestConcurrency:
+    """Tags of all specs are processed concurrently, bounded per
+    destination registry."""
+
+    def test_registry_concurrency_is_bounded(self, skopeo: MagicMock) -> None:
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+
+        def copy(**kwargs: str) -> None:
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+
+        skopeo.copy.side_effect = copy
+        engine = MirrorEngine(
+            skopeo=skopeo,
+            thread_pool_size=8,
+            max_concurrency_per_registry=2,
+        )
+        specs = [
+            _make_spec(
+                source_url=f"docker.io/upstream/image-{i}",
+                destination_url=f"quay.io/org/image-{i}",
+            )
+            for i in range(3)
+        ]
+
+        with patch.object(
+            engine,
+            "_build_images",
+            side_effect=lambda spec: (
+                _make_source_image(["v1", "v2", "v3"]),
+                _make_dest_image(set()),
+            ),
+        ):
+            engine.sync(specs)
+
+        assert skopeo.copy.call_count == 9
+        assert max_in_flight == 2
+
+    def test_metrics_per_spec(self, engine: MirrorEngine, skopeo: MagicMock) -> None:
+        spec = _make_spec(destination_url="quay.io/org/metrics-image")
+        labels = {"source": spec.source_url, "destination": spec.destination_url}
+
+        def tags(result: str) -> float:
+            return (
+                REGISTRY.get_sample_value(
+                    "qontract_reconcile_container_registry_mirror_tags_total",
+                    labels | {"result": result},
+                )
+                or 0
+            )
+
+        copied, skipped = tags("copied"), tags("skipped")
+        source = _make_source_image(["v1.0", "v2.0"])
+        dest = _make_dest_image({"v1.0"})
+
+        with patch.object(engine, "_build_images", return_value=(source, dest)):
+            engine.sync([spec])
+
+        assert tags("copied") == copied + 1
+        assert tags("skipped") == skipped + 1
+        assert REGISTRY.get_sample_value(
+            "qontract_reconcile_container_registry_mirror_sync_seconds_total", labels
+        )
@@ -13,6 +13,7 @@ from reconcile.utils import (
     gql,
 )
 from reconcile.utils.aggregated_list import AggregatedList
+from reconcile.utils.raw_github_api import GithubGraphQLError
 
 from .fixtures import Fixtures
 
@@ -25,6 +26,10 @@ fxt = Fixtures("github_org")
 
 
 class RawGithubApiMock:
+    @staticmethod
+    def team_members(org_name: str) -> dict[str, list[str]]:
+        raise GithubGraphQLError("not supported")
+
     @staticmethod
     def team_invitations(org_id: str, team_id: str) -> list:
         return []
@@ -166,3 +171,42 @@ class TestGithubOrg:
             config.get_config()["github"]["org_a"]["managed_teams"] = orig
 
         assert current_state == []
+
+    def test_fetch_current_state_graphql(self, mocker: MockerFixture) -> None:
+        mocker.patch("reconcile.github_org.Github")
+        m_rga = mocker.patch("reconcile.github_org.RawGithubApi")
+        m_rga.return_value.team_members.return_value = {
+            "team1": ["User1", "invited"],
+            "unmanaged": ["user2"],
+        }
+
+        gh_api_store = github_org.GHApiStore(config.get_config())
+        current_state = github_org.fetch_current_state(gh_api_store).dump()
+
+        assert get_items_by_params(
+            current_state,
+            {"service": "github-org-team", "org": "org_a", "team": "team1"},
+        ) == ["invited", "user1"]
+        assert get_items_by_params(
+            current_state, {"service": "github-org", "org": "org_a"}
+        ) == ["invited", "user1"]
+        m_rga.return_value.team_invitations.assert_not_called()
+
+    def test_get_team_members_falls_back_to_rest(self, mocker: MockerFixture) -> None:
+        mocker.patch("reconcile.github_org.Github").return_value = GithubMock({
+            "org_a": {
+                "id": 1234,
+                "teams": [
+                    {"name": "team1", "members": [{"login": "user1"}]},
+                    {"name": "team2", "members": [{"login": "user2"}]},
+                ],
+            }
+        })
+        m_rga = mocker.patch("reconcile.github_org.RawGithubApi")
+        m_rga.return_value.team_members.side_effect = GithubGraphQLError("boom")
+        m_rga.return_value.team_invitations.return_value = ["invited"]
+
+        gh_api_store = github_org.GHApiStore(config.get_config())
+        members = github_org.get_team_members(gh_api_store, "org_a", ["team1"])
+
+        assert members == {"team1": ["user1", "invited"]}
@@ -23,7 +23,6 @@ from gitlab.exceptions import (
 from gitlab.v4.objects import (
     Project,
     ProjectCommit,
-    ProjectCommitManager,
     ProjectIssue,
     ProjectMergeRequest,
     ProjectMergeRequestNoteManager,
@@ -138,27 +137,46 @@ def test_is_rebase() -> None:
 
     mocked_gitlab_api = create_autospec(GitLabApi)
     mocked_gitlab_api.project = create_autospec(Project)
-    mocked_gitlab_api.project.commits = create_autospec(ProjectCommitManager)
-    mocked_commit = create_autospec(ProjectCommit)
-    expected_head = "some-id"
-    mocked_commit.id = expected_head
-    mocked_gitlab_api.project.commits.list.return_value = [mocked_commit]
 
     mocked_gitlab_api.project.repository_compare.return_value = {"commits": []}
 
     result = gl_h.is_rebased(mr, mocked_gitlab_api)
 
     assert result is True
-    mocked_gitlab_api.project.commits.list.assert_called_once_with(
-        ref_name=expected_ref,
-        per_page=1,
-        page=1,
-    )
     mocked_gitlab_api.project.repository_compare.assert_called_once_with(
         expected_sha,
-        expected_head,
+        expected_ref,
+    )
+
+
+def test_merge_merge_requests_reload_refreshes_snapshot(
+    mocker: MockerFixture,
+) -> None:
+    preprocess = mocker.patch(
+        "reconcile.gitlab_housekeeping.preprocess_merge_requests",
+        return_value=[],
+    )
+    mocked_gl = create_autospec(GitLabApi)
+    mocked_gl.project = create_autospec(Project)
+    mocked_gl.project.id = "proj-1"
+    mr = create_autospec(ProjectMergeRequest)
+    mocked_gl.get_merge_requests.return_value = [mr]
+
+    gl_h.merge_merge_requests(
+        dry_run=True,
+        gl=mocked_gl,
+        project_merge_requests=[],
+        reload_toggle=gl_h.ReloadToggle(reload=True),
+        merge_limit=1,
+        rebase=False,
+        app_sre_usernames=set(),
+        state=create_autospec(State),
     )
 
+    mocked_gl.get_merge_requests.assert_called_once_with(state="opened")
+    mocked_gl.load_merge_requests_snapshot.assert_called_once_with()
+    assert preprocess.call_args.kwargs["project_merge_requests"] == [mr]
+
 
 @pytest.fixture
 def repo_gitlab_housekeeping() -> dict:
@@ -5,7 +5,9 @@ from typing import TYPE_CHECKING, Any
 
 import pytest
 import yaml
+from kubernetes.client.exceptions import ApiException
 from kubernetes.dynamic import Resource
+from kubernetes.dynamic.exceptions import GoneError
 from pydantic import BaseModel
 from qontract_utils.differ import (
     DiffPair,
@@ -20,7 +22,7 @@ from reconcile.utils import oc
 from reconcile.utils.semver_helper import make_semver
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Iterator, Mapping, Sequence
     from unittest.mock import MagicMock
 
     from pytest_mock import MockerFixture
@@ -722,9 +724,9 @@ def test_populate_current_state(
     # prepare client and resource inventory
     oc_cs1.init_api_resources = True
     oc_cs1.api_resources = api_resources
-    oc_cs1.get_items = lambda kind, **kwargs: [  # type: ignore[method-assign]
+    oc_cs1.iter_items = lambda kind, **kwargs: iter([  # type: ignore[method-assign]
         build_resource("Kind", "fully.qualified/v1", "name")
-    ]
+    ])
     resource_inventory.initialize_resource_type("cs1", "ns1", "Kind.fully.qualified")
 
     # process
@@ -763,7 +765,7 @@ def test_populate_current_state_unknown_kind(
     sut.populate_current_state(spec, resource_inventory, TEST_INT, TEST_INT_VER)
 
     assert len(list(iter(resource_inventory))) == 0
-    oc_cs1.get_items.assert_not_called()
+    oc_cs1.iter_items.assert_not_called()
 
 
 def test_populate_current_state_resource_name_filtering(
@@ -783,13 +785,173 @@ def test_populate_current_state_resource_name_filtering(
     )
     sut.populate_current_state(spec, resource_inventory, TEST_INT, TEST_INT_VER)
 
-    oc_cs1.get_items.assert_called_with(
+    oc_cs1.iter_items.assert_called_with(
         "Kind.fully.qualified",
         namespace="ns1",
         resource_names=["name1", "name2"],
     )
 
 
+#
+# cluster-wide current state tests
+#
+
+
+def build_namespaced_resource(namespace: str, name: str) -> dict[str, Any]:
+    item = build_resource("Kind", "fully.qualified/v1", name)
+    item["metadata"]["namespace"] = namespace
+    return item
+
+
+def current_state_specs(
+    oc_cs1: MagicMock, resource_names: Mapping[str, list[str] | None]
+) -> list[sut.CurrentStateSpec]:
+    return [
+        sut.CurrentStateSpec(
+            oc=oc_cs1,
+            cluster="cs1",
+            namespace=namespace,
+            kind="Kind.fully.qualified",
+            resource_names=names,
+        )
+        for namespace, names in resource_names.items()
+    ]
+
+
+def test_merge_current_state_specs_below_threshold(oc_cs1: MagicMock) -> None:
+    specs = current_state_specs(oc_cs1, {"ns1": None, "ns2": None})
+
+    assert sut.merge_current_state_specs(specs, namespace_threshold=2) == specs
+
+
+def test_merge_current_state_specs_above_threshold(oc_cs1: MagicMock) -> None:
+    specs = current_state_specs(oc_cs1, {"ns1": None, "ns2": None, "ns3": None})
+
+    merged = sut.merge_current_state_specs(specs, namespace_threshold=2)
+
+    assert merged == [
+        sut.ClusterCurrentStateSpec(
+            oc=oc_cs1, cluster="cs1", kind="Kind.fully.qualified", specs=specs
+        )
+    ]
+
+
+def test_merge_current_state_specs_cluster_scoped(oc_cs1: MagicMock) -> None:
+    oc_cs1.is_kind_namespaced.return_value = False
+    specs = current_state_specs(oc_cs1, {"ns1": None, "ns2": None, "ns3": None})
+
+    assert sut.merge_current_state_specs(specs, namespace_threshold=2) == specs
+
+
+def test_populate_cluster_current_state(oc_cs1: MagicMock) -> None:
+    """
+    test that the cluster-wide fetch results in the same inventory as the
+    per-namespace fetch, including resource name filtering
+    """
+    items = [
+        build_namespaced_resource("ns1", "a"),
+        build_namespaced_resource("ns1", "b"),
+        build_namespaced_resource("ns2", "a"),
+        build_namespaced_resource("ns2", "b"),
+        build_namespaced_resource("unmanaged", "a"),
+    ]
+
+    def iter_items(kind: str, **kwargs: Any) -> Iterator[dict[str, Any]]:
+        for item in items:
+            namespace = item["metadata"]["namespace"]
+            if kwargs.get("namespace", namespace) != namespace:
+                continue
+            names = kwargs.get("resource_names")
+            if names and item["metadata"]["name"] not in names:
+                continue
+            yield item
+
+    oc_cs1.iter_items.side_effect = iter_items
+    specs = current_state_specs(oc_cs1, {"ns1": None, "ns2": ["b"], "ns3": None})
+
+    expected = resource.ResourceInventory()
+    actual = resource.ResourceInventory()
+    for ri in (expected, actual):
+        for spec in specs:
+            ri.initialize_resource_type(
+                spec.cluster, spec.namespace, spec.kind, spec.resource_names
+            )
+    for spec in specs:
+        sut.populate_current_state(spec, expected, TEST_INT, TEST_INT_VER)
+    sut.populate_cluster_current_state(
+        sut.ClusterCurrentStateSpec(
+            oc=oc_cs1, cluster="cs1", kind="Kind.fully.qualified", specs=specs
+        ),
+        actual,
+        TEST_INT,
+        TEST_INT_VER,
+    )
+
+    assert list(actual) == list(expected)
+    assert {(ns, name) for _, ns, _, d in actual for name in d["current"]} == {
+        ("ns1", "a"),
+        ("ns1", "b"),
+        ("ns2", "b"),
+    }
+    oc_cs1.iter_items.assert_called_with("Kind.fully.qualified", all_namespaces=True)
+
+
+def test_populate_cluster_current_state_forbidden_fallback(
+    oc_cs1: MagicMock,
+) -> None:
+    def iter_items(kind: str, **kwargs: Any) -> Iterator[dict[str, Any]]:
+        if kwargs.get("all_namespaces"):
+            raise oc.StatusCodeError("Forbidden")
+        yield build_namespaced_resource(kwargs["namespace"], "a")
+
+    oc_cs1.iter_items.side_effect = iter_items
+    specs = current_state_specs(oc_cs1, {"ns1": None, "ns2": None})
+    ri = resource.ResourceInventory()
+    for spec in specs:
+        ri.initialize_resource_type(spec.cluster, spec.namespace, spec.kind)
+
+    sut.populate_cluster_current_state(
+        sut.ClusterCurrentStateSpec(
+            oc=oc_cs1, cluster="cs1", kind="Kind.fully.qualified", specs=specs
+        ),
+        ri,
+        TEST_INT,
+        TEST_INT_VER,
+    )
+
+    assert not ri.has_error_registered()
+    assert {(ns, name) for _, ns, _, d in ri for name in d["current"]} == {
+        ("ns1", "a"),
+        ("ns2", "a"),
+    }
+
+
+def test_populate_cluster_current_state_error_after_items(
+    oc_cs1: MagicMock,
+) -> None:
+    def iter_items(kind: str, **kwargs: Any) -> Iterator[dict[str, Any]]:
+        yield build_namespaced_resource("ns1", "a")
+        raise GoneError(ApiException(status=410, reason="Expired"))
+
+    oc_cs1.iter_items.side_effect = iter_items
+    specs = current_state_specs(oc_cs1, {"ns1": None, "ns2": None})
+    ri = resource.ResourceInventory()
+    for spec in specs:
+        ri.initialize_resource_type(spec.cluster, spec.namespace, spec.kind)
+
+    sut.populate_cluster_current_state(
+        sut.ClusterCurrentStateSpec(
+            oc=oc_cs1, cluster="cs1", kind="Kind.fully.qualified", specs=specs
+        ),
+        ri,
+        TEST_INT,
+        TEST_INT_VER,
+    )
+
+    assert ri.has_error_registered("cs1")
+    oc_cs1.iter_items.assert_called_once()
+
+
 #
 # determine_user_keys_for_access tests
 #
@@ -999,6 +1161,7 @@ def test_handle_new_resources(
         "wait_for_namespace": True,
         "recycle_pods": True,
         "privileged": False,
+        "already_applied": False,
     }
     apply_mock.assert_called_with(**apply_expected_args)
 
@@ -1115,6 +1278,7 @@ def test_handle_modified_resources(
             "wait_for_namespace": True,
             "recycle_pods": True,
             "privileged": False,
+            "already_applied": False,
         }
         apply_mock.assert_called_with(**apply_expected_args)
     else:
@@ -1234,6 +1398,7 @@ def test_handle_identical_resources(
             "wait_for_namespace": True,
             "recycle_pods": True,
             "privileged": False,
+            "already_applied": False,
         }
         apply_mock.assert_called_with(**apply_expected_args)
     else:
@@ -1350,6 +1515,41 @@ def test_realize_resource_data_3way_diff(
     assert delete_mock.call_count == delete_calls
 
 
+def test_realize_resource_data_3way_diff_batch_apply(
+    mocker: MockerFixture,
+    oc_map: MagicMock,
+    oc_cs1: MagicMock,
+    resource_inventory: resource.ResourceInventory,
+    apply_options: sut.ApplyOptions,
+) -> None:
+    apply_mock = mocker.patch.object(sut, "apply", autospec=True)
+    oc_map.get.return_value = oc_cs1
+    oc_cs1.batch_apply = True
+    oc_cs1.apply_batch.return_value = {"a"}
+    apply_options.dry_run = False
+    desired = {
+        name: build_openshift_resource("ConfigMap", "v1", name, None)
+        for name in ("a", "b")
+    }
+    data = {"current": {}, "desired": desired, "use_admin_token": {}}
+
+    actions = sut._realize_resource_data_3way_diff(
+        ri_item=("test-cluster", "test-namespace", "ConfigMap", data),
+        oc_map=oc_map,
+        ri=resource_inventory,
+        options=apply_options,
+    )
+
+    assert len(actions) == 2
+    oc_cs1.apply_batch.assert_called_once()
+    assert apply_options.pending_applies is None
+    already_applied = {
+        c.kwargs["resource"].name: c.kwargs["already_applied"]
+        for c in apply_mock.call_args_list
+    }
+    assert already_applied == {"a": True, "b": False}
+
+
 @pytest.mark.parametrize(
     ("kind", "annotation"),
     [
@@ -1438,6 +1638,7 @@ def test_realize_resource_data_3way_diff_keep_recycle_annotations(
         wait_for_namespace=True,
         recycle_pods=True,
         privileged=False,
+        already_applied=False,
     )
 
 
@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import pytest
 
 from reconcile.utils.openshift_resource import (
@@ -11,6 +15,9 @@ from reconcile.utils.semver_helper import make_semver
 
 from .fixtures import Fixtures
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
 fxt = Fixtures("openshift_resource")
 
 TEST_INT = "test_openshift_resources"
@@ -188,6 +195,36 @@ def test_sha256sum() -> None:
     assert not annotated.has_valid_sha256sum()
 
 
+def test_sha256sum_is_cached(mocker: MockerFixture) -> None:
+    openshift_resource = build_resource("ConfigMap", "v1", "cm")
+    canonicalize = mocker.spy(OR, "canonicalize")
+
+    sha256sum = openshift_resource.sha256sum()
+    assert openshift_resource.sha256sum() == sha256sum
+    assert openshift_resource.annotate().sha256sum() == sha256sum
+    assert canonicalize.call_count == 1
+
+
+def test_sha256sum_cache_invalidated_on_body_change() -> None:
+    openshift_resource = build_resource("ConfigMap", "v1", "cm")
+    sha256sum = openshift_resource.sha256sum()
+
+    openshift_resource.body |= {"data": {"k": "v"}}
+    changed = openshift_resource.sha256sum()
+    assert changed != sha256sum
+
+    openshift_resource.body["data"]["k"] = "other"
+    assert openshift_resource.sha256sum() == changed
+    openshift_resource.invalidate_cache()
+    assert openshift_resource.sha256sum() not in {sha256sum, changed}
+
+
+def test_openshift_resource_slots() -> None:
+    openshift_resource = build_resource("ConfigMap", "v1", "cm")
+    with pytest.raises(AttributeError):
+        openshift_resource.foo = "bar"  # type: ignore[attr-defined]
+
+
 def test_has_owner_reference_true() -> None:
     resource = {
         "kind": "kind",
@@ -11,7 +11,9 @@ from unittest.mock import (
 )
 
 import pytest
+from kubernetes.client.exceptions import ApiException
 from kubernetes.dynamic import Resource
+from kubernetes.dynamic.exceptions import ForbiddenError, GoneError
 
 from reconcile import openshift_resources_base as orb
 from reconcile.openshift_base import CurrentStateSpec
@@ -28,7 +30,7 @@ from reconcile.utils.openshift_resource import OpenshiftResource as OR
 from reconcile.utils.openshift_resource import ResourceInventory
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Iterator, Mapping, Sequence
 
     from pytest_mock import MockerFixture
 
@@ -48,7 +50,7 @@ def oc_cs1(mocker: MockerFixture) -> oc.OCClient:
         "Template": ["template.openshift.io/v1"],
         "Subscription": ["apps.open-cluster-management.io/v1", "operators.coreos.com"],
     }
-    client.get_items.return_value = []
+    client.iter_items.return_value = []
     return client
 
 
@@ -146,7 +148,7 @@ def test_fetch_current_state_ri_not_initialized(
     oc_cs1: MagicMock, tmpl1: dict[str, Any]
 ) -> None:
     ri = ResourceInventory()
-    oc_cs1.get_items.return_value = [tmpl1]
+    oc_cs1.iter_items.return_value = [tmpl1]
     ri.initialize_resource_type("cs1", "wrong_namespace", "Template")
     ri.initialize_resource_type("wrong_cluster", "ns1", "Template")
     ri.initialize_resource_type("cs1", "ns1", "wrong_kind")
@@ -169,7 +171,7 @@ def test_fetch_current_state_ri_initialized(
 ) -> None:
     ri = ResourceInventory()
     ri.initialize_resource_type("cs1", "ns1", "Template")
-    oc_cs1.get_items.return_value = [tmpl1]
+    oc_cs1.iter_items.return_value = [tmpl1]
     orb.fetch_current_state(
         oc=oc_cs1,
         ri=ri,
@@ -191,7 +193,7 @@ def test_fetch_current_state_kind_not_supported(
 ) -> None:
     ri = ResourceInventory()
     ri.initialize_resource_type("cs1", "ns1", "AnUnsupportedKind")
-    oc_cs1.get_items.return_value = [tmpl1]
+    oc_cs1.iter_items.return_value = [tmpl1]
     orb.fetch_current_state(
         oc=oc_cs1,
         ri=ri,
@@ -210,7 +212,7 @@ def test_fetch_current_state_long_kind(
 ) -> None:
     ri = ResourceInventory()
     ri.initialize_resource_type("cs1", "ns1", "Template.template.openshift.io")
-    oc_cs1.get_items.return_value = [tmpl1]
+    oc_cs1.iter_items.return_value = [tmpl1]
     orb.fetch_current_state(
         oc=oc_cs1,
         ri=ri,
@@ -232,7 +234,7 @@ def test_fetch_current_state_long_kind_not_supported(
 ) -> None:
     ri = ResourceInventory()
     ri.initialize_resource_type("cs1", "ns1", "UnknownKind.mysterious.io")
-    oc_cs1.get_items.return_value = [tmpl1]
+    oc_cs1.iter_items.return_value = [tmpl1]
     orb.fetch_current_state(
         oc=oc_cs1,
         ri=ri,
@@ -251,7 +253,7 @@ def test_fetch_states(
 ) -> None:
     ri = ResourceInventory()
     ri.initialize_resource_type("cs1", "ns1", "Template")
-    current_state_spec.oc.get_items = lambda kind, **kwargs: [tmpl1]  # type: ignore[method-assign]
+    current_state_spec.oc.iter_items = lambda kind, **kwargs: iter([tmpl1])  # type: ignore[method-assign]
     orb.fetch_states(ri=ri, spec=current_state_spec, cache=orb.Jinja2TemplateCache())
     _, _, _, resource = next(iter(ri))
     assert len(resource["current"]) == 1
@@ -269,7 +271,7 @@ def test_fetch_states_unknown_kind(current_state_spec: CurrentStateSpec) -> None
 
 
 def test_fetch_states_oc_error(current_state_spec: CurrentStateSpec) -> None:
-    current_state_spec.oc.get_items = Mock(  # type: ignore[method-assign]
+    current_state_spec.oc.iter_items = Mock(  # type: ignore[method-assign]
         side_effect=oc.StatusCodeError("something wrong with openshift")
     )
     ri = ResourceInventory()
@@ -280,6 +282,36 @@ def test_fetch_states_oc_error(current_state_spec: CurrentStateSpec) -> None:
     assert len(resource["current"]) == 0
 
 
+@pytest.mark.parametrize(
+    "error",
+    [
+        ForbiddenError(ApiException(status=403, reason="Forbidden")),
+        GoneError(ApiException(status=410, reason="Expired")),
+        oc.StatusCodeError("something wrong with openshift"),
+    ],
+)
+def test_fetch_states_cluster_error_after_items(
+    current_state_spec: CurrentStateSpec, tmpl1: dict[str, Any], error: Exception
+) -> None:
+    def iter_items(kind: str, **kwargs: Any) -> Iterator[dict[str, Any]]:
+        yield tmpl1 | {"metadata": {"name": "tmpl1", "namespace": "ns1"}}
+        raise error
+
+    current_state_spec.oc.iter_items = iter_items  # type: ignore[method-assign]
+    ri = ResourceInventory()
+    ri.initialize_resource_type("cs1", "ns1", "Template")
+    spec = ob.ClusterCurrentStateSpec(
+        oc=current_state_spec.oc,
+        cluster="cs1",
+        kind="Template",
+        specs=[current_state_spec],
+    )
+
+    orb.fetch_states(ri=ri, spec=spec, cache=orb.Jinja2TemplateCache())
+
+    assert ri.has_error_registered("cs1")
+
+
 @pytest.fixture
 def nss_csr_overrides() -> list[dict[str, Any]]:
     return [fxt.get_anymarkup("ns-overrides-cluster-resources.yml")]
@@ -551,7 +583,7 @@ def test_fetch_current_state_skips_argocd_managed(oc_cs1: oc.OCClient) -> None:
             "labels": {"app.kubernetes.io/part-of": "argocd"},
         },
     }
-    oc_cs1.get_items = lambda kind, **kwargs: [argocd_labeled_resource]  # type: ignore[method-assign]
+    oc_cs1.iter_items = lambda kind, **kwargs: iter([argocd_labeled_resource])  # type: ignore[method-assign]
     orb.fetch_current_state(
         oc=oc_cs1,
         ri=ri,
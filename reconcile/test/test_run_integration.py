@@ -1,8 +1,19 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
 import click
+import requests
+
+from reconcile.run_integration import (
+    RunTrigger,
+    ShaWatcher,
+    build_entry_point_args,
+)
 
-from reconcile.run_integration import build_entry_point_args
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
 
 
 @click.group()
@@ -48,3 +59,70 @@ def test_build_entry_point_args_keeps_quoted_arg_with_spaces_as_one_token() -> N
         "--keycloak-instances",
         '{"url": "https://example.com", "secret": {"a": "b"}}',
     ]
+
+
+def _sha_watcher(
+    mocker: MockerFixture,
+    shas: list[str | Exception],
+    commit_info: dict[str, str] | Exception | None = None,
+) -> ShaWatcher:
+    mocker.patch("reconcile.run_integration.get_sha", side_effect=shas)
+    mocker.patch(
+        "reconcile.run_integration.get_git_commit_info",
+        side_effect=[commit_info if commit_info is not None else {}],
+    )
+    mocker.patch("reconcile.run_integration.time.sleep")
+    return ShaWatcher(urlparse("http://localhost/graphql"), None, poll_interval=1)
+
+
+def test_sha_watcher_triggers_on_sha_change(mocker: MockerFixture) -> None:
+    watcher = _sha_watcher(mocker, ["a", "a", "a", "b"])
+
+    assert watcher.start_run() is None
+    assert watcher.wait(timeout=600) == RunTrigger.SHA_CHANGE
+    assert watcher.changed_at is not None
+
+    assert watcher.start_run() is not None
+    assert watcher.last_sha == "b"
+    assert watcher.changed_at is None
+
+
+def test_sha_watcher_latency_from_commit_time(mocker: MockerFixture) -> None:
+    watcher = _sha_watcher(mocker, ["a", "b"], commit_info={"timestamp": "1000"})
+    mocker.patch("reconcile.run_integration.time.time", return_value=1042.0)
+
+    watcher.start_run()
+    assert watcher.wait(timeout=600) == RunTrigger.SHA_CHANGE
+    assert watcher.start_run() == 42.0
+
+
+def test_sha_watcher_latency_without_commit_info(mocker: MockerFixture) -> None:
+    watcher = _sha_watcher(
+        mocker, ["a", "b"], commit_info=requests.exceptions.HTTPError("boom")
+    )
+    mocker.patch("reconcile.run_integration.time.time", side_effect=[1000.0, 1005.0])
+
+    watcher.start_run()
+    assert watcher.wait(timeout=600) == RunTrigger.SHA_CHANGE
+    assert watcher.start_run() == 5.0
+
+
+def test_sha_watcher_periodic_run_on_timeout(mocker: MockerFixture) -> None:
+    watcher = _sha_watcher(mocker, ["a"] * 10)
+    mocker.patch(
+        "reconcile.run_integration.time.monotonic", side_effect=[0, 0, 1, 2, 3]
+    )
+
+    watcher.start_run()
+    assert watcher.wait(timeout=2) == RunTrigger.PERIODIC
+
+
+def test_sha_watcher_ignores_poll_errors(mocker: MockerFixture) -> None:
+    watcher = _sha_watcher(
+        mocker, [requests.exceptions.ConnectionError("boom"), "a", "a", "b"]
+    )
+
+    watcher.start_run()
+    assert watcher.last_sha is None
+    assert watcher.wait(timeout=600) == RunTrigger.SHA_CHANGE
+    assert watcher.last_sha == "b"
@@ -28,6 +28,8 @@ from reconcile.typed_queries.saas_files import (
     SaasFile,
     SaasResourceTemplate,
 )
+from reconcile.utils.content_cache import ContentCache
+from reconcile.utils.image_cache import ImageCache, ImageManifest
 from reconcile.utils.jenkins_api import JobBuildState
 from reconcile.utils.jjb_client import JJB
 from reconcile.utils.openshift_resource import ResourceInventory
@@ -54,6 +56,7 @@ if TYPE_CHECKING:
     )
 
     from pydantic import BaseModel
+    from pytest_mock import MockerFixture
 
     from reconcile.utils.saasherder.interfaces import SaasFile as SaasFileInterface
 
@@ -1959,3 +1962,177 @@ def test_render_templated_parameters_in_init(
             },
         ),
     ]
+
+
+@pytest.fixture
+def image_cache(mocker: MockerFixture) -> ImageCache:
+    cache = ImageCache()
+    mocker.patch(
+        "reconcile.utils.saasherder.saasherder.image_cache.get_cache",
+        return_value=cache,
+    )
+    return cache
+
+
+def test_get_and_validate_image_is_cached(
+    mocker: MockerFixture, image_cache: ImageCache
+) -> None:
+    image = mocker.patch("reconcile.utils.saasherder.saasherder.Image")
+    image.return_value.digest = "sha256:abc"
+    image.return_value.url_digest = "quay.io/org/app@sha256:abc"
+
+    results = [
+        SaasHerder._get_and_validate_image(
+            full_image_path="quay.io/org/app:1234567",
+            username="user",
+            password="pass",
+            auth_server=None,
+            timeout=60,
+            error_prefix="[test]",
+        )
+        for _ in range(3)
+    ]
+
+    assert (
+        results
+        == [
+            ImageManifest(
+                url="quay.io/org/app:1234567",
+                digest="sha256:abc",
+                url_digest="quay.io/org/app@sha256:abc",
+            )
+        ]
+        * 3
+    )
+    image.assert_called_once()
+
+
+def test_get_and_validate_image_persists_commit_sha_tags(
+    mocker: MockerFixture, image_cache: ImageCache
+) -> None:
+    image = mocker.patch("reconcile.utils.saasherder.saasherder.Image")
+    image.return_value.digest = "sha256:abc"
+    image.return_value.url_digest = "quay.io/org/app@sha256:abc"
+    get = mocker.spy(image_cache, "get")
+
+    for tag in ("1234567", "a" * 40):
+        SaasHerder._get_and_validate_image(
+            full_image_path=f"quay.io/org/app:{tag}",
+            username=None,
+            password=None,
+            auth_server=None,
+            timeout=60,
+            error_prefix="[test]",
+        )
+
+    assert [c.kwargs["immutable"] for c in get.call_args_list] == [False, True]
+
+
+def test_get_and_validate_image_missing(
+    mocker: MockerFixture, image_cache: ImageCache
+) -> None:
+    image = mocker.patch("reconcile.utils.saasherder.saasherder.Image")
+    image.return_value.__bool__.return_value = False
+
+    assert (
+        SaasHerder._get_and_validate_image(
+            full_image_path="quay.io/org/app:1234567",
+            username=None,
+            password=None,
+            auth_server=None,
+            timeout=60,
+            error_prefix="[test]",
+        )
+        is None
+    )
+
+
+@pytest.fixture
+def template_cache(mocker: MockerFixture) -> ContentCache:
+    cache = ContentCache(name="test", max_memory_bytes=1024 * 1024)
+    mocker.patch(
+        "reconcile.utils.saasherder.saasherder.template_cache",
+        return_value=cache,
+    )
+    return cache
+
+
+@pytest.fixture
+def saasherder(
+    gql_class_factory: Callable[..., SaasFile],
+) -> SaasHerder:
+    saas_file = gql_class_factory(
+        SaasFile,
+        Fixtures("saasherder").get_anymarkup("saas-templated-params.gql.yml"),
+    )
+    return SaasHerder(
+        [saas_file],
+        secret_reader=MockSecretReader(),
+        thread_pool_size=1,
+        integration="",
+        integration_version="",
+        hash_length=7,
+        repo_url="https://repo-url.com",
+    )
+
+
+def test_get_commit_sha_short_circuits_full_sha(saasherder: SaasHerder) -> None:
+    github = MagicMock()
+    sha = "a" * 40
+
+    assert saasherder._get_commit_sha("https://github.com/org/repo", sha, github) == sha
+    github.get_repo.assert_not_called()
+
+
+def test_get_file_contents_is_cached(
+    mocker: MockerFixture,
+    saasherder: SaasHerder,
+    template_cache: ContentCache,
+) -> None:
+    get_raw_file = mocker.patch(
+        "reconcile.utils.saasherder.saasherder.GithubRepositoryApi.get_raw_file",
+        return_value=b"kind: Template\n",
+    )
+    github = MagicMock()
+    sha = "a" * 40
+
+    for _ in range(3):
+        template, commit_sha = saasherder._get_file_contents(
+            "https://github.com/org/repo", "/template.yaml", sha, github
+        )
+        assert template == {"kind": "Template"}
+        assert commit_sha == sha
+
+    get_raw_file.assert_called_once()
+
+
+def test_get_directory_contents_is_cached(
+    mocker: MockerFixture,
+    saasherder: SaasHerder,
+    template_cache: ContentCache,
+) -> None:
+    get_raw_file = mocker.patch(
+        "reconcile.utils.saasherder.saasherder.GithubRepositoryApi.get_raw_file",
+        side_effect=[
+            # not utf-8, yaml detects the encoding by the byte order mark
+            "kind: ConfigMap\n".encode("utf-16"),
+            b"kind: Secret\n---\nkind: Service\n",
+        ],
+    )
+    github = MagicMock()
+    file_a, file_b = MagicMock(), MagicMock()
+    file_a.name, file_b.name = "a.yaml", "b.yaml"
+    github.get_repo.return_value.get_contents.return_value = [file_a, file_b]
+    sha = "a" * 40
+
+    for _ in range(2):
+        resources, _ = saasherder._get_directory_contents(
+            "https://github.com/org/repo", "/resources", sha, github
+        )
+        assert resources == [
+            {"kind": "ConfigMap"},
+            {"kind": "Secret"},
+            {"kind": "Service"},
+        ]
+
+    assert get_raw_file.call_count == 2
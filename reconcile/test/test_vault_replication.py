@@ -16,6 +16,7 @@ from reconcile.gql_definitions.jenkins_configs.jenkins_configs import (
 from reconcile.gql_definitions.vault_instances.vault_instances import (
     VaultPolicyV1,
     VaultPolicyV1_VaultInstanceV1,
+    VaultReplicationConfigV1,
     VaultReplicationConfigV1_VaultInstanceAuthV1,
     VaultReplicationConfigV1_VaultInstanceAuthV1_VaultInstanceAuthApproleV1,
 )
@@ -587,3 +588,80 @@ def test_get_policy_secret_list_failure(
     vault_client = mocker.patch("reconcile.utils.vault.VaultClient", autospec=True)
     with pytest.raises(integ.VaultInvalidPathsError):
         integ.get_policy_secret_list(vault_client, paths)
+
+
+def test_copy_vault_secret_already_replicated_v2(mocker: MockerFixture) -> None:
+    vault_client = mocker.patch("reconcile.utils.vault.VaultClient", autospec=True)
+    vault_client.read_all_with_version.return_value = ["secret", 2]
+    deep_copy_versions = mocker.patch(
+        "reconcile.vault_replication.deep_copy_versions", autospec=True
+    )
+
+    version = integ.copy_vault_secret(
+        dry_run=False,
+        source_vault=vault_client,
+        dest_vault=vault_client,
+        path="path",
+        replicated_version=2,
+    )
+
+    assert version == 2
+    # the destination vault is not read
+    vault_client.read_all_with_version.assert_called_once()
+    deep_copy_versions.assert_not_called()
+
+
+def test_replicate_secrets_updates_index(mocker: MockerFixture) -> None:
+    vault_client = mocker.patch("reconcile.utils.vault.VaultClient", autospec=True)
+    copy_vault_secret = mocker.patch(
+        "reconcile.vault_replication.copy_vault_secret",
+        autospec=True,
+        side_effect=lambda dry_run, source, dest, path, replicated_version: {
+            "unchanged": 3,
+            "changed": 5,
+            "v1": None,
+        }[path],
+    )
+    index = {"unchanged": 3, "changed": 4, "v1": 1, "removed": 1}
+
+    integ.replicate_secrets(
+        dry_run=False,
+        source_vault=vault_client,
+        dest_vault=vault_client,
+        path_list=["unchanged", "changed", "v1"],
+        index=index,
+    )
+
+    assert index == {"unchanged": 3, "changed": 5}
+    assert sorted(c.args[3:] for c in copy_vault_secret.call_args_list) == [
+        ("changed", 4),
+        ("unchanged", 3),
+        ("v1", 1),
+    ]
+
+
+def replication(policy: str) -> VaultReplicationConfigV1:
+    auth = {"provider": "approle", "secretEngine": "kv_v2"}
+    return VaultReplicationConfigV1.model_validate({
+        "vaultInstance": {"name": "dest", "address": "https://dest", "auth": auth},
+        "sourceAuth": auth,
+        "destAuth": auth,
+        "paths": [
+            {
+                "provider": "policy",
+                "policy": {
+                    "name": policy,
+                    "instance": {"name": "source", "address": "https://source"},
+                    "rules": f'path "{policy}/*" {{}}',
+                },
+            }
+        ],
+    })
+
+
+def test_index_key_per_replication() -> None:
+    key = integ.index_key("source", replication("a"))
+
+    assert key.startswith("index/source/dest/")
+    assert key == integ.index_key("source", replication("a"))
+    assert key != integ.index_key("source", replication("b"))
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Any
 import pytest
 
 from reconcile.utils.jobcontroller.controller import K8sJobController
-from reconcile.utils.oc import OCCli
+from reconcile.utils.oc import OCCli, OCNative
 
 if TYPE_CHECKING:
     from pytest_mock import MockerFixture
@@ -19,6 +19,11 @@ def oc(mocker: MockerFixture) -> OCCli:
     return oc
 
 
+@pytest.fixture
+def native_oc(mocker: MockerFixture) -> OCNative:
+    return mocker.create_autospec(OCNative)
+
+
 OCItemSetter = Callable[[list[list[dict[str, Any]]]], None]
 
 
@@ -49,6 +54,21 @@ def controller(oc: OCCli, mocker: MockerFixture) -> K8sJobController:
     return controller
 
 
+@pytest.fixture
+def native_controller(native_oc: OCNative, mocker: MockerFixture) -> K8sJobController:
+    controller = K8sJobController(
+        oc=native_oc,
+        cluster="some-cluster",
+        namespace="some-ns",
+        integration="some-integration",
+        integration_version="0.1",
+        dry_run=False,
+        time_module=TimeMock(),
+    )
+    mocker.patch.object(controller, "_lookup_job_uid", return_value="some-uid")
+    return controller
+
+
 class TimeMock:
     def __init__(self) -> None:
         self.current_time = 0.0
@@ -15,10 +15,14 @@ from reconcile.utils.jobcontroller.models import (
     JobStatus,
     JobValidationError,
 )
+from reconcile.utils.oc import WatchExpiredError
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from reconcile.test.utils.jobcontroller.conftest import OCItemSetter
     from reconcile.utils.jobcontroller.controller import K8sJobController
+    from reconcile.utils.oc import OCNative
 
 #
 # enqueue_job
@@ -297,6 +301,123 @@ def test_controller_wait_for_job_list_completion_no_timeout(
     assert controller.time_module.time() == 5
 
 
+#
+# watch mode
+#
+
+
+def watch_event(
+    event_type: str, job: SomeJob, status: dict[str, Any], resource_version: str
+) -> tuple[str, dict[str, Any]]:
+    job_resource = build_job_resource(job, status)
+    job_resource["metadata"]["resourceVersion"] = resource_version
+    return event_type, job_resource
+
+
+def test_controller_watch_wait_for_completion(
+    native_controller: K8sJobController, native_oc: OCNative
+) -> None:
+    controller, oc = native_controller, native_oc
+    job = SomeJob(identifying_attribute="some-id", description="some-description")
+    other = SomeJob(identifying_attribute="other-id", description="some-description")
+    oc.list_items.return_value = (  # type: ignore[attr-defined]
+        [build_job_resource(job, build_job_status(active=1))],
+        "1",
+    )
+    oc.watch_items.side_effect = [  # type: ignore[attr-defined]
+        iter([
+            watch_event("ADDED", other, build_job_status(active=1), "2"),
+            watch_event("MODIFIED", job, build_job_status(succeeded=1), "3"),
+            watch_event("MODIFIED", other, build_job_status(succeeded=1), "4"),
+        ])
+    ]
+
+    assert controller.wait_for_job_completion(
+        job.name(), check_interval_seconds=5, timeout_seconds=100
+    )
+
+    oc.list_items.assert_called_once_with(kind="Job.batch", namespace="some-ns")  # type: ignore[attr-defined]
+    oc.watch_items.assert_called_once_with(  # type: ignore[attr-defined]
+        kind="Job.batch",
+        namespace="some-ns",
+        resource_version="1",
+        timeout_seconds=5,
+    )
+    oc.get_items.assert_not_called()  # type: ignore[attr-defined]
+    # the watch stops as soon as the job finished
+    assert controller.get_job_status(other.name()) == JobStatus.IN_PROGRESS
+
+
+def test_controller_watch_expired_lists_jobs_again(
+    native_controller: K8sJobController, native_oc: OCNative
+) -> None:
+    controller, oc = native_controller, native_oc
+    job1 = SomeJob(identifying_attribute="some-id-1", description="some-description")
+    job2 = SomeJob(identifying_attribute="some-id-2", description="some-description")
+    oc.list_items.side_effect = [  # type: ignore[attr-defined]
+        (
+            [
+                build_job_resource(job1, build_job_status(active=1)),
+                build_job_resource(job2, build_job_status(active=1)),
+            ],
+            "1",
+        ),
+        (
+            [
+                build_job_resource(job1, build_job_status(succeeded=1)),
+                build_job_resource(job2, build_job_status(active=1)),
+            ],
+            "5",
+        ),
+    ]
+    oc.watch_items.side_effect = [  # type: ignore[attr-defined]
+        WatchExpiredError("watch of Job.batch expired"),
+        iter([watch_event("MODIFIED", job2, build_job_status(failed=1), "6")]),
+    ]
+
+    expected = {
+        job1.name(): JobStatus.SUCCESS,
+        job2.name(): JobStatus.ERROR,
+    }
+    assert expected == controller.wait_for_job_list_completion(
+        {job1.name(), job2.name()},
+        check_interval_seconds=5,
+        timeout_seconds=-1,
+    )
+    assert oc.list_items.call_count == 2  # type: ignore[attr-defined]
+    assert oc.watch_items.call_args.kwargs["resource_version"] == "5"  # type: ignore[attr-defined]
+
+
+def test_controller_watch_timeout_clamped_to_remaining_time(
+    native_controller: K8sJobController, native_oc: OCNative
+) -> None:
+    time_module = native_controller.time_module
+    job = SomeJob(identifying_attribute="some-id", description="some-description")
+    native_oc.list_items.return_value = (  # type: ignore[attr-defined]
+        [build_job_resource(job, build_job_status(active=1))],
+        "1",
+    )
+
+    def watch_items(**kwargs: Any) -> Iterator[tuple[str, dict[str, Any]]]:
+        # the watch returns a bit after its timeout
+        time_module.sleep(kwargs["timeout_seconds"] + 0.25)
+        return iter([])
+
+    native_oc.watch_items.side_effect = watch_items  # type: ignore[attr-defined]
+
+    with pytest.raises(TimeoutError):
+        native_controller.wait_for_job_completion(
+            job.name(), check_interval_seconds=5, timeout_seconds=8
+        )
+
+    assert [
+        c.kwargs["timeout_seconds"]
+        for c in native_oc.watch_items.call_args_list  # type: ignore[attr-defined]
+    ] == [5, 2]
+    # the remainder below the watch resolution is slept
+    assert time_module.time() == 8
+
+
 #
 # build secret
 #
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from reconcile.utils.content_cache import ContentCache, cache_key
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+def test_cache_key() -> None:
+    assert cache_key("a", "b") == cache_key("a", "b")
+    assert cache_key("a", "b") != cache_key("ab", "")
+    assert cache_key("a", "b") != cache_key("b", "a")
+
+
+def test_content_cache_memory_tier() -> None:
+    cache = ContentCache(name="test", max_memory_bytes=10)
+    cache.set("a", b"12345")
+    cache.set("b", b"12345")
+    cache.set("c", b"12345")
+
+    assert cache.get("a") is None
+    assert cache.get("b") == b"12345"
+    assert cache.get("c") == b"12345"
+
+
+def test_content_cache_skips_oversized_entries(tmp_path: Path) -> None:
+    cache = ContentCache(
+        name="test", max_memory_bytes=4, cache_dir=str(tmp_path), max_disk_bytes=4
+    )
+    cache.set("a", b"12345")
+
+    assert cache.get("a") is None
+    assert not list(tmp_path.iterdir())
+
+
+def test_content_cache_disk_tier(tmp_path: Path) -> None:
+    ContentCache(
+        name="test", max_memory_bytes=100, cache_dir=str(tmp_path), max_disk_bytes=100
+    ).set("a", b"12345")
+
+    cache = ContentCache(
+        name="test", max_memory_bytes=100, cache_dir=str(tmp_path), max_disk_bytes=100
+    )
+    assert cache.get("a") == b"12345"
+
+
+def test_content_cache_delete(tmp_path: Path) -> None:
+    cache = ContentCache(
+        name="test", max_memory_bytes=100, cache_dir=str(tmp_path), max_disk_bytes=100
+    )
+    cache.set("a", b"12345")
+    cache.delete("a")
+    cache.delete("missing")
+
+    assert cache.get("a") is None
+    assert not list(tmp_path.iterdir())
+
+
+def test_content_cache_disk_eviction_tracks_size(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    cache = ContentCache(
+        name="test", max_memory_bytes=100, cache_dir=str(tmp_path), max_disk_bytes=10
+    )
+    evict_disk = mocker.spy(cache, "_evict_disk")
+    cache.set("a", b"1234")
+    cache.set("a", b"12345")
+    cache.set("b", b"12345")
+    assert evict_disk.call_count == 1
+
+    cache.set("c", b"12345")
+    assert evict_disk.call_count == 2
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["b", "c"]
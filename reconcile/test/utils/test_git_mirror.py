@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from reconcile.utils.git import GitError
+from reconcile.utils.git_mirror import GitMirror
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def commit(repo: Path, content: str) -> str:
+    (repo / "chart").mkdir(exist_ok=True)
+    (repo / "chart" / "Chart.yaml").write_text(content, encoding="utf-8")
+    git(repo, "add", "-A")
+    git(
+        repo,
+        "-c",
+        "user.name=test",
+        "-c",
+        "user.email=test@example.com",
+        "commit",
+        "--quiet",
+        "-m",
+        content,
+    )
+    return git(repo, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def upstream(tmp_path: Path) -> Path:
+    repo = tmp_path / "upstream"
+    repo.mkdir()
+    git(repo, "init", "--quiet", "--initial-branch", "main")
+    git(repo, "config", "uploadpack.allowAnySHA1InWant", "true")
+    return repo
+
+
+@pytest.fixture
+def mirror(tmp_path: Path) -> GitMirror:
+    return GitMirror(base_dir=str(tmp_path / "mirrors"))
+
+
+def read_chart(wd: str) -> str:
+    return (Path(wd) / "chart" / "Chart.yaml").read_text(encoding="utf-8")
+
+
+def test_checkout_branch(upstream: Path, mirror: GitMirror) -> None:
+    url = f"file://{upstream}"
+    commit(upstream, "v1")
+    with mirror.checkout(url, "main") as wd:
+        assert read_chart(wd) == "v1"
+
+    # branches are fetched again
+    commit(upstream, "v2")
+    with mirror.checkout(url, "main") as wd:
+        assert read_chart(wd) == "v2"
+
+
+def test_checkout_sha_is_fetched_once(
+    mocker: MockerFixture, upstream: Path, mirror: GitMirror
+) -> None:
+    url = f"file://{upstream}"
+    sha = commit(upstream, "v1")
+    commit(upstream, "v2")
+    run = mocker.spy(subprocess, "run")
+
+    with mirror.checkout(url, sha) as wd:
+        assert read_chart(wd) == "v1"
+    with mirror.checkout(url, sha) as wd:
+        assert read_chart(wd) == "v1"
+
+    fetches = [c for c in run.call_args_list if "fetch" in c.args[0]]
+    assert len(fetches) == 1
+
+
+def test_checkout_is_private(upstream: Path, mirror: GitMirror) -> None:
+    url = f"file://{upstream}"
+    sha = commit(upstream, "v1")
+    with mirror.checkout(url, sha) as wd:
+        (Path(wd) / "chart" / "Chart.yaml").write_text("changed", encoding="utf-8")
+    with mirror.checkout(url, sha) as wd:
+        assert read_chart(wd) == "v1"
+    assert not Path(wd).exists()
+
+
+def test_checkout_matches_clone(upstream: Path, mirror: GitMirror) -> None:
+    url = f"file://{upstream}"
+    (upstream / ".gitattributes").write_text(
+        "chart/Chart.yaml export-ignore\n", encoding="utf-8"
+    )
+    (upstream / "run.sh").write_text("#!/bin/sh\n", encoding="utf-8")
+    (upstream / "run.sh").chmod(0o755)
+    sha = commit(upstream, "v1")
+
+    with mirror.checkout(url, sha) as wd:
+        # export-ignore only applies to git archive
+        assert read_chart(wd) == "v1"
+        assert (Path(wd) / ".gitattributes").exists()
+        assert (Path(wd) / "run.sh").stat().st_mode & 0o111
+        assert sorted(p.name for p in Path(wd).iterdir()) == [
+            ".gitattributes",
+            "chart",
+            "run.sh",
+        ]
+
+
+def test_checkout_unknown_ref(upstream: Path, mirror: GitMirror) -> None:
+    commit(upstream, "v1")
+    with (
+        pytest.raises(GitError, match="git fetch failed"),
+        mirror.checkout(f"file://{upstream}", "does-not-exist"),
+    ):
+        pass
+
+
+def test_checkout_evicts_least_recently_used(tmp_path: Path, upstream: Path) -> None:
+    other = tmp_path / "other"
+    other.mkdir()
+    git(other, "init", "--quiet", "--initial-branch", "main")
+    commit(other, "other")
+    commit(upstream, "v1")
+    mirror = GitMirror(base_dir=str(tmp_path / "mirrors"), max_disk_bytes=1)
+
+    with mirror.checkout(f"file://{other}", "main"):
+        pass
+    with mirror.checkout(f"file://{upstream}", "main"):
+        pass
+
+    # only the repository in use is kept
+    assert len(list((tmp_path / "mirrors").glob("*.git"))) == 1
+    with mirror.checkout(f"file://{other}", "main") as wd:
+        assert read_chart(wd) == "other"
@@ -591,7 +591,7 @@ def test_get_merge_requests(
     project.mergerequests.list.assert_called_once_with(state="opened", get_all=True)
 
 
-def test_get_merge_request_label_events() -> None:
+def test_get_merge_request_label_events(mocked_gitlab_api: GitLabApi) -> None:
     mr = create_autospec(ProjectMergeRequest)
     mr.resourcelabelevents = create_autospec(
         ProjectMergeRequestResourceLabelEventManager
@@ -599,13 +599,13 @@ def test_get_merge_request_label_events() -> None:
     expected_event = create_autospec(ProjectMergeRequestResourceLabelEvent)
     mr.resourcelabelevents.list.return_value = [expected_event]
 
-    events = GitLabApi.get_merge_request_label_events(mr)
+    events = mocked_gitlab_api.get_merge_request_label_events(mr)
 
     assert events == [expected_event]
     mr.resourcelabelevents.list.assert_called_once_with(get_all=True)
 
 
-def test_get_merge_request_pipelines() -> None:
+def test_get_merge_request_pipelines(mocked_gitlab_api: GitLabApi) -> None:
     mr = create_autospec(ProjectMergeRequest)
     mr.pipelines = create_autospec(ProjectMergeRequestPipelineManager)
 
@@ -622,12 +622,135 @@ def test_get_merge_request_pipelines() -> None:
 
     mr.pipelines.list.return_value = [pipeline_1, pipeline_2]
 
-    pipelines = GitLabApi.get_merge_request_pipelines(mr)
+    pipelines = mocked_gitlab_api.get_merge_request_pipelines(mr)
 
     assert pipelines == [pipeline_2, pipeline_1]
     mr.pipelines.list.assert_called_once_with(iterator=True)
 
 
+def graphql_pipeline(pipeline_id: int, created_at: str) -> dict[str, Any]:
+    return {
+        "id": f"gid://gitlab/Ci::Pipeline/{pipeline_id}",
+        "iid": str(pipeline_id),
+        "sha": "abc",
+        "status": "SUCCESS",
+        "source": "merge_request_event",
+        "createdAt": created_at,
+        "updatedAt": created_at,
+        "path": f"/group/project/-/pipelines/{pipeline_id}",
+    }
+
+
+def graphql_merge_requests_page(
+    nodes: list[dict[str, Any]], end_cursor: str | None
+) -> dict[str, Any]:
+    return {
+        "data": {
+            "project": {
+                "mergeRequests": {
+                    "pageInfo": {
+                        "hasNextPage": end_cursor is not None,
+                        "endCursor": end_cursor,
+                    },
+                    "nodes": nodes,
+                }
+            }
+        }
+    }
+
+
+@pytest.fixture
+def merge_requests_snapshot(mocked_gitlab_api: GitLabApi, mocked_gl: Mock) -> GitLabApi:
+    mocked_gitlab_api.project.path_with_namespace = "group/project"
+    mocked_gl.http_post.side_effect = [
+        graphql_merge_requests_page(
+            [
+                {
+                    "iid": "1",
+                    "pipelines": {
+                        "nodes": [
+                            graphql_pipeline(11, "2025-01-01T00:00:00Z"),
+                            graphql_pipeline(12, "2025-01-02T00:00:00Z"),
+                        ]
+                    },
+                }
+            ],
+            end_cursor="cursor-1",
+        ),
+        graphql_merge_requests_page(
+            [{"iid": "2", "pipelines": {"nodes": []}}], end_cursor=None
+        ),
+    ]
+    mocked_gitlab_api.load_merge_requests_snapshot()
+    return mocked_gitlab_api
+
+
+def test_load_merge_requests_snapshot(
+    merge_requests_snapshot: GitLabApi, mocked_gl: Mock
+) -> None:
+    assert mocked_gl.http_post.call_count == 2
+    first, second = mocked_gl.http_post.call_args_list
+    assert first.args == ("http://some-url/api/graphql",)
+    assert first.kwargs["post_data"]["variables"] == {
+        "project": "group/project",
+        "state": "opened",
+        "first": 20,
+        "pipelines": 20,
+        "after": None,
+    }
+    assert second.kwargs["post_data"]["variables"]["after"] == "cursor-1"
+
+
+def test_get_merge_request_pipelines_from_snapshot(
+    merge_requests_snapshot: GitLabApi,
+) -> None:
+    mr = create_autospec(ProjectMergeRequest, iid=1)
+    mr.pipelines = create_autospec(ProjectMergeRequestPipelineManager)
+
+    pipelines = merge_requests_snapshot.get_merge_request_pipelines(mr)
+
+    assert [(p.id, p.status, p.web_url) for p in pipelines] == [
+        (12, "success", "http://some-url/group/project/-/pipelines/12"),
+        (11, "success", "http://some-url/group/project/-/pipelines/11"),
+    ]
+    mr.pipelines.list.assert_not_called()
+
+
+def test_get_merge_request_pipelines_not_in_snapshot(
+    merge_requests_snapshot: GitLabApi,
+) -> None:
+    mr = create_autospec(ProjectMergeRequest, iid=3)
+    mr.pipelines = create_autospec(ProjectMergeRequestPipelineManager)
+    mr.pipelines.list.return_value = []
+
+    assert merge_requests_snapshot.get_merge_request_pipelines(mr) == []
+    mr.pipelines.list.assert_called_once_with(iterator=True)
+
+
+def test_get_merge_request_label_events_from_snapshot(
+    merge_requests_snapshot: GitLabApi,
+) -> None:
+    mr = create_autospec(ProjectMergeRequest, iid=1)
+    mr.resourcelabelevents = create_autospec(
+        ProjectMergeRequestResourceLabelEventManager
+    )
+    mr.resourcelabelevents.list.return_value = []
+
+    for _ in range(3):
+        merge_requests_snapshot.get_merge_request_label_events(mr)
+
+    mr.resourcelabelevents.list.assert_called_once_with(get_all=True)
+
+
+def test_load_merge_requests_snapshot_graphql_error(
+    mocked_gitlab_api: GitLabApi, mocked_gl: Mock, patch_sleep: None
+) -> None:
+    mocked_gl.http_post.return_value = {"errors": [{"message": "too complex"}]}
+
+    with pytest.raises(GitlabGetError, match="too complex"):
+        mocked_gitlab_api.load_merge_requests_snapshot()
+
+
 def test_get_repository_tree_as_git_cli_interface(
     mocked_gitlab_api: GitLabApi,
     mocked_gl: Mock,
@@ -8,6 +8,8 @@ from gql import Client, gql
 from gql.transport.exceptions import TransportQueryError
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from graphql import ExecutionResult
     from pytest_httpserver import HTTPServer
     from pytest_mock import MockerFixture
@@ -19,6 +21,7 @@ from reconcile.utils.gql import (
     GqlApiIntegrationNotFoundError,
     PersistentRequestsHTTPTransport,
 )
+from reconcile.utils.gql_cache import GqlResultCache, cache_key, sha_from_url
 
 TEST_QUERY = """
 {
@@ -203,3 +206,133 @@ def test_gqlapi_query_full_stack_transport_error(httpserver: HTTPServer) -> None
     )
     with pytest.raises(GqlApiError, match="error.*returned with GraphQL response"):
         gql_api.query.__wrapped__(gql_api, SIMPLE_QUERY)  # type: ignore[attr-defined]
+
+
+# --- result cache ---
+
+SHA_URL = "http://localhost/graphqlsha/0123abcd"
+
+
+@pytest.fixture
+def result_cache(mocker: MockerFixture) -> GqlResultCache:
+    cache = GqlResultCache()
+    mocker.patch("reconcile.utils.gql.gql_cache.get_cache", return_value=cache)
+    return cache
+
+
+def test_sha_from_url() -> None:
+    assert sha_from_url(SHA_URL) == "0123abcd"
+    assert sha_from_url("http://localhost/graphql") is None
+
+
+def test_gqlapi_query_cached_for_sha_url(
+    mocker: MockerFixture, result_cache: GqlResultCache
+) -> None:
+    patched_client = mocker.patch("reconcile.utils.gql.Client.execute", autospec=True)
+    patched_client.return_value.formatted = {"data": {"__typename": "Query"}}
+    gql_api = GqlApi(SHA_URL, validate_schemas=False, use_cache=True)
+
+    first = gql_api.query.__wrapped__(gql_api, SIMPLE_QUERY)  # type: ignore[attr-defined]
+    first["__typename"] = "mutated"
+    second = gql_api.query.__wrapped__(gql_api, SIMPLE_QUERY)  # type: ignore[attr-defined]
+
+    assert second == {"__typename": "Query"}
+    assert patched_client.call_count == 1
+
+
+def test_gqlapi_query_cache_keyed_by_variables(
+    mocker: MockerFixture, result_cache: GqlResultCache
+) -> None:
+    patched_client = mocker.patch("reconcile.utils.gql.Client.execute", autospec=True)
+    patched_client.return_value.formatted = GQL_RESPONSE
+    gql_api = GqlApi(SHA_URL, validate_schemas=False, use_cache=True)
+
+    gql_api.query.__wrapped__(gql_api, SIMPLE_QUERY, {"a": 1})  # type: ignore[attr-defined]
+    gql_api.query.__wrapped__(gql_api, SIMPLE_QUERY, {"a": 2})  # type: ignore[attr-defined]
+
+    assert patched_client.call_count == 2
+
+
+def test_gqlapi_query_not_cached_without_sha(
+    mocker: MockerFixture, result_cache: GqlResultCache
+) -> None:
+    patched_client = mocker.patch("reconcile.utils.gql.Client.execute", autospec=True)
+    patched_client.return_value.formatted = GQL_RESPONSE
+    gql_api = GqlApi("http://localhost/graphql", validate_schemas=False, use_cache=True)
+
+    gql_api.query.__wrapped__(gql_api, SIMPLE_QUERY)  # type: ignore[attr-defined]
+    gql_api.query.__wrapped__(gql_api, SIMPLE_QUERY)  # type: ignore[attr-defined]
+
+    assert patched_client.call_count == 2
+
+
+def test_gqlapi_query_cache_hit_validates_schemas(
+    mocker: MockerFixture, result_cache: GqlResultCache
+) -> None:
+    patched_client = mocker.patch("reconcile.utils.gql.Client.execute", autospec=True)
+    patched_client.return_value.formatted = {
+        "data": {"integrations": [{"name": "INTEGRATION", "schemas": ["S"]}]},
+        "extensions": {"schemas": ["S", "FORBIDDEN"]},
+    }
+    gql_api = GqlApi(
+        SHA_URL, int_name="INTEGRATION", validate_schemas=True, use_cache=True
+    )
+
+    for _ in range(2):
+        with pytest.raises(GqlApiErrorForbiddenSchemaError):
+            gql_api.query.__wrapped__(gql_api, TEST_QUERY)  # type: ignore[attr-defined]
+    assert patched_client.call_count == 1
+
+
+def test_gqlapi_query_cache_opt_in(
+    mocker: MockerFixture, result_cache: GqlResultCache
+) -> None:
+    patched_client = mocker.patch("reconcile.utils.gql.Client.execute", autospec=True)
+    patched_client.return_value.formatted = GQL_RESPONSE
+    gql_api = GqlApi(SHA_URL, validate_schemas=False)
+
+    gql_api.query.__wrapped__(gql_api, SIMPLE_QUERY)  # type: ignore[attr-defined]
+    gql_api.query.__wrapped__(gql_api, SIMPLE_QUERY)  # type: ignore[attr-defined]
+
+    assert patched_client.call_count == 2
+
+
+def test_result_cache_lru_eviction() -> None:
+    cache = GqlResultCache(max_memory_bytes=40)
+    cache.set("sha", "a", None, {"v": "a" * 10})
+    cache.set("sha", "b", None, {"v": "b" * 10})
+    assert cache.get("sha", "a", None) is not None
+    cache.set("sha", "c", None, {"v": "c" * 10})
+
+    assert cache.get("sha", "a", None) is not None
+    assert cache.get("sha", "b", None) is None
+    assert cache.get("sha", "c", None) is not None
+
+
+def test_result_cache_drops_superseded_shas(tmp_path: Path) -> None:
+    cache = GqlResultCache(cache_dir=str(tmp_path), max_shas=2)
+    cache.set("sha1", "q", None, {"v": 1})
+    cache.set("sha2", "q", None, {"v": 2})
+    assert cache.get("sha1", "q", None) == {"v": 1}
+    cache.set("sha3", "q", None, {"v": 3})
+
+    assert cache.get("sha1", "q", None) == {"v": 1}
+    assert cache.get("sha2", "q", None) is None
+    assert cache.get("sha3", "q", None) == {"v": 3}
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_result_cache_disk_tier(tmp_path: Path) -> None:
+    GqlResultCache(cache_dir=str(tmp_path)).set("sha", "q", None, {"v": 1})
+
+    cache = GqlResultCache(cache_dir=str(tmp_path))
+    assert cache.get("sha", "q", None) == {"v": 1}
+    assert cache.get("sha", "missing", None) is None
+
+
+def test_result_cache_disk_eviction(tmp_path: Path) -> None:
+    cache = GqlResultCache(cache_dir=str(tmp_path), max_disk_bytes=20)
+    cache.set("sha", "a", None, {"v": "a" * 5})
+    cache.set("sha", "b", None, {"v": "b" * 5})
+
+    assert [p.name for p in tmp_path.iterdir()] == [cache_key("sha", "b", None)]
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+
+from reconcile.utils.image_cache import (
+    ImageCache,
+    ImageManifest,
+    cache_key,
+    image_tag,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+URL = "quay.io/org/app:1234567"
+MANIFEST = ImageManifest(
+    url=URL, digest="sha256:abc", url_digest="quay.io/org/app@sha256:abc"
+)
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("quay.io/org/app:abc", "abc"),
+        ("registry:5000/org/app:abc", "abc"),
+        ("registry:5000/org/app", None),
+        ("quay.io/org/app", None),
+    ],
+)
+def test_image_tag(url: str, expected: str | None) -> None:
+    assert image_tag(url) == expected
+
+
+def test_cache_key_includes_credentials() -> None:
+    assert cache_key(URL, "user", "pass") == cache_key(URL, "user", "pass")
+    assert cache_key(URL, "user", "pass") != cache_key(URL, "user", "other")
+    assert cache_key(URL, None, None) == cache_key(URL, "", "")
+
+
+def test_get_caches_in_memory() -> None:
+    cache = ImageCache()
+    loader = MagicMock(return_value=MANIFEST)
+
+    assert cache.get("key", loader) == MANIFEST
+    assert cache.get("key", loader) == MANIFEST
+    loader.assert_called_once()
+
+
+def test_get_does_not_cache_missing_images() -> None:
+    cache = ImageCache()
+    loader = MagicMock(return_value=None)
+
+    assert cache.get("key", loader) is None
+    assert cache.get("key", loader) is None
+    assert loader.call_count == 2
+
+
+def test_get_does_not_cache_errors() -> None:
+    cache = ImageCache()
+    loader = MagicMock(side_effect=[Exception("registry down"), MANIFEST])
+
+    with pytest.raises(Exception, match="registry down"):
+        cache.get("key", loader)
+    assert cache.get("key", loader) == MANIFEST
+
+
+def test_get_expires_mutable_entries() -> None:
+    cache = ImageCache(ttl=-1)
+    loader = MagicMock(return_value=MANIFEST)
+
+    cache.get("key", loader)
+    cache.get("key", loader)
+    assert loader.call_count == 2
+
+    cache.get("immutable", loader, immutable=True)
+    cache.get("immutable", loader, immutable=True)
+    assert loader.call_count == 3
+
+
+def test_get_evicts_least_recently_used() -> None:
+    cache = ImageCache(max_entries=2)
+    loader = MagicMock(return_value=MANIFEST)
+
+    cache.get("a", loader)
+    cache.get("b", loader)
+    cache.get("a", loader)
+    cache.get("c", loader)
+    assert loader.call_count == 3
+
+    cache.get("a", loader)
+    assert loader.call_count == 3
+    cache.get("b", loader)
+    assert loader.call_count == 4
+
+
+def test_get_single_flight() -> None:
+    cache = ImageCache()
+    release = threading.Event()
+    calls = 0
+
+    def loader() -> ImageManifest:
+        nonlocal calls
+        calls += 1
+        release.wait(5)
+        return MANIFEST
+
+    results: list[ImageManifest | None] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get("key", loader)))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert calls == 1
+    assert results == [MANIFEST] * 5
+
+
+def test_get_persists_immutable_entries(tmp_path: Path) -> None:
+    loader = MagicMock(return_value=MANIFEST)
+
+    ImageCache(cache_dir=str(tmp_path)).get("key", loader, immutable=True)
+    ImageCache(cache_dir=str(tmp_path)).get("mutable", loader)
+    assert loader.call_count == 2
+    assert [p.name for p in tmp_path.iterdir()] == ["key.json"]
+
+    # a new process is served from disk
+    assert (
+        ImageCache(cache_dir=str(tmp_path)).get("key", loader, immutable=True)
+        == MANIFEST
+    )
+    assert loader.call_count == 2
+
+
+def test_get_ignores_corrupt_disk_entries(tmp_path: Path) -> None:
+    (tmp_path / "key.json").write_text("not json", encoding="utf-8")
+    loader = MagicMock(return_value=MANIFEST)
+
+    cache = ImageCache(cache_dir=str(tmp_path))
+    assert cache.get("key", loader, immutable=True) == MANIFEST
+    loader.assert_called_once()
@@ -183,3 +183,15 @@ def test_terraform_component() -> None:
         assert lean_terraform_client.plan(working_dir, "tfplan")[0] == 0
         assert lean_terraform_client.show_json(working_dir, "tfplan") is not None
         assert lean_terraform_client.apply(working_dir, "tfplan")[0] == 0
+
+
+def test_plugin_cache_lock_creates_cache_dir() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache_dir = os.path.join(tmpdir, "cache")
+        with lean_terraform_client.plugin_cache_lock(cache_dir):
+            assert os.path.isdir(cache_dir)
+        with (
+            lean_terraform_client.plugin_cache_lock(cache_dir, shared=True),
+            lean_terraform_client.plugin_cache_lock(cache_dir, shared=True),
+        ):
+            pass
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import logging
 import os
 from subprocess import CompletedProcess
@@ -8,8 +9,13 @@ from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
 import pytest
+from kubernetes.client.exceptions import ApiException
 from kubernetes.dynamic import Resource
-from kubernetes.dynamic.exceptions import ResourceNotFoundError
+from kubernetes.dynamic.exceptions import (
+    GoneError,
+    NotFoundError,
+    ResourceNotFoundError,
+)
 
 import reconcile.utils.oc
 from reconcile.utils.oc import (
@@ -17,16 +23,26 @@ from reconcile.utils.oc import (
     LABEL_MAX_KEY_NAME_LENGTH,
     LABEL_MAX_KEY_PREFIX_LENGTH,
     LABEL_MAX_VALUE_LENGTH,
+    MAX_LIST_RESTARTS,
     OC,
     AmbiguousResourceTypeError,
+    DeploymentFieldIsImmutableError,
+    FieldIsImmutableError,
     KindNotFoundError,
+    ListExpiredError,
+    MetaDataAnnotationsTooLongApplyError,
     OC_Map,
     OCCli,
+    OCCliApiResource,
     OCLogMsg,
     OCNative,
     PodNotReadyError,
     StatusCodeError,
+    UnsupportedMediaTypeError,
+    WatchExpiredError,
+    apply_output_name,
     equal_spec_template,
+    upgrade_managed_fields,
     validate_labels,
 )
 from reconcile.utils.openshift_resource import OpenshiftResource as OR
@@ -641,17 +657,6 @@ class TestOCMapGetClusters(TestCase):
         self.assertFalse(oc_map.get(cluster["name"]))
 
 
-OC_CLI_BASE_CMD = [
-    "oc",
-    "--kubeconfig",
-    "/dev/null",
-    "--server",
-    "server",
-    "--token",
-    "token",
-]
-
-
 @pytest.fixture
 def oc_cli(monkeypatch: pytest.MonkeyPatch) -> OCCli:
     monkeypatch.setenv("USE_NATIVE_CLIENT", "False")
@@ -1200,7 +1205,8 @@ def test_oc_recycle(
     )
 
     mock_run.assert_called_once_with(
-        OC_CLI_BASE_CMD + ["rollout", "restart", "Deployment/name", "-n", "namespace"],
+        oc_cli.oc_base_cmd
+        + ["rollout", "restart", "Deployment/name", "-n", "namespace"],
         input=None,
         capture_output=True,
         check=False,
@@ -1313,6 +1319,148 @@ def test_oc_native_get_items_with_resource_names(oc_native: OCNative) -> None:
     )
 
 
+def test_oc_native_iter_items_paginated(oc_native: OCNative) -> None:
+    obj_client = oc_native.client.resources.get.return_value
+    obj_client.get.return_value.to_dict.side_effect = [
+        {"items": [{"name": "a"}, {"name": "b"}], "metadata": {"continue": "token"}},
+        {"items": [{"name": "c"}], "metadata": {}},
+    ]
+
+    items = oc_native.iter_items("kind1", page_size=2, labels={"label1": "value1"})
+
+    obj_client.get.assert_not_called()
+    assert list(items) == [{"name": "a"}, {"name": "b"}, {"name": "c"}]
+    assert obj_client.get.call_count == 2
+    obj_client.get.assert_any_call(
+        namespace="",
+        label_selector="label1=value1",
+        limit=2,
+        _continue=None,
+        _request_timeout=60,
+    )
+    obj_client.get.assert_called_with(
+        namespace="",
+        label_selector="label1=value1",
+        limit=2,
+        _continue="token",
+        _request_timeout=60,
+    )
+
+
+def test_oc_native_iter_items_with_resource_names(oc_native: OCNative) -> None:
+    obj_client = oc_native.client.resources.get.return_value
+    obj_client.get.return_value.to_dict.return_value = {"name": "name"}
+
+    items = list(oc_native.iter_items("kind1", resource_names=["name"]))
+
+    assert items == [{"name": "name"}]
+    obj_client.get.assert_called_once_with(
+        namespace="",
+        name="name",
+        label_selector="",
+        _request_timeout=60,
+    )
+
+
+def test_oc_native_iter_items_restarts_expired_list(oc_native: OCNative) -> None:
+    obj_client = oc_native.client.resources.get.return_value
+    obj_client.get.return_value.to_dict.side_effect = [
+        {
+            "items": [{"metadata": {"uid": "a"}}],
+            "metadata": {"continue": "token"},
+        },
+        GoneError(ApiException(status=410, reason="Expired")),
+        {
+            "items": [{"metadata": {"uid": "a"}}, {"metadata": {"uid": "b"}}],
+            "metadata": {},
+        },
+    ]
+
+    items = list(oc_native.iter_items("kind1", page_size=1))
+
+    assert items == [{"metadata": {"uid": "a"}}, {"metadata": {"uid": "b"}}]
+    obj_client.get.assert_called_with(
+        namespace="",
+        label_selector="",
+        limit=1,
+        _continue=None,
+        _request_timeout=60,
+    )
+
+
+def test_oc_native_iter_items_list_expired(oc_native: OCNative) -> None:
+    obj_client = oc_native.client.resources.get.return_value
+    obj_client.get.return_value.to_dict.side_effect = [
+        {"items": [], "metadata": {"continue": "token"}},
+        GoneError(ApiException(status=410, reason="Expired")),
+    ] * (MAX_LIST_RESTARTS + 1)
+
+    with pytest.raises(ListExpiredError):
+        list(oc_native.iter_items("kind1"))
+
+
+def test_oc_native_list_items(oc_native: OCNative) -> None:
+    obj_client = oc_native.client.resources.get.return_value
+    obj_client.get.return_value.to_dict.return_value = {
+        "items": [{"name": "a"}],
+        "metadata": {"resourceVersion": "42"},
+    }
+
+    assert oc_native.list_items("kind1", namespace="namespace") == (
+        [{"name": "a"}],
+        "42",
+    )
+    obj_client.get.assert_called_once_with(namespace="namespace", _request_timeout=60)
+
+
+def test_oc_native_watch_items(oc_native: OCNative) -> None:
+    oc_native.client.watch.return_value = iter([
+        {"type": "MODIFIED", "raw_object": {"name": "a"}, "object": None},
+        {"type": "DELETED", "raw_object": {"name": "b"}, "object": None},
+    ])
+
+    events = oc_native.watch_items(
+        "kind1", namespace="namespace", resource_version="42", timeout_seconds=5
+    )
+
+    assert list(events) == [("MODIFIED", {"name": "a"}), ("DELETED", {"name": "b"})]
+    oc_native.client.watch.assert_called_once_with(
+        oc_native.client.resources.get.return_value,
+        namespace="namespace",
+        resource_version="42",
+        timeout=5,
+        allow_watch_bookmarks=True,
+    )
+
+
+def test_oc_native_watch_items_expired(oc_native: OCNative) -> None:
+    oc_native.client.watch.side_effect = ApiException(status=410, reason="Gone")
+
+    with pytest.raises(WatchExpiredError):
+        list(
+            oc_native.watch_items(
+                "kind1", namespace="namespace", resource_version="1", timeout_seconds=5
+            )
+        )
+
+
+def test_oc_cli_iter_items_chunk_size(oc_cli: OCCli, mocker: MockerFixture) -> None:
+    mock_run_json = mocker.patch.object(
+        oc_cli, "_run_json", return_value={"items": [{"name": "a"}]}
+    )
+
+    items = list(oc_cli.iter_items("ConfigMap", page_size=100))
+
+    assert items == [{"name": "a"}]
+    mock_run_json.assert_called_once_with([
+        "get",
+        "ConfigMap",
+        "-o",
+        "json",
+        "--chunk-size=100",
+    ])
+
+
 def test_oc_native_get_all(oc_native: OCNative) -> None:
     oc_native.get_all("kind1")
 
@@ -1459,3 +1607,374 @@ def test_oc_apply(
         stdin=resource.to_json(),
         apply=True,
     )
+
+
+@pytest.fixture
+def oc_native_writes(oc_native: OCNative) -> OCNative:
+    oc_native.native_writes = True
+    return oc_native
+
+
+@pytest.fixture
+def configmap() -> OR:
+    return OR(
+        body={
+            "apiVersion": "v1",
+            "kind": "ConfigMap",
+            "metadata": {"name": "test-configmap"},
+            "data": {"key": "value"},
+        },
+        integration="test-integration",
+        integration_version="0.0.1",
+    )
+
+
+def api_exception(status: int, body: dict[str, Any]) -> ApiException:
+    e = ApiException(status=status, reason="reason")
+    e.body = json.dumps(body)
+    return e
+
+
+def applied(
+    resource_version: str, *managed_fields: tuple[str, str, dict[str, Any]]
+) -> dict[str, Any]:
+    return {
+        "metadata": {
+            "resourceVersion": resource_version,
+            "managedFields": [
+                {
+                    "manager": manager,
+                    "operation": operation,
+                    "apiVersion": "v1",
+                    "fieldsType": "FieldsV1",
+                    "fieldsV1": fields,
+                }
+                for manager, operation, fields in managed_fields
+            ],
+        }
+    }
+
+
+@pytest.mark.parametrize("server_side", [True, False])
+def test_oc_native_apply_server_side(
+    oc_native_writes: OCNative, mocker: MockerFixture, configmap: OR, server_side: bool
+) -> None:
+    mocker.patch.object(
+        oc_native_writes,
+        "get_api_resource",
+        return_value=OCCliApiResource("ConfigMap", "", "v1", True),
+    )
+    mock_run = mocker.patch.object(oc_native_writes, "_run")
+    obj_client = oc_native_writes.client.resources.get.return_value
+    obj_client.server_side_apply.return_value.to_dict.return_value = applied(
+        "1", ("kubectl", "Apply", {"f:data": {"f:key": {}}})
+    )
+
+    oc_native_writes.apply.__wrapped__(  # type: ignore[attr-defined]
+        oc_native_writes,
+        namespace="test-namespace",
+        resource=configmap,
+        server_side=server_side,
+    )
+
+    oc_native_writes.client.resources.get.assert_called_once_with(
+        api_version="v1", kind="ConfigMap"
+    )
+    obj_client = oc_native_writes.client.resources.get.return_value
+    obj_client.server_side_apply.assert_called_once_with(
+        body=configmap.body,
+        name="test-configmap",
+        namespace="test-namespace",
+        field_manager="kubectl",
+        force_conflicts=True,
+        _request_timeout=60,
+    )
+    obj_client.patch.assert_not_called()
+    mock_run.assert_not_called()
+
+
+def test_oc_native_apply_upgrades_client_side_applied_object(
+    oc_native_writes: OCNative, mocker: MockerFixture
+) -> None:
+    """An object that was applied by `oc apply` has its fields owned by
+    kubectl-client-side-apply. They are moved to the apply manager and the
+    object is applied again, so the field removed from the desired state is
+    pruned."""
+    mocker.patch.object(
+        oc_native_writes,
+        "get_api_resource",
+        return_value=OCCliApiResource("ConfigMap", "", "v1", True),
+    )
+    obj_client = oc_native_writes.client.resources.get.return_value
+    csa_fields: dict[str, Any] = {"f:data": {"f:key": {}, "f:removed": {}}}
+    obj_client.server_side_apply.return_value.to_dict.side_effect = [
+        applied(
+            "1",
+            ("kubectl-client-side-apply", "Update", csa_fields),
+            ("kubectl", "Apply", {"f:data": {"f:key": {}}}),
+        ),
+        applied("3", ("kubectl", "Apply", {"f:data": {"f:key": {}}})),
+    ]
+    resource = OR(
+        body={
+            "apiVersion": "v1",
+            "kind": "ConfigMap",
+            "metadata": {"name": "test-configmap"},
+            "data": {"key": "value"},
+        },
+        integration="test-integration",
+        integration_version="0.0.1",
+    )
+
+    oc_native_writes.apply.__wrapped__(  # type: ignore[attr-defined]
+        oc_native_writes, namespace="test-namespace", resource=resource
+    )
+
+    obj_client.patch.assert_called_once_with(
+        body=[
+            {"op": "test", "path": "/metadata/resourceVersion", "value": "1"},
+            {
+                "op": "replace",
+                "path": "/metadata/managedFields",
+                "value": applied("1", ("kubectl", "Apply", csa_fields))["metadata"][
+                    "managedFields"
+                ],
+            },
+        ],
+        name="test-configmap",
+        namespace="test-namespace",
+        content_type="application/json-patch+json",
+        _request_timeout=60,
+    )
+    assert obj_client.server_side_apply.call_count == 2
+    for c in obj_client.server_side_apply.call_args_list:
+        assert "removed" not in c.kwargs["body"]["data"]
+
+
+def test_upgrade_managed_fields() -> None:
+    status = {
+        "manager": "kube-controller-manager",
+        "operation": "Update",
+        "subresource": "status",
+        "fieldsV1": {"f:status": {}},
+    }
+    other = {
+        "manager": "some-operator",
+        "operation": "Update",
+        "fieldsV1": {"f:metadata": {"f:labels": {"f:a": {}}}},
+    }
+    csa = {
+        "manager": "kubectl-client-side-apply",
+        "operation": "Update",
+        "apiVersion": "v1",
+        "fieldsV1": {"f:data": {"f:a": {}}, "f:metadata": {"f:annotations": {}}},
+    }
+    replaced = {
+        "manager": "kubectl-replace",
+        "operation": "Update",
+        "apiVersion": "v1",
+        "fieldsV1": {"f:data": {"f:b": {}}},
+    }
+
+    assert upgrade_managed_fields([status, other]) is None
+    assert upgrade_managed_fields([status, csa, other, replaced]) == [
+        status,
+        other,
+        {
+            "manager": "kubectl",
+            "operation": "Apply",
+            "apiVersion": "v1",
+            "fieldsV1": {
+                "f:data": {"f:a": {}, "f:b": {}},
+                "f:metadata": {"f:annotations": {}},
+            },
+        },
+    ]
+
+
+def test_oc_native_apply_without_native_writes(
+    oc_native: OCNative, mocker: MockerFixture, configmap: OR
+) -> None:
+    oc_native.native_writes = False
+    mock_run = mocker.patch.object(oc_native, "_run", return_value=b"{}")
+
+    oc_native.apply.__wrapped__(  # type: ignore[attr-defined]
+        oc_native, namespace="test-namespace", resource=configmap
+    )
+
+    mock_run.assert_called_once_with(
+        ["apply", "-n", "test-namespace", "-f", "-"],
+        stdin=configmap.to_json(),
+        apply=True,
+    )
+    oc_native.client.resources.get.return_value.server_side_apply.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("body", "expected"),
+    [
+        (
+            {
+                "reason": "Invalid",
+                "message": 'Deployment.apps "test" is invalid: spec.selector: Invalid value: {}: field is immutable',
+                "details": {"kind": "Deployment", "name": "test"},
+            },
+            DeploymentFieldIsImmutableError,
+        ),
+        (
+            {
+                "reason": "Invalid",
+                "message": 'Service "test" is invalid: spec.type: Invalid value: "x": field is immutable',
+                "details": {"kind": "Service", "name": "test"},
+            },
+            FieldIsImmutableError,
+        ),
+        (
+            {
+                "reason": "Invalid",
+                "message": 'ConfigMap "test" is invalid: metadata.annotations: Too long: must have at most 262144 bytes',
+                "details": {"kind": "ConfigMap", "name": "test"},
+            },
+            MetaDataAnnotationsTooLongApplyError,
+        ),
+        (
+            {"reason": "UnsupportedMediaType", "message": "unsupported media type"},
+            UnsupportedMediaTypeError,
+        ),
+        (
+            {"reason": "Forbidden", "message": "forbidden"},
+            StatusCodeError,
+        ),
+    ],
+)
+def test_oc_native_apply_error_mapping(
+    oc_native_writes: OCNative,
+    mocker: MockerFixture,
+    configmap: OR,
+    body: dict[str, Any],
+    expected: type[Exception],
+) -> None:
+    mocker.patch.object(
+        oc_native_writes,
+        "get_api_resource",
+        return_value=OCCliApiResource("ConfigMap", "", "v1", True),
+    )
+    obj_client = oc_native_writes.client.resources.get.return_value
+    obj_client.server_side_apply.side_effect = api_exception(422, body)
+
+    with pytest.raises(expected):
+        oc_native_writes.apply.__wrapped__(  # type: ignore[attr-defined]
+            oc_native_writes,
+            namespace="test-namespace",
+            resource=configmap,
+            server_side=True,
+        )
+
+
+def test_oc_native_delete_waits_for_deletion(
+    oc_native_writes: OCNative, mocker: MockerFixture
+) -> None:
+    mocker.patch.object(
+        oc_native_writes,
+        "get_api_resource",
+        return_value=OCCliApiResource("ConfigMap", "", "v1", True),
+    )
+    obj_client = oc_native_writes.client.resources.get.return_value
+    obj_client.get.side_effect = NotFoundError(api_exception(404, {}))
+
+    oc_native_writes.delete.__wrapped__(  # type: ignore[attr-defined]
+        oc_native_writes, "test-namespace", "ConfigMap", "test", cascade=False
+    )
+
+    obj_client.delete.assert_called_once_with(
+        name="test",
+        namespace="test-namespace",
+        propagation_policy="Orphan",
+        _request_timeout=60,
+    )
+    obj_client.get.assert_called_once()
+
+
+def test_oc_cli_kubeconfig(oc_cli: OCCli) -> None:
+    assert oc_cli.oc_base_cmd[:2] == ["oc", "--kubeconfig"]
+    assert oc_cli.oc_base_cmd[3] == "--cache-dir"
+    kubeconfig = oc_cli.oc_base_cmd[2]
+    assert os.stat(kubeconfig).st_mode & 0o777 == 0o600
+    with open(kubeconfig, encoding="utf-8") as f:
+        config = json.load(f)
+    assert config["clusters"] == [{"name": "cluster", "cluster": {"server": "server"}}]
+    assert config["users"] == [{"name": "user", "user": {"token": "token"}}]
+    assert "token" not in oc_cli.oc_base_cmd
+
+    oc_cli.cleanup()
+
+    assert not os.path.exists(kubeconfig)
+
+
+def test_oc_cli_local_without_server(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("USE_NATIVE_CLIENT", "False")
+    oc = OC("cluster", None, None, local=True)
+
+    assert oc.oc_base_cmd == ["oc", "--kubeconfig", "/dev/null"]
+
+
+def test_oc_cli_cache_dir_per_server(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("USE_NATIVE_CLIENT", "False")
+    oc_1 = OC("cluster", "server-1", "token", local=True)
+    oc_2 = OC("cluster", "server-1", "token", local=True)
+    oc_3 = OC("cluster", "server-2", "token", local=True)
+
+    assert oc_1.oc_base_cmd[4] == oc_2.oc_base_cmd[4]
+    assert oc_1.oc_base_cmd[4] != oc_3.oc_base_cmd[4]
+    assert oc_1.oc_base_cmd[2] != oc_2.oc_base_cmd[2]
+
+
+@pytest.mark.parametrize(
+    ("api_version", "kind", "expected"),
+    [
+        ("v1", "ConfigMap", "configmap/name"),
+        ("apps/v1", "Deployment", "deployment.apps/name"),
+        ("route.openshift.io/v1", "Route", "route.route.openshift.io/name"),
+    ],
+)
+def test_apply_output_name(api_version: str, kind: str, expected: str) -> None:
+    resource = OR(
+        {"apiVersion": api_version, "kind": kind, "metadata": {"name": "name"}},
+        "integration",
+        "0.0.1",
+    )
+    assert apply_output_name(resource) == expected
+
+
+def test_oc_cli_apply_batch(oc_cli: OCCli, mocker: MockerFixture) -> None:
+    resources = [
+        OR(
+            {"apiVersion": "v1", "kind": "ConfigMap", "metadata": {"name": name}},
+            "integration",
+            "0.0.1",
+        )
+        for name in ("a", "b")
+    ]
+    mock_run = mocker.patch(
+        "reconcile.utils.oc.subprocess.run",
+        return_value=CompletedProcess(
+            args=[], returncode=1, stdout=b"configmap/a\n", stderr=b"error"
+        ),
+    )
+
+    applied = oc_cli.apply_batch("namespace", resources)
+
+    assert applied == {"a"}
+    mock_run.assert_called_once()
+    assert mock_run.call_args.args[0] == oc_cli.oc_base_cmd + [
+        "apply",
+        "-n",
+        "namespace",
+        "-o",
+        "name",
+        "-f",
+        "-",
+    ]
+    assert json.loads(mock_run.call_args.kwargs["input"])["items"] == [
+        r.body for r in resources
+    ]
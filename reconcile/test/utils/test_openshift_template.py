@@ -0,0 +1,262 @@
+import re
+import shutil
+from pathlib import Path
+from typing import Any
+
+import pytest
+import yaml
+
+from reconcile.utils import openshift_template
+from reconcile.utils.oc import OCLocal, StatusCodeError
+from reconcile.utils.openshift_template import TemplateProcessingError
+
+REPO_ROOT = Path(__file__).parents[3]
+FIXTURES = REPO_ROOT / "reconcile" / "test" / "fixtures"
+
+
+def template(
+    objects: list[dict[str, Any]],
+    parameters: list[dict[str, Any]] | None = None,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    return {
+        "apiVersion": "template.openshift.io/v1",
+        "kind": "Template",
+        "metadata": {"name": "test"},
+        "objects": objects,
+        "parameters": parameters or [],
+    } | kwargs
+
+
+def configmap(data: dict[str, Any], **metadata: Any) -> dict[str, Any]:
+    return {
+        "apiVersion": "v1",
+        "kind": "ConfigMap",
+        "metadata": {"name": "cm"} | metadata,
+        "data": data,
+    }
+
+
+def test_process_string_substitution() -> None:
+    t = template(
+        [configmap({"a": "${A}", "b": "x-${A}-${B}-${A}", "c": "${UNKNOWN}"})],
+        [{"name": "A", "value": "default"}, {"name": "B"}],
+    )
+
+    assert openshift_template.process(t, {"B": "b"})[0]["data"] == {
+        "a": "default",
+        "b": "x-default-b-default",
+        "c": "${UNKNOWN}",
+    }
+
+
+def test_process_parameters_override_defaults() -> None:
+    t = template([configmap({"a": "${A}"})], [{"name": "A", "value": "default"}])
+
+    assert openshift_template.process(t, {"A": "override", "IGNORED": "x"})[0][
+        "data"
+    ] == {"a": "override"}
+
+
+def test_process_parameter_values_are_formatted_like_oc_arguments() -> None:
+    t = template(
+        [configmap({"a": "${A}", "b": "${B}"})], [{"name": "A"}, {"name": "B"}]
+    )
+
+    assert openshift_template.process(t, {"A": True, "B": 3})[0]["data"] == {
+        "a": "True",
+        "b": "3",
+    }
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("3", 3),
+        ("1.0", 1),
+        ("1.5", 1.5),
+        ("true", True),
+        ('["a", {"b": 1}]', ["a", {"b": 1}]),
+        ("not-json", "not-json"),
+        ("NaN", "NaN"),
+    ],
+)
+def test_process_non_string_substitution(value: str, expected: Any) -> None:
+    t = template(
+        [configmap({"a": "${{A}}", "b": "x-${{A}}"})],
+        [{"name": "A"}],
+    )
+
+    assert openshift_template.process(t, {"A": value})[0]["data"] == {
+        "a": expected,
+        "b": "x-${{A}}",
+    }
+
+
+def test_process_substitutes_map_keys() -> None:
+    t = template([configmap({"${KEY}": "value"})], [{"name": "KEY"}])
+
+    assert openshift_template.process(t, {"KEY": "k"})[0]["data"] == {"k": "value"}
+
+
+def test_process_required_parameter() -> None:
+    t = template([configmap({})], [{"name": "A", "required": True}])
+
+    with pytest.raises(TemplateProcessingError, match="parameter A is required"):
+        openshift_template.process(t)
+    with pytest.raises(TemplateProcessingError, match="parameter A is required"):
+        openshift_template.process(t, {"A": ""})
+    assert openshift_template.process(t, {"A": "a"})
+
+
+def test_process_generated_parameter() -> None:
+    t = template(
+        [configmap({"a": "${A}"})],
+        [
+            {
+                "name": "A",
+                "generate": "expression",
+                "from": "prefix-[a-f0-9]{8}-[\\d]{2}",
+                "required": True,
+            }
+        ],
+    )
+
+    value = openshift_template.process(t)[0]["data"]["a"]
+    assert re.fullmatch(r"prefix-[a-f0-9]{8}-\d{2}", value)
+    # explicit values are never generated
+    assert openshift_template.process(t, {"A": "a"})[0]["data"]["a"] == "a"
+
+
+@pytest.mark.parametrize(
+    "expression, pattern",
+    [
+        ("[\\w]{10}", r"\w{10}"),
+        ("[\\a]{10}", r"[a-zA-Z]{10}"),
+        ("[A-Z0-9]{4}x[a-z]{1}", r"[A-Z0-9]{4}x[a-z]"),
+        ("no-generator", r"no-generator"),
+    ],
+)
+def test_generate_value(expression: str, pattern: str) -> None:
+    assert re.fullmatch(pattern, openshift_template.generate_value(expression))
+
+
+@pytest.mark.parametrize("expression", ["[a-z]{0}", "[a-z]{256}", "[z-a]{3}"])
+def test_generate_value_invalid(expression: str) -> None:
+    with pytest.raises(TemplateProcessingError):
+        openshift_template.generate_value(expression)
+
+
+def test_process_strips_hardcoded_namespaces() -> None:
+    t = template(
+        [
+            configmap({}, name="a", namespace="hardcoded"),
+            configmap({}, name="b", namespace="${NAMESPACE}"),
+        ],
+        [{"name": "NAMESPACE"}],
+    )
+
+    items = openshift_template.process(t, {"NAMESPACE": "ns"})
+    assert "namespace" not in items[0]["metadata"]
+    assert items[1]["metadata"]["namespace"] == "ns"
+
+
+def test_process_adds_template_labels() -> None:
+    t = template(
+        [configmap({}, labels={"app": "template", "tier": "web"}), configmap({})],
+        labels={"app": "template"},
+    )
+
+    items = openshift_template.process(t)
+    assert items[0]["metadata"]["labels"] == {"app": "template", "tier": "web"}
+    assert items[1]["metadata"]["labels"] == {"app": "template"}
+
+
+def test_process_substitutes_template_labels() -> None:
+    t = template(
+        [configmap({}, labels={"app": "a"})],
+        [{"name": "APP", "value": "a"}, {"name": "KEY"}],
+        labels={"app": "${APP}", "${KEY}": "${KEY}-value"},
+    )
+
+    items = openshift_template.process(t, {"KEY": "tier"})
+    assert items[0]["metadata"]["labels"] == {"app": "a", "tier": "tier-value"}
+    with pytest.raises(TemplateProcessingError, match="label could not be applied"):
+        openshift_template.process(t, {"APP": "b", "KEY": "tier"})
+
+
+def test_process_generated_parameter_in_template_labels() -> None:
+    t = template(
+        [configmap({"id": "${ID}"}), configmap({})],
+        [{"name": "ID", "generate": "expression", "from": "[a-z0-9]{8}"}],
+        labels={"id": "${ID}"},
+    )
+
+    items = openshift_template.process(t)
+    value = items[0]["data"]["id"]
+    assert re.fullmatch(r"[a-z0-9]{8}", value)
+    # the value is generated once and used everywhere
+    assert [i["metadata"]["labels"] for i in items] == [{"id": value}] * 2
+
+
+def test_process_conflicting_template_labels() -> None:
+    t = template([configmap({}, labels={"app": "a"})], labels={"app": "template"})
+
+    with pytest.raises(TemplateProcessingError, match="label could not be applied"):
+        openshift_template.process(t)
+
+
+def test_process_does_not_mutate_template() -> None:
+    t = template(
+        [configmap({"a": "${A}"}, namespace="hardcoded")],
+        [{"name": "A"}],
+        labels={"app": "template"},
+    )
+    expected = yaml.safe_load(yaml.safe_dump(t))
+
+    openshift_template.process(t, {"A": "a"})
+    assert t == expected
+
+
+# differential tests against `oc process`, run wherever the oc binary is
+# available (e.g. in the CI image)
+
+DIFFERENTIAL_TEMPLATES = [
+    REPO_ROOT / "openshift" / "qontract-api.yaml",
+    REPO_ROOT / "openshift" / "qontract-manager.yaml",
+    REPO_ROOT / "openshift" / "qontract-manager-fedramp.yaml",
+    FIXTURES / "saasherder" / "template_1.yml",
+    *sorted((FIXTURES / "helm").glob("*.yml"))[:5],
+]
+
+
+def differential_parameters(t: dict[str, Any]) -> dict[str, str]:
+    # deterministic values for everything that would be generated or is
+    # required, plus an override of every other parameter
+    return {
+        p["name"]: p["value"] if p.get("value") else f"value-{p['name'].lower()}"
+        for p in t.get("parameters") or []
+    } | {"IMAGE_TAG": "abcdef1", "REPLICAS": "3", "REPLICAS_COUNT": "5"}
+
+
+@pytest.mark.skipif(shutil.which("oc") is None, reason="oc binary not available")
+@pytest.mark.parametrize(
+    "path", DIFFERENTIAL_TEMPLATES, ids=lambda p: str(p.relative_to(REPO_ROOT))
+)
+def test_process_matches_oc(path: Path) -> None:
+    t = yaml.safe_load(path.read_text(encoding="utf-8"))
+    parameters = differential_parameters(t)
+    oc = OCLocal("cluster", None, None, local=True)
+
+    assert openshift_template.process(t, parameters) == oc.process(t, parameters)
+
+
+@pytest.mark.skipif(shutil.which("oc") is None, reason="oc binary not available")
+def test_process_conflicting_template_labels_matches_oc() -> None:
+    t = template([configmap({}, labels={"app": "a"})], labels={"app": "template"})
+    oc = OCLocal("cluster", None, None, local=True)
+
+    with pytest.raises(StatusCodeError, match="label could not be applied"):
+        oc.process(t)
+    with pytest.raises(TemplateProcessingError, match="label could not be applied"):
+        openshift_template.process(t)
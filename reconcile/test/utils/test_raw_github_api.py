@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+import requests
+from prometheus_client import REGISTRY
+
+from reconcile.utils.raw_github_api import (
+    ORG_TEAMS_QUERY,
+    TEAM_MEMBERS_QUERY,
+    GithubGraphQLError,
+    RawGithubApi,
+)
+
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
+
+    from pytest_mock import MockerFixture
+
+
+def page_info(end_cursor: str | None = None) -> dict[str, Any]:
+    return {"hasNextPage": end_cursor is not None, "endCursor": end_cursor}
+
+
+def team(
+    name: str,
+    members: list[str],
+    invitees: list[str | None],
+    members_cursor: str | None = None,
+) -> dict[str, Any]:
+    return {
+        "name": name,
+        "slug": name.lower(),
+        "members": {
+            "pageInfo": page_info(members_cursor),
+            "nodes": [{"login": m} for m in members],
+        },
+        "invitations": {
+            "pageInfo": page_info(),
+            "nodes": [{"invitee": {"login": i} if i else None} for i in invitees],
+        },
+    }
+
+
+def teams_page(teams: list[dict[str, Any]], cursor: str | None = None) -> dict:
+    return {"organization": {"teams": {"pageInfo": page_info(cursor), "nodes": teams}}}
+
+
+def test_team_members(mocker: MockerFixture) -> None:
+    graphql = mocker.patch.object(
+        RawGithubApi,
+        "graphql",
+        side_effect=[
+            teams_page(
+                [team("Team1", ["a", "b"], ["c", None], members_cursor="m1")],
+                cursor="t1",
+            ),
+            {
+                "organization": {
+                    "team": {
+                        "connection": {
+                            "pageInfo": page_info(),
+                            "nodes": [{"login": "d"}],
+                        }
+                    }
+                }
+            },
+            teams_page([team("Team2", [], ["e"])]),
+        ],
+    )
+
+    teams = RawGithubApi("token").team_members("org")
+
+    assert teams == {"Team1": ["a", "b", "d", "c"], "Team2": ["e"]}
+    assert graphql.call_args_list == [
+        mocker.call(ORG_TEAMS_QUERY, {"org": "org", "after": None}),
+        mocker.call(TEAM_MEMBERS_QUERY, {"org": "org", "team": "team1", "after": "m1"}),
+        mocker.call(ORG_TEAMS_QUERY, {"org": "org", "after": "t1"}),
+    ]
+
+
+def build_response(body: bytes, headers: dict[str, str]) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.headers.update(headers)
+    return response
+
+
+def test_graphql_records_rate_limit(mocker: MockerFixture) -> None:
+    mocker.patch(
+        "reconcile.utils.raw_github_api.requests.post",
+        return_value=build_response(
+            b'{"data": {"viewer": {"login": "bot"}}}',
+            {
+                "X-RateLimit-Resource": "graphql",
+                "X-RateLimit-Remaining": "4990",
+                "X-RateLimit-Limit": "5000",
+            },
+        ),
+    )
+
+    data = RawGithubApi("token", org="org").graphql("{ viewer { login } }", {})
+
+    assert data == {"viewer": {"login": "bot"}}
+    assert (
+        REGISTRY.get_sample_value(
+            "qontract_reconcile_github_rate_limit_remaining",
+            {"org": "org", "resource": "graphql"},
+        )
+        == 4990
+    )
+
+
+def test_graphql_errors(mocker: MockerFixture, patch_sleep: MagicMock) -> None:
+    mocker.patch(
+        "reconcile.utils.raw_github_api.requests.post",
+        return_value=build_response(b'{"errors": [{"message": "boom"}]}', {}),
+    )
+
+    with pytest.raises(GithubGraphQLError):
+        RawGithubApi("token").graphql("{ viewer { login } }", {})
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from typing import TYPE_CHECKING
 
 import boto3
@@ -13,6 +14,7 @@ from reconcile.gql_definitions.common.state_aws_account import AWSAccountV1
 from reconcile.gql_definitions.fragments.vault_secret import VaultSecret
 from reconcile.typed_queries.get_state_aws_account import get_state_aws_account
 from reconcile.utils import state
+from reconcile.utils.content_cache import ContentCache
 from reconcile.utils.secret_reader import (
     ConfigSecretReader,
     SecretReaderBase,
@@ -22,6 +24,7 @@ from reconcile.utils.state import (
     S3CredsBasedStateConfiguration,
     S3ProfileBasedStateConfiguration,
     State,
+    StateCache,
     StateInaccessibleError,
     TransactionStateObj,
     acquire_state_settings,
@@ -79,6 +82,23 @@ def integration_state(s3_client: S3Client, integration: str) -> State:
     )
 
 
+@pytest.fixture
+def state_cache() -> StateCache:
+    return StateCache(ContentCache(name="state", max_memory_bytes=1024 * 1024))
+
+
+@pytest.fixture
+def cached_state(
+    s3_client: S3Client, integration: str, state_cache: StateCache
+) -> State:
+    return State(
+        integration=integration,
+        bucket=BUCKET,
+        client=s3_client,
+        cache=state_cache,
+    )
+
+
 @pytest.fixture
 def all_state(s3_client: S3Client) -> State:
     return State(
@@ -174,6 +194,55 @@ def test_ls_when_that_are_more_than_1000_keys(
     assert keys == expected
 
 
+def test_ls_with_prefix(integration_state: State, s3_client: S3Client) -> None:
+    for key in ("path/a", "path/b", "other/c"):
+        s3_client.put_object(
+            Bucket=integration_state.bucket,
+            Key=f"state/integration-name/{key}",
+            Body="test",
+        )
+
+    assert integration_state.ls("path/") == ["/path/a", "/path/b"]
+
+
+def test_get_all(integration_state: State, s3_client: S3Client) -> None:
+    for key, value in (("path/a", "1"), ("path/nested/b", '"b"'), ("other/c", "3")):
+        s3_client.put_object(
+            Bucket=integration_state.bucket,
+            Key=f"state/integration-name/{key}",
+            Body=value,
+        )
+
+    assert integration_state.get_all("path") == {"a": 1, "nested/b": "b"}
+
+
+def test_iter_all_fetches_in_batches(
+    mocker: MockerFixture, integration_state: State, s3_client: S3Client
+) -> None:
+    for i in range(5):
+        s3_client.put_object(
+            Bucket=integration_state.bucket,
+            Key=f"state/integration-name/path/key-{i}",
+            Body=f"{i}",
+        )
+    run = mocker.spy(state.threaded, "run")
+
+    items = integration_state.iter_all("path", thread_pool_size=2)
+    assert next(items) == ("key-0", 0)
+    assert run.call_count == 1
+    assert list(items) == [(f"key-{i}", i) for i in range(1, 5)]
+    assert run.call_count == 3
+
+
+def test_iter_all_missing_key(
+    mocker: MockerFixture, integration_state: State, s3_client: S3Client
+) -> None:
+    mocker.patch.object(integration_state, "ls", return_value=["/path/gone"])
+
+    with pytest.raises(KeyError):
+        list(integration_state.iter_all("path"))
+
+
 def test_exists_for_existing_key(integration_state: State, s3_client: S3Client) -> None:
     key = "some-key"
 
@@ -214,6 +283,73 @@ def test_add_with_metadata(integration_state: State) -> None:
     assert integration_state.get("k") == "v"
 
 
+def test_add_existing_key(integration_state: State) -> None:
+    integration_state.add("k", "v")
+
+    with pytest.raises(KeyError, match="already exists"):
+        integration_state.add("k", "other")
+    assert integration_state.get("k") == "v"
+
+    integration_state.add("k", "other", force=True)
+    assert integration_state.get("k") == "other"
+
+
+#
+# state cache
+#
+
+
+def test_cached_get_revalidates(
+    mocker: MockerFixture, cached_state: State, s3_client: S3Client
+) -> None:
+    key = f"{cached_state.state_path}/k"
+    s3_client.put_object(Bucket=BUCKET, Key=key, Body='"v1"')
+    get_object = mocker.spy(s3_client, "get_object")
+
+    assert cached_state["k"] == "v1"
+    assert "IfNoneMatch" not in get_object.call_args.kwargs
+    # not modified, served from the cache
+    assert cached_state["k"] == "v1"
+    assert "IfNoneMatch" in get_object.call_args.kwargs
+
+    s3_client.put_object(Bucket=BUCKET, Key=key, Body='"v2"')
+    assert cached_state["k"] == "v2"
+
+
+def test_cached_write_through(cached_state: State, state_cache: StateCache) -> None:
+    cached_state.add("k", {"a": "b"}, metadata={"m": "1"})
+
+    cached = state_cache.get(BUCKET, f"{cached_state.state_path}/k")
+    assert cached
+    assert json.loads(cached.body) == {"a": "b"}
+    assert cached.metadata == {"m": "1"}
+    assert cached_state["k"] == {"a": "b"}
+
+    cached_state.rm("k")
+    assert state_cache.get(BUCKET, f"{cached_state.state_path}/k") is None
+    with pytest.raises(KeyError):
+        cached_state["k"]
+
+
+def test_cached_get_deleted_externally(
+    cached_state: State, state_cache: StateCache, s3_client: S3Client
+) -> None:
+    cached_state["k"] = "v"
+    s3_client.delete_object(Bucket=BUCKET, Key=f"{cached_state.state_path}/k")
+
+    with pytest.raises(KeyError):
+        cached_state["k"]
+    assert state_cache.get(BUCKET, f"{cached_state.state_path}/k") is None
+
+
+def test_cached_transaction(cached_state: State) -> None:
+    with cached_state.transaction("feature.foo.bar", "set") as obj:
+        assert not obj.exists
+    with cached_state.transaction("feature.foo.bar", "changed") as obj:
+        assert obj.value == "set"
+    assert cached_state["feature.foo.bar"] == "changed"
+
+
 #
 # aquire settings
 #
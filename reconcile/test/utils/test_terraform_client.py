@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import base64
 import tempfile
+from contextlib import contextmanager
 from logging import DEBUG
 from operator import itemgetter
 from typing import TYPE_CHECKING, Any
@@ -23,7 +24,7 @@ from reconcile.utils.terraform_client import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
 
     from pytest_mock import MockerFixture
 
@@ -1011,6 +1012,7 @@ def test_terraform_init(
 ) -> None:
     mocked_lean_tf = mocker.patch("reconcile.utils.terraform_client.lean_tf")
     mocked_lean_tf.init.return_value = (0, "", "")
+    mocked_lean_tf.plugin_cache_env.return_value = {"TF_PLUGIN_CACHE_DIR": "cache"}
     mocked_tempfile = mocker.patch("reconcile.utils.terraform_client.tempfile")
     mocked_logging = mocker.patch("reconcile.utils.terraform_client.logging")
     warning_log = "a [INFO] b [WARN] c"
@@ -1028,6 +1030,7 @@ def test_terraform_init(
         env={
             "TF_LOG": "TRACE",
             "TF_LOG_PATH": "temp-name",
+            "TF_PLUGIN_CACHE_DIR": "cache",
         },
     )
     mocked_logging.warning.assert_called_once_with(
@@ -1035,6 +1038,72 @@ def test_terraform_init(
     )
 
 
+def test_init_specs_seeds_plugin_cache_first(
+    aws_api: MockAWSApi,
+    mocker: MockerFixture,
+) -> None:
+    calls: list[tuple[str, bool | None]] = []
+    locked: list[bool | None] = [None]
+
+    @contextmanager
+    def plugin_cache_lock(shared: bool = False) -> Iterator[None]:
+        locked[0] = shared
+        yield
+        locked[0] = None
+
+    mocked_lean_tf = mocker.patch("reconcile.utils.terraform_client.lean_tf")
+    mocked_lean_tf.plugin_cache_lock.side_effect = plugin_cache_lock
+    mocker.patch.object(
+        TerraformClient,
+        "terraform_init",
+        autospec=True,
+        side_effect=lambda _, spec: calls.append((spec.name, locked[0])),
+    )
+    mocker.patch.object(TerraformClient, "init_outputs", autospec=True)
+
+    TerraformClient(
+        "integ", "v1", "integ_pfx", [], {"a1": "wd1", "a2": "wd2", "a3": "wd3"}, 2
+    )
+
+    assert calls[0] == ("a1", False)
+    assert sorted(calls[1:]) == [("a2", True), ("a3", True)]
+
+
+def test_init_specs_seeds_plugin_cache_per_provider_version(
+    aws_api: MockAWSApi,
+    mocker: MockerFixture,
+) -> None:
+    calls: list[tuple[str, bool | None]] = []
+    locked: list[bool | None] = [None]
+
+    @contextmanager
+    def plugin_cache_lock(shared: bool = False) -> Iterator[None]:
+        locked[0] = shared
+        yield
+        locked[0] = None
+
+    mocked_lean_tf = mocker.patch("reconcile.utils.terraform_client.lean_tf")
+    mocked_lean_tf.plugin_cache_lock.side_effect = plugin_cache_lock
+    mocker.patch.object(
+        TerraformClient,
+        "terraform_init",
+        autospec=True,
+        side_effect=lambda _, spec: calls.append((spec.name, locked[0])),
+    )
+    mocker.patch.object(TerraformClient, "init_outputs", autospec=True)
+    accounts = [
+        {"name": "a1", "providerVersion": "5.0.0"},
+        {"name": "a2", "providerVersion": "4.0.0"},
+        {"name": "a3", "providerVersion": "5.0.0"},
+    ]
+
+    TerraformClient(
+        "integ", "v1", "integ_pfx", accounts, {"a1": "wd1", "a2": "wd2", "a3": "wd3"}, 2
+    )
+
+    assert calls == [("a1", False), ("a2", False), ("a3", True)]
+
+
 def test_terraform_output(
     tf: TerraformClient,
     mocker: MockerFixture,
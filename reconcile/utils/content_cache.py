@@ -0,0 +1,184 @@
+"""Size-bounded cache for immutable content.
+
+Values are byte strings addressed by a key that identifies their content,
+e.g. a hash over (sha, query) or (repo, path, commit sha), so entries never
+need to be invalidated, only evicted. Mutable content can be stored as well
+if the caller revalidates it (e.g. by ETag) and deletes stale entries. The
+cache has an in-memory LRU tier and an optional on-disk tier that survives
+process restarts. The disk tier is evicted by access time. Its size is
+tracked with a counter, the directory is only scanned when the counter
+exceeds the limit, which also picks up entries written by other processes.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from prometheus_client import Counter
+
+content_cache_requests = Counter(
+    name="qontract_reconcile_content_cache_requests_total",
+    documentation="Content cache lookups by cache and result",
+    labelnames=["cache", "result"],
+)
+
+
+def cache_key(*parts: str) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class ContentCache:
+    def __init__(
+        self,
+        name: str,
+        max_memory_bytes: int,
+        cache_dir: str | None = None,
+        max_disk_bytes: int = 0,
+    ) -> None:
+        self.name = name
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes: int | None = None
+        self._lock = threading.Lock()
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+        if data is not None:
+            self._record("memory_hit")
+            return data
+
+        data = self._read_disk(key)
+        if data is None:
+            self._record("miss")
+            return None
+        self._record("disk_hit")
+        self._put_memory(key, data)
+        return data
+
+    def set(self, key: str, data: bytes) -> None:
+        self._put_memory(key, data)
+        self._write_disk(key, data)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if (old := self._memory.pop(key, None)) is not None:
+                self._memory_bytes -= len(old)
+        if self.cache_dir:
+            self._unlink_disk(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+
+    def _record(self, result: str) -> None:
+        content_cache_requests.labels(cache=self.name, result=result).inc()
+
+    def _put_memory(self, key: str, data: bytes) -> None:
+        with self._lock:
+            if (old := self._memory.pop(key, None)) is not None:
+                self._memory_bytes -= len(old)
+            if len(data) > self.max_memory_bytes:
+                return
+            self._memory[key] = data
+            self._memory_bytes += len(data)
+            while self._memory_bytes > self.max_memory_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted)
+
+    def _path(self, key: str) -> Path:
+        assert self.cache_dir
+        return self.cache_dir / key
+
+    def _read_disk(self, key: str) -> bytes | None:
+        if not self.cache_dir:
+            return None
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        # the access time drives the LRU eviction of the disk tier
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return data
+
+    def _write_disk(self, key: str, data: bytes) -> None:
+        if not self.cache_dir:
+            return
+        if len(data) > self.max_disk_bytes:
+            # don't keep a previous value of the key around
+            self._unlink_disk(key)
+            return
+        path = self._path(key)
+        try:
+            old_size = path.stat().st_size
+        except OSError:
+            old_size = 0
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError as e:
+            logging.debug(f"unable to write {self.name} cache entry {key}: {e}")
+            return
+        with self._lock:
+            if self._disk_bytes is not None:
+                self._disk_bytes += len(data) - old_size
+            sweep = self._disk_bytes is None or self._disk_bytes > self.max_disk_bytes
+        if sweep:
+            self._evict_disk()
+
+    def _unlink_disk(self, key: str) -> None:
+        path = self._path(key)
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except OSError:
+            return
+        with self._lock:
+            if self._disk_bytes is not None:
+                self._disk_bytes = max(0, self._disk_bytes - size)
+
+    def _evict_disk(self) -> None:
+        assert self.cache_dir
+        entries = []
+        total = 0
+        for path in self.cache_dir.iterdir():
+            if path.name.startswith(".tmp-"):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        if total > self.max_disk_bytes:
+            for _, size, path in sorted(entries):
+                with contextlib.suppress(OSError):
+                    path.unlink()
+                total -= size
+                if total <= self.max_disk_bytes:
+                    break
+        with self._lock:
+            self._disk_bytes = total
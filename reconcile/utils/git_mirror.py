@@ -0,0 +1,181 @@
+"""Local cache of bare git mirrors.
+
+Cloning a repository for every helm target is slow when many targets use
+the same chart repository. GitMirror keeps one bare repository per url
+and only fetches refs that are not available locally yet: commit shas
+that were fetched before are served without any network access, other
+refs (branches, tags) are fetched shallowly. Each checkout writes the
+tree of the resolved commit into a private temporary directory, the same
+way a clone does, so callers are free to modify it.
+
+Repositories are protected by file locks, so threads and processes can
+share the mirror directory. Least recently used repositories are evicted
+when the mirror directory grows beyond GIT_MIRROR_MAX_DISK_BYTES.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from reconcile.utils.git import GitError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+GIT_MIRROR_DIR = os.environ.get(
+    "GIT_MIRROR_DIR",
+    os.path.join(tempfile.gettempdir(), "qontract-reconcile-git-mirrors"),
+)
+GIT_MIRROR_MAX_DISK_BYTES = int(
+    os.environ.get("GIT_MIRROR_MAX_DISK_BYTES", str(5 * 1024 * 1024 * 1024))
+)
+LOCK_FILE = ".lock"
+
+
+def _is_full_sha(ref: str) -> bool:
+    return len(ref) == 40 and all(c in "0123456789abcdef" for c in ref)
+
+
+def _disk_usage(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+class GitMirror:
+    def __init__(
+        self,
+        base_dir: str = GIT_MIRROR_DIR,
+        max_disk_bytes: int = GIT_MIRROR_MAX_DISK_BYTES,
+    ) -> None:
+        self.base_dir = Path(base_dir)
+        self.max_disk_bytes = max_disk_bytes
+
+    @contextmanager
+    def checkout(self, url: str, ref: str, verify: bool = True) -> Iterator[str]:
+        """Yield a temporary directory containing the tree of ref."""
+        repo = self._repo_dir(url)
+        with self._lock(repo, shared=False):
+            if not (repo / "HEAD").exists():
+                self._git(repo, "init", "--bare", "--quiet")
+            sha = self._resolve(repo, url, ref, verify)
+            # touch the lock file, its mtime drives the LRU eviction
+            (repo / LOCK_FILE).touch()
+
+        with tempfile.TemporaryDirectory() as wd:
+            with self._lock(repo, shared=True):
+                self._extract(repo, sha, wd)
+            self._evict(keep=repo)
+            yield wd
+
+    def _repo_dir(self, url: str) -> Path:
+        name = hashlib.sha256(url.encode()).hexdigest()[:32]
+        return self.base_dir / f"{name}.git"
+
+    @contextmanager
+    def _lock(self, repo: Path, shared: bool) -> Iterator[None]:
+        # a separate file description per call, so flock also serializes
+        # threads of the same process
+        while True:
+            repo.mkdir(parents=True, exist_ok=True)
+            f = open(repo / LOCK_FILE, "ab")  # noqa: SIM115
+            fcntl.flock(f, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            try:
+                if os.fstat(f.fileno()).st_ino == os.stat(f.name).st_ino:
+                    break
+            except FileNotFoundError:
+                pass
+            # the repository was evicted while waiting for the lock
+            f.close()
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+            f.close()
+
+    def _resolve(self, repo: Path, url: str, ref: str, verify: bool) -> str:
+        if _is_full_sha(ref) and self._has_commit(repo, ref):
+            return ref
+        cmd = [] if verify else ["-c", "http.sslVerify=false"]
+        self._git(repo, *cmd, "fetch", "--quiet", "--depth", "1", url, ref)
+        return self._git(repo, "rev-parse", "FETCH_HEAD^{commit}").strip()
+
+    def _has_commit(self, repo: Path, sha: str) -> bool:
+        result = subprocess.run(
+            ["git", "cat-file", "-e", f"{sha}^{{commit}}"],
+            cwd=repo,
+            capture_output=True,
+            check=False,
+        )
+        return result.returncode == 0
+
+    def _extract(self, repo: Path, sha: str, wd: str) -> None:
+        # not git archive, it skips export-ignore paths. A private index
+        # keeps concurrent checkouts of the same repository apart.
+        with tempfile.TemporaryDirectory() as index_dir:
+            env = os.environ | {
+                "GIT_INDEX_FILE": os.path.join(index_dir, "index"),
+                "GIT_WORK_TREE": wd,
+            }
+            self._git(repo, "read-tree", sha, env=env)
+            self._git(repo, "checkout-index", "--all", env=env)
+
+    def _git(self, cwd: Path, *args: str, env: Mapping[str, str] | None = None) -> str:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=cwd,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if result.returncode != 0:
+            raise GitError(f"git {args[0]} failed: {result.stderr}")
+        return result.stdout
+
+    def _evict(self, keep: Path) -> None:
+        repos = []
+        total = 0
+        for repo in self.base_dir.glob("*.git"):
+            try:
+                last_used = (repo / LOCK_FILE).stat().st_mtime
+                size = _disk_usage(repo)
+            except OSError:
+                continue
+            repos.append((last_used, size, repo))
+            total += size
+        for _, size, repo in sorted(repos):
+            if total <= self.max_disk_bytes:
+                break
+            if repo == keep:
+                continue
+            with open(repo / LOCK_FILE, "ab") as f:
+                try:
+                    fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    # in use
+                    continue
+                logging.debug(f"evicting git mirror {repo}")
+                shutil.rmtree(repo, ignore_errors=True)
+                total -= size
+
+
+_mirror: GitMirror | None = None
+_mirror_lock = threading.Lock()
+
+
+def get_mirror() -> GitMirror:
+    """Return the process-wide git mirror."""
+    global _mirror  # noqa: PLW0603
+    with _mirror_lock:
+        if _mirror is None:
+            _mirror = GitMirror()
+        return _mirror
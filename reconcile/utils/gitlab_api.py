@@ -5,7 +5,7 @@ import logging
 import os
 import re
 import tarfile
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import cached_property
 from operator import attrgetter
 from typing import (
@@ -69,6 +69,43 @@ MR_DESCRIPTION_COMMENT_ID = 0
 
 DEFAULT_MAIN_BRANCH = "master"
 MAX_PER_PAGE = 100
+# GraphQL queries are limited by complexity, nested connections are expensive
+MR_SNAPSHOT_PAGE_SIZE = 20
+MR_SNAPSHOT_PIPELINES = 20
+
+MERGE_REQUESTS_SNAPSHOT_QUERY = """
+query MergeRequestsSnapshot(
+  $project: ID!
+  $state: MergeRequestState!
+  $first: Int!
+  $pipelines: Int!
+  $after: String
+) {
+  project(fullPath: $project) {
+    mergeRequests(state: $state, first: $first, after: $after) {
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+      nodes {
+        iid
+        pipelines(first: $pipelines) {
+          nodes {
+            id
+            iid
+            sha
+            status
+            source
+            createdAt
+            updatedAt
+            path
+          }
+        }
+      }
+    }
+  }
+}
+"""
 
 
 class MRState:
@@ -115,6 +152,20 @@ class Comment:
     note: ProjectMergeRequestNote | None = None
 
 
+@dataclass
+class MergeRequestSnapshot:
+    """Per merge request data, keyed by merge request iid.
+
+    Pipelines are bulk loaded with GraphQL and kept as REST attributes.
+    Label events are not available via GraphQL, they are remembered once
+    fetched."""
+
+    pipelines: dict[int, list[dict[str, Any]]]
+    label_events: dict[int, list[ProjectMergeRequestResourceLabelEvent]] = field(
+        default_factory=dict
+    )
+
+
 class GitLabApi:
     def __init__(
         self,
@@ -146,6 +197,7 @@ class GitLabApi:
             pagination="keyset",
         )
         self._auth()
+        self._mr_snapshot: MergeRequestSnapshot | None = None
         assert self.gl.user
         self.user: CurrentUser = self.gl.user
         if project_id is None:
@@ -366,21 +418,88 @@ class GitLabApi:
     def get_merge_requests(self, state: str) -> list[ProjectMergeRequest]:
         return self.project.mergerequests.list(state=state, get_all=True)
 
-    @staticmethod
+    def load_merge_requests_snapshot(self, state: str = MRState.OPENED) -> None:
+        """Bulk load the pipelines of all merge requests in the given state.
+
+        Instead of one REST request per merge request and accessor, a few
+        paginated GraphQL requests fetch the pipelines of all merge requests.
+        get_merge_request_pipelines and get_merge_request_label_events serve
+        their results from the snapshot until it is reloaded.
+        Merge requests that are not part of the snapshot fall back to REST.
+        """
+        pipelines: dict[int, list[dict[str, Any]]] = {}
+        after: str | None = None
+        while True:
+            data = self._graphql(
+                MERGE_REQUESTS_SNAPSHOT_QUERY,
+                {
+                    "project": self.project.path_with_namespace,
+                    "state": state,
+                    "first": MR_SNAPSHOT_PAGE_SIZE,
+                    "pipelines": MR_SNAPSHOT_PIPELINES,
+                    "after": after,
+                },
+            )
+            merge_requests = data["project"]["mergeRequests"]
+            for node in merge_requests["nodes"]:
+                pipelines[int(node["iid"])] = [
+                    self._pipeline_attrs(p) for p in node["pipelines"]["nodes"]
+                ]
+            if not merge_requests["pageInfo"]["hasNextPage"]:
+                break
+            after = merge_requests["pageInfo"]["endCursor"]
+        self._mr_snapshot = MergeRequestSnapshot(pipelines=pipelines)
+
+    @retry()
+    def _graphql(self, query: str, variables: Mapping[str, Any]) -> dict[str, Any]:
+        result = cast(
+            "dict[str, Any]",
+            self.gl.http_post(
+                f"{self.server.rstrip('/')}/api/graphql",
+                post_data={"query": query, "variables": variables},
+            ),
+        )
+        if errors := result.get("errors"):
+            raise GitlabGetError(error_message="; ".join(e["message"] for e in errors))
+        return result["data"]
+
+    def _pipeline_attrs(self, node: Mapping[str, Any]) -> dict[str, Any]:
+        """Map a GraphQL pipeline node to the attributes of the REST API."""
+        return {
+            # global ids look like gid://gitlab/Ci::Pipeline/123
+            "id": int(node["id"].rsplit("/", 1)[-1]),
+            "iid": int(node["iid"]),
+            "sha": node["sha"],
+            "status": node["status"].lower(),
+            "source": node["source"],
+            "created_at": node["createdAt"],
+            "updated_at": node["updatedAt"],
+            "web_url": f"{self.server.rstrip('/')}{node['path']}",
+        }
+
     def get_merge_request_label_events(
+        self,
         mr: ProjectMergeRequest,
     ) -> list[ProjectMergeRequestResourceLabelEvent]:
-        return mr.resourcelabelevents.list(get_all=True)
+        if self._mr_snapshot is None:
+            return mr.resourcelabelevents.list(get_all=True)
+        label_events = self._mr_snapshot.label_events
+        if mr.iid not in label_events:
+            label_events[mr.iid] = mr.resourcelabelevents.list(get_all=True)
+        return label_events[mr.iid]
 
-    @staticmethod
     def get_merge_request_pipelines(
+        self,
         mr: ProjectMergeRequest,
     ) -> list[ProjectMergeRequestPipeline]:
-        return sorted(
-            mr.pipelines.list(iterator=True),
-            key=attrgetter("created_at"),
-            reverse=True,
-        )
+        if self._mr_snapshot is not None and mr.iid in self._mr_snapshot.pipelines:
+            pipelines = [
+                ProjectMergeRequestPipeline(mr.pipelines, attrs)
+                for attrs in self._mr_snapshot.pipelines[mr.iid]
+            ]
+        else:
+            pipelines = list(mr.pipelines.list(iterator=True))
+        return sorted(pipelines, key=attrgetter("created_at"), reverse=True)
 
     @staticmethod
     def get_merge_request_changed_paths(
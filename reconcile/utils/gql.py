@@ -1,4 +1,8 @@
+from __future__ import annotations
+
 import contextlib
+import copy
+import functools
 import logging
 import textwrap
 import threading
@@ -6,7 +10,7 @@ from datetime import (
     UTC,
     datetime,
 )
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import ParseResult, urlparse
 
 import requests
@@ -24,8 +28,12 @@ from sentry_sdk import capture_exception
 from sretoolbox.utils import retry
 
 from reconcile.status import RunningState
+from reconcile.utils import gql_cache
 from reconcile.utils.config import get_config
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 INTEGRATIONS_QUERY = """
 {
     integrations: integrations_v1 {
@@ -38,6 +46,10 @@ INTEGRATIONS_QUERY = """
 
 requests_logger.setLevel(logging.WARNING)
 
+# parsing a query is expensive and the same few hundred queries are issued
+# over and over again
+_parse_query = functools.lru_cache(maxsize=1024)(gql)
+
 
 def capture_and_forget(error: BaseException) -> None:
     """fire-and-forget an exception to sentry
@@ -93,6 +105,7 @@ class GqlApi:
         validate_schemas: bool = False,
         commit: str | None = None,
         commit_timestamp: str | None = None,
+        use_cache: bool | None = None,
     ) -> None:
         self.url = url
         self.token = token
@@ -100,6 +113,10 @@ class GqlApi:
         self.validate_schemas = validate_schemas
         self.commit = commit
         self.commit_timestamp = commit_timestamp
+        # results of a sha-pinned endpoint never change and can be cached
+        if use_cache is None:
+            use_cache = gql_cache.GQL_CACHE_ENABLED
+        self.sha = gql_cache.sha_from_url(url) if use_cache else None
         self.client = self._init_gql_client()
 
         if validate_schemas and not int_name:
@@ -140,8 +157,13 @@ class GqlApi:
         variables: dict[str, Any] | None = None,
         skip_validation: bool = False,
     ) -> dict[str, Any]:
+        if self.sha:
+            cached = gql_cache.get_cache().get(self.sha, query, variables)
+            if cached is not None:
+                return self._process_result(cached, skip_validation)
+
         try:
-            request = gql(query)
+            request = copy.copy(_parse_query(query))
             if variables:
                 request.variable_values = variables
             result = self.client.execute(request, get_execution_result=True).formatted
@@ -156,6 +178,13 @@ class GqlApi:
         except Exception as e:
             raise GqlApiError("Unexpected error occurred") from e
 
+        if self.sha and "errors" not in result:
+            gql_cache.get_cache().set(self.sha, query, variables, result)
+        return self._process_result(result, skip_validation)
+
+    def _process_result(
+        self, result: Mapping[str, Any], skip_validation: bool
+    ) -> dict[str, Any]:
         # show schemas if log level is debug
         query_schemas = result.get("extensions", {}).get("schemas", [])
         self._queried_schemas.update(query_schemas)
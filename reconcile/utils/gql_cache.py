@@ -0,0 +1,122 @@
+"""Content-addressed cache for GraphQL query results.
+
+Results served from a `/graphqlsha/<sha>` endpoint are immutable for a given
+bundle sha, so they can be cached by (sha, query, variables) in a
+ContentCache. The cache is opt-in via GQL_CACHE_ENABLED, the on-disk tier is
+enabled by GQL_CACHE_DIR.
+
+Long-running integrations move on to a new bundle sha every time
+app-interface changes. Only the entries of the most recent
+GQL_CACHE_MAX_SHAS shas are kept, entries of superseded shas are dropped
+as soon as a newer sha is cached.
+
+Entries are stored serialized, every hit returns a fresh copy, so callers
+are free to mutate query results.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from reconcile.utils import content_cache
+from reconcile.utils.content_cache import ContentCache
+from reconcile.utils.json import json_dumps
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+GQL_CACHE_ENABLED = os.environ.get("GQL_CACHE_ENABLED", "").lower() in {"true", "yes"}
+GQL_CACHE_MAX_MEMORY_BYTES = int(
+    os.environ.get("GQL_CACHE_MAX_MEMORY_BYTES", str(64 * 1024 * 1024))
+)
+GQL_CACHE_MAX_DISK_BYTES = int(
+    os.environ.get("GQL_CACHE_MAX_DISK_BYTES", str(1024 * 1024 * 1024))
+)
+GQL_CACHE_MAX_SHAS = int(os.environ.get("GQL_CACHE_MAX_SHAS", "2"))
+GQL_SHA_PATH_RE = re.compile(r"/graphqlsha/(?P<sha>[0-9a-fA-F]+)/?$")
+
+
+def sha_from_url(url: str) -> str | None:
+    """Return the bundle sha a GraphQL endpoint is pinned to, if any."""
+    if m := GQL_SHA_PATH_RE.search(url):
+        return m.group("sha")
+    return None
+
+
+def cache_key(sha: str, query: str, variables: dict[str, Any] | None) -> str:
+    return content_cache.cache_key(sha, query, json_dumps(variables or {}))
+
+
+class GqlResultCache:
+    def __init__(
+        self,
+        max_memory_bytes: int = GQL_CACHE_MAX_MEMORY_BYTES,
+        cache_dir: str | None = None,
+        max_disk_bytes: int = GQL_CACHE_MAX_DISK_BYTES,
+        max_shas: int = GQL_CACHE_MAX_SHAS,
+    ) -> None:
+        self._content = ContentCache(
+            name="gql",
+            max_memory_bytes=max_memory_bytes,
+            cache_dir=cache_dir,
+            max_disk_bytes=max_disk_bytes,
+        )
+        self.max_shas = max_shas
+        # keys of the cached entries by sha, least recently used sha first
+        self._keys_by_sha: OrderedDict[str, set[str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self, sha: str, query: str, variables: dict[str, Any] | None
+    ) -> dict[str, Any] | None:
+        key = cache_key(sha, query, variables)
+        data = self._content.get(key)
+        if data is None:
+            return None
+        self._track(sha, key)
+        return json.loads(data)
+
+    def set(
+        self,
+        sha: str,
+        query: str,
+        variables: dict[str, Any] | None,
+        value: Mapping[str, Any],
+    ) -> None:
+        key = cache_key(sha, query, variables)
+        self._track(sha, key)
+        self._content.set(key, json_dumps(value, compact=True).encode())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keys_by_sha.clear()
+        self._content.clear()
+
+    def _track(self, sha: str, key: str) -> None:
+        superseded: list[str] = []
+        with self._lock:
+            self._keys_by_sha.setdefault(sha, set()).add(key)
+            self._keys_by_sha.move_to_end(sha)
+            while len(self._keys_by_sha) > self.max_shas:
+                _, keys = self._keys_by_sha.popitem(last=False)
+                superseded.extend(keys)
+        for k in superseded:
+            self._content.delete(k)
+
+
+_cache: GqlResultCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> GqlResultCache:
+    """Return the process-wide GraphQL result cache."""
+    global _cache  # noqa: PLW0603
+    with _cache_lock:
+        if _cache is None:
+            _cache = GqlResultCache(cache_dir=os.environ.get("GQL_CACHE_DIR"))
+        return _cache
@@ -11,7 +11,7 @@ from typing import TYPE_CHECKING, Any
 
 import yaml
 
-from reconcile.utils import git
+from reconcile.utils import git_mirror
 from reconcile.utils.json import json_dumps
 from reconcile.utils.runtime.sharding import ShardSpec
 
@@ -118,9 +118,7 @@ def template_all(
     values: Mapping[str, Any],
     ssl_verify: bool = True,
 ) -> Iterable[Mapping[str, Any]]:
-    with tempfile.TemporaryDirectory() as wd:
-        git.clone(url, wd, depth=1, verify=ssl_verify)
-        git.checkout(ref, wd, verify=ssl_verify)
+    with git_mirror.get_mirror().checkout(url, ref, verify=ssl_verify) as wd:
         return yaml.safe_load_all(
             do_template(values=values, path=f"{wd}{path}", namespace=namespace)
         )
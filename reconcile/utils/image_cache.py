@@ -0,0 +1,194 @@
+"""Process-wide cache for container image manifest lookups.
+
+Validating an image means fetching its manifest from the registry. Many
+targets reference the same image, so lookups are cached by (image url,
+credentials) and concurrent lookups of the same image are deduplicated
+(single flight): only one thread reaches out to the registry while the
+others wait for its result.
+
+Entries for mutable tags expire after IMAGE_CACHE_TTL_SECS. Entries for
+immutable tags (e.g. commit shas) never expire and, when IMAGE_CACHE_DIR is
+set, are also persisted on disk so they survive process restarts.
+Failed lookups are never cached.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from prometheus_client import Counter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+IMAGE_CACHE_MAX_ENTRIES = int(os.environ.get("IMAGE_CACHE_MAX_ENTRIES", "10000"))
+IMAGE_CACHE_TTL_SECS = int(os.environ.get("IMAGE_CACHE_TTL_SECS", "300"))
+
+image_cache_requests = Counter(
+    name="qontract_reconcile_image_cache_requests_total",
+    documentation="Image manifest cache lookups by result",
+    labelnames=["result"],
+)
+
+
+@dataclass(frozen=True)
+class ImageManifest:
+    """The outcome of a successful image lookup."""
+
+    url: str
+    digest: str
+    url_digest: str
+
+
+def image_tag(url: str) -> str | None:
+    """Return the tag of an image url, e.g. `quay.io/org/app:abc` -> `abc`."""
+    _, sep, tag = url.rpartition(":")
+    if not sep or "/" in tag:
+        # no tag or a registry port
+        return None
+    return tag
+
+
+def cache_key(url: str, *credentials: str | None) -> str:
+    # credentials are part of the key, a lookup with different credentials
+    # must not be answered with the result of another one
+    h = hashlib.sha256()
+    for part in (url, *(c or "" for c in credentials)):
+        h.update(part.encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class ImageCache:
+    def __init__(
+        self,
+        max_entries: int = IMAGE_CACHE_MAX_ENTRIES,
+        ttl: int = IMAGE_CACHE_TTL_SECS,
+        cache_dir: str | None = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        # key -> (manifest, expiry or None for immutable entries)
+        self._memory: OrderedDict[str, tuple[ImageManifest, float | None]] = (
+            OrderedDict()
+        )
+        self._inflight: dict[str, Future[ImageManifest | None]] = {}
+        self._lock = threading.Lock()
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(
+        self,
+        key: str,
+        loader: Callable[[], ImageManifest | None],
+        immutable: bool = False,
+    ) -> ImageManifest | None:
+        """Return the cached manifest for key or call loader to fetch it.
+
+        Exceptions raised by loader are propagated to all callers waiting
+        for the same key.
+        """
+        with self._lock:
+            if (manifest := self._get_memory(key)) is not None:
+                image_cache_requests.labels(result="memory_hit").inc()
+                return manifest
+            future = self._inflight.get(key)
+            owner = future is None
+            if future is None:
+                future = self._inflight[key] = Future()
+
+        if not owner:
+            image_cache_requests.labels(result="inflight_hit").inc()
+            return future.result()
+
+        try:
+            manifest = self._read_disk(key) if immutable else None
+            if manifest is not None:
+                image_cache_requests.labels(result="disk_hit").inc()
+            else:
+                image_cache_requests.labels(result="miss").inc()
+                manifest = loader()
+                if manifest is not None and immutable:
+                    self._write_disk(key, manifest)
+            if manifest is not None:
+                self._put_memory(key, manifest, immutable)
+            future.set_result(manifest)
+            return manifest
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+
+    def _get_memory(self, key: str) -> ImageManifest | None:
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        manifest, expiry = entry
+        if expiry is not None and expiry < time.monotonic():
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        return manifest
+
+    def _put_memory(self, key: str, manifest: ImageManifest, immutable: bool) -> None:
+        expiry = None if immutable else time.monotonic() + self.ttl
+        with self._lock:
+            self._memory[key] = (manifest, expiry)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _path(self, key: str) -> Path:
+        assert self.cache_dir
+        return self.cache_dir / f"{key}.json"
+
+    def _read_disk(self, key: str) -> ImageManifest | None:
+        if not self.cache_dir:
+            return None
+        try:
+            data: dict[str, Any] = json.loads(self._path(key).read_bytes())
+            return ImageManifest(**data)
+        except OSError, ValueError, TypeError:
+            return None
+
+    def _write_disk(self, key: str, manifest: ImageManifest) -> None:
+        if not self.cache_dir:
+            return
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(asdict(manifest), f)
+            os.replace(tmp, self._path(key))
+        except OSError as e:
+            logging.debug(f"unable to write image cache entry {key}: {e}")
+
+
+_cache: ImageCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> ImageCache:
+    """Return the process-wide image manifest cache."""
+    global _cache  # noqa: PLW0603
+    with _cache_lock:
+        if _cache is None:
+            _cache = ImageCache(cache_dir=os.environ.get("IMAGE_CACHE_DIR"))
+        return _cache
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import time
 from datetime import datetime
-from typing import TYPE_CHECKING, Protocol, TextIO
+from typing import TYPE_CHECKING, Any, Protocol, TextIO
 
 from kubernetes.client import (
     ApiClient,
@@ -21,6 +21,7 @@ from reconcile.utils.jobcontroller.models import (
     JobValidationError,
     K8sJob,
 )
+from reconcile.utils.oc import OCNative, WatchExpiredError
 from reconcile.utils.oc_map import init_oc_map_from_clusters
 from reconcile.utils.openshift_resource import OpenshiftResource
 
@@ -46,6 +47,9 @@ def build_job_controller(
     is expected to exist in the cluster.
 
     If dry_run is set to True, the controller will not perform any changes to the cluster.
+
+    With the native client, the controller watches the jobs of the namespace while
+    waiting for jobs to complete instead of listing them on every check.
     """
     clusters = get_clusters_minimal(name=cluster)
     oc_map = init_oc_map_from_clusters(
@@ -66,6 +70,10 @@ def build_job_controller(
     )
 
 
+JOB_KIND = "Job.batch"
+TERMINAL_JOB_STATUSES = {JobStatus.SUCCESS, JobStatus.ERROR}
+
+
 class TimeProtocol(Protocol):
     def time(self) -> float: ...
 
@@ -90,6 +98,11 @@ class K8sJobController:
         self.oc = oc
         self.dry_run = dry_run
         self.time_module = time_module
+        # With the native client, waiting for jobs lists the namespace once
+        # and then updates the cache from a watch anchored at the
+        # resourceVersion of that list, instead of listing all jobs on every
+        # check.
+        self._resource_version: str | None = None
         self._cache: dict[str, OpenshiftResource] | None = None
 
     @property
@@ -102,20 +115,26 @@ class K8sJobController:
         """
         Updates the cache with the latest jobs in the namespace.
         """
-        new_cache = {}
-        for item in self.oc.get_items(
-            kind="Job.batch",
-            namespace=self.namespace,
-        ):
-            openshift_resource = OpenshiftResource(
-                body=item,
-                integration=self.integration,
-                integration_version=self.integration_version,
+        if isinstance(self.oc, OCNative):
+            items, self._resource_version = self.oc.list_items(
+                kind=JOB_KIND, namespace=self.namespace
             )
+        else:
+            items = self.oc.get_items(kind=JOB_KIND, namespace=self.namespace)
+        new_cache = {}
+        for item in items:
+            openshift_resource = self._build_resource(item)
             new_cache[openshift_resource.name] = openshift_resource
         self._cache = new_cache
         return self._cache
 
+    def _build_resource(self, item: dict[str, Any]) -> OpenshiftResource:
+        return OpenshiftResource(
+            body=item,
+            integration=self.integration,
+            integration_version=self.integration_version,
+        )
+
     def get_job_generation(self, job_name: str) -> str | None:
         """
         Returns the generation annotation for a job.
@@ -188,12 +207,13 @@ class K8sJobController:
         )
 
         start_time = self.time_module.time()
-        while jobs_left:
+        if jobs_left:
             self.update_cache()
+        while jobs_left:
             for job_name in list(jobs_left):
                 status = self.get_job_status(job_name)
                 job_statuses[job_name] = status
-                if status in {JobStatus.SUCCESS, JobStatus.ERROR}:
+                if status in TERMINAL_JOB_STATUSES:
                     jobs_left.remove(job_name)
             if jobs_left:
                 elapsed_time = self.time_module.time() - start_time
@@ -205,8 +225,8 @@ class K8sJobController:
                 logging.info(
                     f"Waiting for {jobs_left} to complete. Rechecking in {check_interval_seconds} seconds"
                 )
-                self._sleep_until_timeout(
-                    elapsed_time, timeout_seconds, check_interval_seconds
+                self._wait_for_job_changes(
+                    jobs_left, elapsed_time, timeout_seconds, check_interval_seconds
                 )
         return job_statuses
 
@@ -369,8 +389,8 @@ class K8sJobController:
         the function will wait indefinitely. If a timeout occures, a TimeoutError will be raised.
         """
         start_time = self.time_module.time()
+        self.update_cache()
         while True:
-            self.update_cache()
             status = self.get_job_status(job_name)
             match status:
                 case JobStatus.SUCCESS:
@@ -380,9 +400,78 @@ class K8sJobController:
             elapsed_time = self.time_module.time() - start_time
             if timeout_seconds >= 0 and elapsed_time >= timeout_seconds:
                 raise TimeoutError(f"Timeout waiting for job {job_name} to complete")
+            self._wait_for_job_changes(
+                {job_name}, elapsed_time, timeout_seconds, check_interval_seconds
+            )
+
+    def _wait_for_job_changes(
+        self,
+        job_names: set[str],
+        elapsed_time: float,
+        timeout_seconds: float,
+        check_interval_seconds: float,
+    ) -> None:
+        """
+        Waits up to check_interval_seconds (bounded by the timeout) and brings the
+        cache up to date. With the native client, returns as soon as one of the
+        given jobs reaches a terminal state. If the watch expired, the jobs are listed again.
+        """
+        interval_seconds = self._interval_until_timeout(
+            elapsed_time, timeout_seconds, check_interval_seconds
+        )
+        # the watch timeout has a resolution of seconds, the remainder of a
+        # timeout below one second is slept like without a watch
+        if not isinstance(self.oc, OCNative) or interval_seconds < 1:
             self._sleep_until_timeout(
                 elapsed_time, timeout_seconds, check_interval_seconds
             )
+            self.update_cache()
+            return
+
+        try:
+            self._watch_jobs(self.oc, job_names, int(interval_seconds))
+        except WatchExpiredError as e:
+            logging.info(f"{e}, listing jobs in {self.namespace} again")
+            self.update_cache()
+
+    def _watch_jobs(
+        self, oc: OCNative, job_names: set[str], timeout_seconds: int
+    ) -> None:
+        if self._resource_version is None:
+            self.update_cache()
+        assert self._resource_version is not None
+        cache = self.cache
+        for event_type, item in oc.watch_items(
+            kind=JOB_KIND,
+            namespace=self.namespace,
+            resource_version=self._resource_version,
+            timeout_seconds=timeout_seconds,
+        ):
+            metadata = item["metadata"]
+            self._resource_version = metadata["resourceVersion"]
+            match event_type:
+                case "ADDED" | "MODIFIED":
+                    cache[metadata["name"]] = self._build_resource(item)
+                case "DELETED":
+                    cache.pop(metadata["name"], None)
+                case _:
+                    # BOOKMARK events only move the resourceVersion
+                    continue
+            if (
+                metadata["name"] in job_names
+                and self.get_job_status(metadata["name"]) in TERMINAL_JOB_STATUSES
+            ):
+                return
+
+    def _interval_until_timeout(
+        self,
+        elapsed_time: float,
+        timeout_seconds: float,
+        default_interval_seconds: float,
+    ) -> float:
+        if timeout_seconds >= 0:
+            return min(default_interval_seconds, timeout_seconds - elapsed_time)
+        return default_interval_seconds
 
     def _sleep_until_timeout(
         self,
@@ -390,11 +479,9 @@ class K8sJobController:
         timeout_seconds: float,
         default_sleep_interval_seconds: float,
     ) -> None:
-        sleep_interval_seconds = default_sleep_interval_seconds
-        if timeout_seconds >= 0:
-            sleep_interval_seconds = min(
-                default_sleep_interval_seconds, timeout_seconds - elapsed_time
-            )
+        sleep_interval_seconds = self._interval_until_timeout(
+            elapsed_time, timeout_seconds, default_sleep_interval_seconds
+        )
         if sleep_interval_seconds > 0:
             self.time_module.sleep(sleep_interval_seconds)
 
@@ -1,4 +1,5 @@
 import logging
+import threading
 from functools import (
     lru_cache,
     reduce,
@@ -7,9 +8,27 @@ from itertools import zip_longest
 
 import jsonpath_ng
 import jsonpath_ng.ext.filter
+from jsonpath_ng.ext.parser import ExtentedJsonPathParser
+from jsonpath_ng.parser import JsonPathParser
 
+_parsers = threading.local()
 
-@lru_cache(maxsize=256)
+
+def _parser(extended: bool) -> JsonPathParser:
+    """
+    jsonpath_ng builds the PLY parse tables whenever a parser is created,
+    which takes far longer than parsing an expression. Parsers keep state
+    while parsing, so every thread reuses its own.
+    """
+    attr = "extended" if extended else "regular"
+    if (parser := getattr(_parsers, attr, None)) is None:
+        parser = ExtentedJsonPathParser() if extended else JsonPathParser()
+        setattr(_parsers, attr, parser)
+    return parser
+
+
+# templated change-type expressions are rendered per file, so there are many
+@lru_cache(maxsize=8192)
 def parse_jsonpath(jsonpath_expression: str) -> jsonpath_ng.JSONPath:
     """
     parses a JSONPath expression and returns a JSONPath object.
@@ -19,7 +38,7 @@ def parse_jsonpath(jsonpath_expression: str) -> jsonpath_ng.JSONPath:
         try:
             # the regular parser is faster, but does not support filters
             # we will success in this branch most of the time
-            return jsonpath_ng.parse(jsonpath_expression)
+            return _parser(extended=False).parse(jsonpath_expression)
         except Exception:
             # something we did not cover in our prechecks prevented the use of the
             # regular parser. we will try the extended parser, which supports filters
@@ -28,7 +47,7 @@ def parse_jsonpath(jsonpath_expression: str) -> jsonpath_ng.JSONPath:
                 f"Unable to parse '{jsonpath_expression}' with the regular parser"
             )
 
-    return jsonpath_ng.ext.parse(jsonpath_expression)
+    return _parser(extended=True).parse(jsonpath_expression)
 
 
 def narrow_jsonpath_node(
@@ -1,13 +1,51 @@
 from __future__ import annotations
 
+import fcntl
 import json
 import logging
 import os
 import subprocess
+import tempfile
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterator, Mapping
+
+# Providers are shared between all working dirs through the plugin cache.
+# Providers baked into the image (implicit local mirror) are linked into the
+# cache on first use, everything else is downloaded once.
+TF_PLUGIN_CACHE_DIR = os.environ.get("TF_PLUGIN_CACHE_DIR") or os.path.join(
+    tempfile.gettempdir(), "terraform-plugin-cache"
+)
+PLUGIN_CACHE_LOCK_FILE = ".qontract-reconcile.lock"
+
+
+def plugin_cache_env(cache_dir: str = TF_PLUGIN_CACHE_DIR) -> dict[str, str]:
+    return {
+        "TF_PLUGIN_CACHE_DIR": cache_dir,
+        # working dirs are rendered without a dependency lock file, without
+        # this terraform >= 1.4 ignores the cache
+        "TF_PLUGIN_CACHE_MAY_BREAK_DEPENDENCY_LOCK_FILE": "true",
+    }
+
+
+@contextmanager
+def plugin_cache_lock(
+    cache_dir: str = TF_PLUGIN_CACHE_DIR, shared: bool = False
+) -> Iterator[None]:
+    """
+    Lock the plugin cache. Terraform does not guard concurrent writes to the
+    cache, so the init that populates it must hold the exclusive lock while
+    inits that only link providers from it can share the lock.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(os.path.join(cache_dir, PLUGIN_CACHE_LOCK_FILE), "ab") as f:
+        fcntl.flock(f, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
 
 
 def state_rm_access_key(
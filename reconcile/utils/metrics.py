@@ -70,6 +70,19 @@ execution_counter = Counter(
     labelnames=["integration", "shards", "shard_id"],
 )
 
+run_trigger_counter = Counter(
+    name="qontract_reconcile_run_trigger_total",
+    documentation="Counts started integration executions by what triggered them",
+    labelnames=["integration", "shards", "shard_id", "trigger"],
+)
+
+run_trigger_latency = Histogram(
+    name="qontract_reconcile_run_trigger_latency_seconds",
+    documentation="Seconds between a new bundle sha being committed and starting a run",
+    labelnames=["integration", "shards", "shard_id"],
+    buckets=(0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 600.0, float("inf")),
+)
+
 reconcile_time = Histogram(
     name="qontract_reconcile_function_elapsed_seconds_since_bundle_commit",
     documentation="Run time seconds for tracked functions",
@@ -84,6 +97,13 @@ oc_get_items_duration = Histogram(
     buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, float("inf")),
 )
 
+terraform_init_duration = Histogram(
+    name="qontract_reconcile_terraform_init_seconds",
+    documentation="Duration of terraform init per account",
+    labelnames=["integration", "account"],
+    buckets=(1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, float("inf")),
+)
+
 registry_reachouts = Counter(
     name="qontract_reconcile_registry_get_manifest_total",
     documentation="Number of GET requests on image registries",
@@ -132,6 +152,48 @@ slack_request = Counter(
     labelnames=["resource", "verb"],
 )
 
+github_request = Counter(
+    name="qontract_reconcile_github_request_total",
+    documentation="Number of calls made to GitHub API by rate limit resource",
+    labelnames=["org", "resource"],
+)
+
+github_rate_limit_remaining = Gauge(
+    name="qontract_reconcile_github_rate_limit_remaining",
+    documentation="Remaining GitHub API rate limit budget",
+    labelnames=["org", "resource"],
+)
+
+github_rate_limit = Gauge(
+    name="qontract_reconcile_github_rate_limit",
+    documentation="GitHub API rate limit budget",
+    labelnames=["org", "resource"],
+)
+
+vault_replication_secrets = Counter(
+    name="qontract_reconcile_vault_replication_secrets_total",
+    documentation="Secrets processed by vault-replication, by result",
+    labelnames=["source", "destination", "result"],
+)
+
+vault_replication_pending_secrets = Gauge(
+    name="qontract_reconcile_vault_replication_pending_secrets",
+    documentation="Secrets left to process in the current vault-replication run",
+    labelnames=["source", "destination"],
+)
+
+container_registry_mirror_tags = Counter(
+    name="qontract_reconcile_container_registry_mirror_tags_total",
+    documentation="Tags processed by container registry mirrors, by result",
+    labelnames=["source", "destination", "result"],
+)
+
+container_registry_mirror_sync_seconds = Counter(
+    name="qontract_reconcile_container_registry_mirror_sync_seconds_total",
+    documentation="Time spent comparing and copying the tags of a mirror",
+    labelnames=["source", "destination"],
+)
+
 
 #
 # Class based metrics
@@ -1,28 +1,33 @@
 from __future__ import annotations
 
 import copy
+import hashlib
 import itertools
 import json
 import logging
 import os
 import pathlib
 import re
+import shutil
 import subprocess
+import tempfile
 import threading
 import time
+import weakref
 from collections import defaultdict
 from contextlib import suppress
 from dataclasses import dataclass
 from functools import cache, wraps
 from subprocess import Popen
 from threading import Lock
-from typing import TYPE_CHECKING, Any, Self, TextIO, cast
+from typing import TYPE_CHECKING, Any, NoReturn, Self, TextIO, cast
 
 import urllib3
 from kubernetes.client import (
     ApiClient,
     Configuration,
 )
+from kubernetes.client.exceptions import ApiException
 from kubernetes.dynamic.client import DynamicClient
 from kubernetes.dynamic.discovery import (
     LazyDiscoverer,
@@ -30,6 +35,7 @@ from kubernetes.dynamic.discovery import (
 )
 from kubernetes.dynamic.exceptions import (
     ForbiddenError,
+    GoneError,
     InternalServerError,
     NotFoundError,
     ResourceNotFoundError,
@@ -57,13 +63,38 @@ from reconcile.utils.secret_reader import (
 from reconcile.utils.unleash import get_feature_toggle_state
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable, Mapping
+    from collections.abc import Callable, Iterable, Iterator, Mapping
 
     from reconcile.utils.oc_connection_parameters import OCConnectionParameters
 
 urllib3.disable_warnings()
 
 GET_REPLICASET_MAX_ATTEMPTS = 20
+# number of items requested per LIST call when iterating over items
+DEFAULT_LIST_PAGE_SIZE = int(os.environ.get("OC_LIST_PAGE_SIZE", "500"))
+# how often a paginated LIST is restarted when its continue token expires
+MAX_LIST_RESTARTS = 3
+# field manager used for create and replace requests of the native client
+FIELD_MANAGER = "qontract-reconcile"
+# field manager of `oc apply --server-side`. The native client applies with
+# the same manager, so objects applied by either client have one owner and
+# fields removed from the desired state are pruned.
+APPLY_FIELD_MANAGER = "kubectl"
+# field managers of the update operations of `oc apply`, `oc create` and
+# `oc replace` and of the native create and replace. Their fields are moved
+# to APPLY_FIELD_MANAGER before the native client applies an object, like
+# `kubectl apply --server-side` does for client-side applied objects.
+UPDATE_FIELD_MANAGERS = frozenset({
+    "kubectl-client-side-apply",
+    "kubectl-create",
+    "kubectl-replace",
+    FIELD_MANAGER,
+})
+# oc keeps its discovery and http caches here, one directory per server
+OC_CACHE_DIR = os.environ.get(
+    "OC_CACHE_DIR",
+    os.path.join(tempfile.gettempdir(), "qontract-reconcile-oc-cache"),
+)
 DEFAULT_GROUP = ""
 PROJECT_KIND = "Project.project.openshift.io"
 POD_RECYCLE_SUPPORTED_TRIGGER_KINDS = [
@@ -148,6 +179,14 @@ class KindNotFoundError(Exception):
     pass
 
 
+class ListExpiredError(StatusCodeError):
+    pass
+
+
+class WatchExpiredError(Exception):
+    pass
+
+
 class AmbiguousResourceTypeError(Exception):
     pass
 
@@ -256,6 +295,113 @@ def equal_spec_template(t1: dict, t2: dict) -> bool:
     return t1_copy == t2_copy
 
 
+def raise_for_apply_error(server: str | None, err: str) -> None:
+    """Raise the exception matching a known error of a write request.
+
+    `err` is the error as printed by `oc`. Unknown errors are left to the
+    caller."""
+    if "Invalid value: 0x0" in err:
+        raise InvalidValueApplyError(f"[{server}]: {err}")
+    if "Invalid value: " in err:
+        if ": field is immutable" in err:
+            if "The Deployment" in err:
+                raise DeploymentFieldIsImmutableError(f"[{server}]: {err}")
+            raise FieldIsImmutableError(f"[{server}]: {err}")
+        if ": may not change once set" in err:
+            raise MayNotChangeOnceSetError(f"[{server}]: {err}")
+        if ": primary clusterIP can not be unset" in err:
+            raise PrimaryClusterIPCanNotBeUnsetError(f"[{server}]: {err}")
+        raise StatusCodeError(f"[{server}]: {err}")
+    if "metadata.annotations: Too long" in err:
+        raise MetaDataAnnotationsTooLongApplyError(f"[{server}]: {err}")
+    if "UnsupportedMediaType" in err:
+        raise UnsupportedMediaTypeError(f"[{server}]: {err}")
+    if "updates to statefulset spec for fields other than" in err:
+        raise StatefulSetUpdateForbiddenError(f"[{server}]: {err}")
+    if "the object has been modified" in err:
+        raise ObjectHasBeenModifiedError(f"[{server}]: {err}")
+    if "Request entity too large" in err:
+        raise RequestEntityTooLargeError(f"[{server}]: {err}")
+
+
+def _merge_fields(a: Mapping[str, Any], b: Mapping[str, Any]) -> dict[str, Any]:
+    merged = dict(a)
+    for key, value in b.items():
+        merged[key] = _merge_fields(merged.get(key) or {}, value)
+    return merged
+
+
+def upgrade_managed_fields(
+    managed_fields: Iterable[Mapping[str, Any]],
+    update_managers: Iterable[str] = UPDATE_FIELD_MANAGERS,
+    apply_manager: str = APPLY_FIELD_MANAGER,
+) -> list[dict[str, Any]] | None:
+    """Move the fields owned by the update operations of update_managers to
+    the apply operation of apply_manager, like k8s.io/client-go csaupgrade.
+
+    Server-side apply only removes fields that are owned by the applying
+    manager alone. Fields set by a client-side apply are owned by
+    kubectl-client-side-apply and would never be removed from the object
+    once they are removed from the desired state. Returns None if there is
+    nothing to upgrade."""
+    update_managers = set(update_managers)
+    upgraded: list[dict[str, Any]] = []
+    update_entries: list[Mapping[str, Any]] = []
+    apply_entry: dict[str, Any] | None = None
+    for entry in managed_fields:
+        if entry.get("subresource"):
+            upgraded.append(dict(entry))
+        elif (
+            entry.get("manager") in update_managers
+            and entry.get("operation") == "Update"
+        ):
+            update_entries.append(entry)
+        elif (
+            entry.get("manager") == apply_manager and entry.get("operation") == "Apply"
+        ):
+            apply_entry = dict(entry)
+            upgraded.append(apply_entry)
+        else:
+            upgraded.append(dict(entry))
+    if not update_entries:
+        return None
+    if apply_entry is None:
+        apply_entry = dict(update_entries[0]) | {
+            "manager": apply_manager,
+            "operation": "Apply",
+            "fieldsV1": {},
+        }
+        upgraded.append(apply_entry)
+    for entry in update_entries:
+        apply_entry["fieldsV1"] = _merge_fields(
+            apply_entry.get("fieldsV1") or {}, entry.get("fieldsV1") or {}
+        )
+    return upgraded
+
+
+def apply_output_name(resource: OR) -> str:
+    """Return the name `oc apply -o name` prints for the resource."""
+    group = resource.body["apiVersion"].rpartition("/")[0]
+    kind = resource.kind.lower()
+    return f"{kind}.{group}/{resource.name}" if group else f"{kind}/{resource.name}"
+
+
+def api_exception_message(e: ApiException) -> str:
+    """Render a kubernetes API error the way `oc` prints it, so the error
+    can be classified by raise_for_apply_error."""
+    try:
+        status = json.loads(e.body)
+    except TypeError, ValueError:
+        return str(e)
+    message = status.get("message") or str(e)
+    details = status.get("details") or {}
+    reason = status.get("reason") or e.reason
+    if reason == "Invalid" and details.get("kind"):
+        cause = message.split(" is invalid: ", 1)[-1]
+        return f'The {details["kind"]} "{details.get("name", "")}" is invalid: {cause}'
+    return f"Error from server ({reason}): {message}"
+
+
 @dataclass
 class OCCliApiResource:
     """This class mimics kubernetes.dynamic.resource.Resource and it's used
@@ -339,16 +485,9 @@ class OCCli:
         """
         self.cluster_name = cluster_name
         self.server = server
-        oc_base_cmd = ["oc", "--kubeconfig", "/dev/null"]
-        if insecure_skip_tls_verify:
-            oc_base_cmd.extend(["--insecure-skip-tls-verify"])
-        if server:
-            oc_base_cmd.extend(["--server", server])
-
-        if token:
-            oc_base_cmd.extend(["--token", token])
-
-        self.oc_base_cmd = oc_base_cmd
+        self.oc_base_cmd = self._build_oc_base_cmd(
+            server, token, insecure_skip_tls_verify
+        )
 
         # calling get_version to check if cluster is reachable
         if not local:
@@ -374,6 +513,11 @@ class OCCli:
             "LOG_SLOW_OC_RECONCILE", ""
         ).lower() in {"true", "yes"}
 
+        self.batch_apply = os.environ.get("OC_BATCH_APPLY", "").lower() in {
+            "true",
+            "yes",
+        }
+
     def _init(
         self,
         connection_parameters: OCConnectionParameters,
@@ -383,11 +527,6 @@ class OCCli:
     ) -> None:
         self.cluster_name = connection_parameters.cluster_name
         self.server = connection_parameters.server_url
-        oc_base_cmd = ["oc", "--kubeconfig", "/dev/null"]
-        if connection_parameters.skip_tls_verify:
-            oc_base_cmd.extend(["--insecure-skip-tls-verify"])
-        if self.server:
-            oc_base_cmd.extend(["--server", self.server])
 
         token = connection_parameters.automation_token
         if (
@@ -396,10 +535,9 @@ class OCCli:
         ):
             token = connection_parameters.cluster_admin_automation_token
 
-        if token:
-            oc_base_cmd.extend(["--token", token])
-
-        self.oc_base_cmd = oc_base_cmd
+        self.oc_base_cmd = self._build_oc_base_cmd(
+            self.server, token, bool(connection_parameters.skip_tls_verify)
+        )
 
         # calling get_version to check if cluster is reachable
         if not local:
@@ -425,11 +563,69 @@ class OCCli:
             "LOG_SLOW_OC_RECONCILE", ""
         ).lower() in {"true", "yes"}
 
+        self.batch_apply = os.environ.get("OC_BATCH_APPLY", "").lower() in {
+            "true",
+            "yes",
+        }
+
+    def _build_oc_base_cmd(
+        self, server: str | None, token: str | None, insecure_skip_tls_verify: bool
+    ) -> list[str]:
+        """Return the base command for all oc calls of this client.
+
+        With a server, the connection settings are written to a kubeconfig
+        that lives as long as the client and oc gets a persistent cache
+        directory per server, so that API discovery is not repeated for
+        every call. Without a server (local mode) no kubeconfig is used."""
+        if not server:
+            oc_base_cmd = ["oc", "--kubeconfig", "/dev/null"]
+            if insecure_skip_tls_verify:
+                oc_base_cmd.extend(["--insecure-skip-tls-verify"])
+            if token:
+                oc_base_cmd.extend(["--token", token])
+            return oc_base_cmd
+
+        self._kubeconfig_dir = tempfile.mkdtemp(prefix="qontract-reconcile-oc-")
+        # the kubeconfig contains a token, make sure it is removed
+        # even if cleanup is never called
+        self._kubeconfig_finalizer = weakref.finalize(
+            self, shutil.rmtree, self._kubeconfig_dir, True
+        )
+        kubeconfig = os.path.join(self._kubeconfig_dir, "kubeconfig")
+        cluster: dict[str, Any] = {"server": server}
+        if insecure_skip_tls_verify:
+            cluster["insecure-skip-tls-verify"] = True
+        fd = os.open(kubeconfig, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(
+                json_dumps({
+                    "apiVersion": "v1",
+                    "kind": "Config",
+                    "clusters": [{"name": "cluster", "cluster": cluster}],
+                    "users": [
+                        {"name": "user", "user": {"token": token} if token else {}}
+                    ],
+                    "contexts": [
+                        {
+                            "name": "context",
+                            "context": {"cluster": "cluster", "user": "user"},
+                        }
+                    ],
+                    "current-context": "context",
+                })
+            )
+
+        cache_dir = os.path.join(
+            OC_CACHE_DIR, hashlib.sha256(server.encode()).hexdigest()[:16]
+        )
+        return ["oc", "--kubeconfig", kubeconfig, "--cache-dir", cache_dir]
+
     def whoami(self) -> bytes:
         return self._run(["whoami"])
 
     def cleanup(self) -> None:
-        pass
+        if finalizer := getattr(self, "_kubeconfig_finalizer", None):
+            finalizer()
 
     def get_items(self, kind: str, **kwargs: Any) -> list[dict[str, Any]]:
         start_time = time.monotonic()
@@ -444,11 +640,16 @@ class OCCli:
                     if not self.project_exists(namespace):
                         return []
                     cmd.extend(["-n", namespace])
+            elif kwargs.get("all_namespaces"):
+                cmd.append("--all-namespaces")
 
             if "labels" in kwargs:
                 labels_list = [f"{k}={v}" for k, v in kwargs.get("labels", {}).items()]
                 cmd += ["-l", ",".join(labels_list)]
 
+            if page_size := kwargs.get("page_size"):
+                cmd.append(f"--chunk-size={page_size}")
+
             resource_names = kwargs.get("resource_names")
             if resource_names:
                 resource_items = []
@@ -473,6 +674,20 @@ class OCCli:
                 kind=kind,
             ).observe(duration)
 
+    def iter_items(
+        self,
+        kind: str,
+        page_size: int = DEFAULT_LIST_PAGE_SIZE,
+        **kwargs: Any,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield the items of the given kind.
+
+        Accepts the same keyword arguments as get_items. `oc get` always
+        prints the complete list, so the CLI client can only page the
+        request on the API server side (--chunk-size) and yields the items
+        once the list has been read."""
+        yield from self.get_items(kind, page_size=page_size, **kwargs)
+
     def get(
         self,
         namespace: str | None,
@@ -548,6 +763,42 @@ class OCCli:
         self._run(cmd, stdin=resource.to_json(), apply=True)
         return self._msg_to_process_reconcile_time(namespace, resource)
 
+    def apply_batch(self, namespace: str, resources: Iterable[OR]) -> set[str]:
+        """Apply multiple resources of a namespace with a single `oc apply`
+        and return the names of the resources that were applied.
+
+        oc applies every object of the list on its own and reports failures
+        on stderr without a parsable per-object format. Callers are expected
+        to apply the resources missing in the result one by one to get the
+        specific error."""
+        resources_by_output_name = {apply_output_name(r): r for r in resources}
+        if not resources_by_output_name:
+            return set()
+        cmd = ["apply", "-n", namespace, "-o", "name", "-f", "-"]
+        stdin = json_dumps({
+            "apiVersion": "v1",
+            "kind": "List",
+            "items": [r.body for r in resources_by_output_name.values()],
+        })
+        oc_run_execution_counter.labels(integration=RunningState().integration).inc()
+        result = subprocess.run(
+            self.oc_base_cmd + cmd,
+            input=stdin.encode(),
+            capture_output=True,
+            check=False,
+        )
+        applied = {
+            r.name
+            for line in result.stdout.decode("utf-8").splitlines()
+            if (r := resources_by_output_name.get(line.strip()))
+        }
+        if result.returncode != 0:
+            logging.debug(
+                f"[{self.server}/{namespace}] batch apply applied {len(applied)} "
+                f"of {len(resources_by_output_name)} resources"
+            )
+        return applied
+
     @OCDecorators.process_reconcile_time
     def create(
         self, namespace: str, resource: OR
@@ -1148,34 +1399,7 @@ class OCCli:
             if "Unable to connect to the server" in err:
                 raise StatusCodeError(f"[{self.server}]: {err}")
             if kwargs.get("apply"):
-                if "Invalid value: 0x0" in err:
-                    raise InvalidValueApplyError(f"[{self.server}]: {err}")
-                if "Invalid value: " in err:
-                    if ": field is immutable" in err:
-                        if "The Deployment" in err:
-                            raise DeploymentFieldIsImmutableError(
-                                f"[{self.server}]: {err}"
-                            )
-                        raise FieldIsImmutableError(f"[{self.server}]: {err}")
-                    if ": may not change once set" in err:
-                        raise MayNotChangeOnceSetError(f"[{self.server}]: {err}")
-                    if ": primary clusterIP can not be unset" in err:
-                        raise PrimaryClusterIPCanNotBeUnsetError(
-                            f"[{self.server}]: {err}"
-                        )
-                    raise StatusCodeError(f"[{self.server}]: {err}")
-                if "metadata.annotations: Too long" in err:
-                    raise MetaDataAnnotationsTooLongApplyError(
-                        f"[{self.server}]: {err}"
-                    )
-                if "UnsupportedMediaType" in err:
-                    raise UnsupportedMediaTypeError(f"[{self.server}]: {err}")
-                if "updates to statefulset spec for fields other than" in err:
-                    raise StatefulSetUpdateForbiddenError(f"[{self.server}]: {err}")
-                if "the object has been modified" in err:
-                    raise ObjectHasBeenModifiedError(f"[{self.server}]: {err}")
-                if "Request entity too large" in err:
-                    raise RequestEntityTooLargeError(f"[{self.server}]: {err}")
+                raise_for_apply_error(self.server, err)
             if not (allow_not_found and "NotFound" in err):
                 raise StatusCodeError(f"[{self.server}]: {err}")
 
@@ -1297,7 +1521,11 @@ class OCNative(OCCli):
         local: bool = False,
         insecure_skip_tls_verify: bool = False,
         connection_parameters: OCConnectionParameters | None = None,
+        native_writes: bool = False,
     ) -> None:
+        """With native_writes, apply, create, replace, patch and delete are
+        sent through the dynamic client instead of running `oc`. Apply is
+        always a server-side apply, see apply."""
         super().__init__(
             cluster_name,
             server,
@@ -1309,6 +1537,7 @@ class OCNative(OCCli):
             connection_parameters=connection_parameters,
         )
         self._get_obj_client = cache(self.__get_obj_client)
+        self.native_writes = native_writes
 
         if connection_parameters:
             token = connection_parameters.automation_token
@@ -1429,6 +1658,155 @@ class OCNative(OCCli):
                 kind=kind,
             ).observe(duration)
 
+    def iter_items(
+        self,
+        kind: str,
+        page_size: int = DEFAULT_LIST_PAGE_SIZE,
+        **kwargs: Any,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield the items of the given kind page by page.
+
+        Accepts the same keyword arguments as get_items. The list is
+        requested in chunks of `page_size` items using the `limit` and
+        `continue` parameters of the API, so only a single page is held
+        in memory at a time. Without a namespace, items of all namespaces
+        are listed. When the continue token expires (410 Gone), the list
+        is restarted and items that were already yielded are skipped;
+        ListExpiredError is raised after MAX_LIST_RESTARTS restarts."""
+        if kwargs.get("resource_names"):
+            # named resources are fetched one by one anyway
+            yield from self.get_items(kind, **kwargs)
+            return
+
+        resource = self.get_api_resource(kind)
+        obj_client = self._get_obj_client(
+            group_version=resource.group_version, kind=resource.kind
+        )
+
+        namespace = ""
+        if "namespace" in kwargs:
+            namespace = kwargs["namespace"]
+            # for cluster scoped integrations
+            # currently only openshift-clusterrolebindings
+            if namespace != "cluster":
+                if not self.project_exists(namespace):
+                    return
+
+        labels = ""
+        if "labels" in kwargs:
+            labels_list = [f"{k}={v}" for k, v in kwargs.get("labels", {}).items()]
+            labels = ",".join(labels_list)
+
+        duration = 0.0
+        # uids of the yielded items, to skip them when the list is restarted
+        yielded: set[str] = set()
+        restarts = 0
+        try:
+            continue_token: str | None = None
+            while True:
+                start_time = time.monotonic()
+                try:
+                    page = self._get_items_page(
+                        obj_client,
+                        namespace=namespace,
+                        labels=labels,
+                        page_size=page_size,
+                        continue_token=continue_token,
+                    )
+                except GoneError as e:
+                    # the continue token expired, e.g. because the list took
+                    # longer than the etcd compaction interval
+                    if continue_token is None or restarts >= MAX_LIST_RESTARTS:
+                        raise ListExpiredError(f"[{self.server}]: {e}") from None
+                    restarts += 1
+                    logging.info(f"[{self.server}]: LIST of {kind} expired, restarting")
+                    continue_token = None
+                    continue
+                finally:
+                    duration += time.monotonic() - start_time
+                items = page.get("items")
+                if items is None:
+                    raise Exception("Expecting items")
+                for item in items:
+                    if uid := (item.get("metadata") or {}).get("uid"):
+                        if uid in yielded:
+                            continue
+                        yielded.add(uid)
+                    yield item
+                continue_token = (page.get("metadata") or {}).get("continue")
+                if not continue_token:
+                    return
+        finally:
+            oc_get_items_duration.labels(
+                integration=RunningState().integration,
+                cluster=self.cluster_name,
+                kind=kind,
+            ).observe(duration)
+
+    @staticmethod
+    @retry(max_attempts=5, exceptions=(ServerTimeoutError))
+    def _get_items_page(
+        obj_client: Resource,
+        namespace: str,
+        labels: str,
+        page_size: int,
+        continue_token: str | None,
+    ) -> dict[str, Any]:
+        return obj_client.get(
+            namespace=namespace,
+            label_selector=labels,
+            limit=page_size,
+            _continue=continue_token,
+            _request_timeout=REQUEST_TIMEOUT,
+        ).to_dict()
+
+    @retry(max_attempts=5, exceptions=(ServerTimeoutError))
+    def list_items(self, kind: str, namespace: str) -> tuple[list[dict[str, Any]], str]:
+        """Return the items of the given kind in a namespace together with
+        the resourceVersion of the list, to start a watch from."""
+        resource = self.get_api_resource(kind)
+        obj_client = self._get_obj_client(
+            group_version=resource.group_version, kind=resource.kind
+        )
+        items_list = obj_client.get(
+            namespace=namespace,
+            _request_timeout=REQUEST_TIMEOUT,
+        ).to_dict()
+        return items_list["items"], items_list["metadata"]["resourceVersion"]
+
+    def watch_items(
+        self,
+        kind: str,
+        namespace: str,
+        resource_version: str,
+        timeout_seconds: int,
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield (event type, object) for changes of the given kind in a
+        namespace after resource_version, for at most timeout_seconds.
+        Raises WatchExpiredError when resource_version is too old and
+        the items must be listed again."""
+        resource = self.get_api_resource(kind)
+        obj_client = self._get_obj_client(
+            group_version=resource.group_version, kind=resource.kind
+        )
+        try:
+            for event in self.client.watch(
+                obj_client,
+                namespace=namespace,
+                resource_version=resource_version,
+                timeout=timeout_seconds,
+                # bookmarks keep the resourceVersion of quiet watches recent
+                allow_watch_bookmarks=True,
+            ):
+                yield event["type"], event["raw_object"]
+        except ApiException as e:
+            # 410 Gone: the resourceVersion is older than the etcd history
+            if e.status == 410:
+                raise WatchExpiredError(
+                    f"[{self.server}]: watch of {kind} expired"
+                ) from None
+            raise
+
     @retry(max_attempts=5, exceptions=(ServerTimeoutError, ForbiddenError))
     def get(
         self,
@@ -1463,6 +1841,204 @@ class OCNative(OCCli):
         except NotFoundError as e:
             raise StatusCodeError(f"[{self.server}]: {e}") from None
 
+    def _get_write_client(
+        self, namespace: str, kind: str, api_version: str | None = None
+    ) -> tuple[Resource, str | None]:
+        resource = self.get_api_resource(kind)
+        obj_client = self._get_obj_client(
+            group_version=api_version or resource.group_version, kind=resource.kind
+        )
+        return obj_client, namespace if resource.namespaced else None
+
+    def _raise_for_write_error(self, e: ApiException) -> NoReturn:
+        err = api_exception_message(e)
+        raise_for_apply_error(self.server, err)
+        raise StatusCodeError(f"[{self.server}]: {err}") from None
+
+    @OCDecorators.process_reconcile_time
+    def apply(
+        self,
+        namespace: str,
+        resource: OR,
+        server_side: bool = False,
+    ) -> OCProcessReconcileTimeDecoratorMsg:
+        # With native writes, client-side apply is replaced by server-side
+        # apply as well. The fields of objects that were client-side applied
+        # before are moved to the apply manager first, so fields removed from
+        # the desired state are pruned like by the three-way merge of
+        # `oc apply`.
+        if not self.native_writes:
+            return super().apply.__wrapped__(  # type: ignore[attr-defined]
+                self, namespace, resource, server_side=server_side
+            )
+        obj_client, ns = self._get_write_client(
+            namespace, resource.kind_and_group, resource.body["apiVersion"]
+        )
+        try:
+            applied = self._server_side_apply(obj_client, resource, ns)
+            managed_fields = applied["metadata"].get("managedFields") or []
+            if (upgraded := upgrade_managed_fields(managed_fields)) is not None:
+                obj_client.patch(
+                    body=[
+                        # fail if the object changed since it was applied
+                        {
+                            "op": "test",
+                            "path": "/metadata/resourceVersion",
+                            "value": applied["metadata"]["resourceVersion"],
+                        },
+                        {
+                            "op": "replace",
+                            "path": "/metadata/managedFields",
+                            "value": upgraded,
+                        },
+                    ],
+                    name=resource.name,
+                    namespace=ns,
+                    content_type="application/json-patch+json",
+                    _request_timeout=REQUEST_TIMEOUT,
+                )
+                # apply again to prune the fields that are now owned by the
+                # apply manager and no longer in the desired state
+                self._server_side_apply(obj_client, resource, ns)
+        except ApiException as e:
+            self._raise_for_write_error(e)
+        return self._msg_to_process_reconcile_time(namespace, resource)
+
+    @staticmethod
+    def _server_side_apply(
+        obj_client: Resource, resource: OR, namespace: str | None
+    ) -> dict[str, Any]:
+        return obj_client.server_side_apply(
+            body=resource.body,
+            name=resource.name,
+            namespace=namespace,
+            field_manager=APPLY_FIELD_MANAGER,
+            force_conflicts=True,
+            _request_timeout=REQUEST_TIMEOUT,
+        ).to_dict()
+
+    @OCDecorators.process_reconcile_time
+    def create(
+        self, namespace: str, resource: OR
+    ) -> OCProcessReconcileTimeDecoratorMsg:
+        if not self.native_writes:
+            return super().create.__wrapped__(  # type: ignore[attr-defined]
+                self, namespace, resource
+            )
+        obj_client, ns = self._get_write_client(
+            namespace, resource.kind_and_group, resource.body["apiVersion"]
+        )
+        try:
+            obj_client.create(
+                body=resource.body,
+                namespace=ns,
+                field_manager=FIELD_MANAGER,
+                _request_timeout=REQUEST_TIMEOUT,
+            )
+        except ApiException as e:
+            self._raise_for_write_error(e)
+        return self._msg_to_process_reconcile_time(namespace, resource)
+
+    @OCDecorators.process_reconcile_time
+    def replace(
+        self, namespace: str, resource: OR
+    ) -> OCProcessReconcileTimeDecoratorMsg:
+        if not self.native_writes:
+            return super().replace.__wrapped__(  # type: ignore[attr-defined]
+                self, namespace, resource
+            )
+        obj_client, ns = self._get_write_client(
+            namespace, resource.kind_and_group, resource.body["apiVersion"]
+        )
+        try:
+            obj_client.replace(
+                body=resource.body,
+                name=resource.name,
+                namespace=ns,
+                field_manager=FIELD_MANAGER,
+                _request_timeout=REQUEST_TIMEOUT,
+            )
+        except ApiException as e:
+            self._raise_for_write_error(e)
+        return self._msg_to_process_reconcile_time(namespace, resource)
+
+    @OCDecorators.process_reconcile_time
+    def patch(
+        self, namespace: str, kind: str, name: str, patch: Mapping[str, Any]
+    ) -> OCProcessReconcileTimeDecoratorMsg:
+        if not self.native_writes:
+            return super().patch.__wrapped__(  # type: ignore[attr-defined]
+                self, namespace, kind, name, patch
+            )
+        obj_client, ns = self._get_write_client(namespace, kind)
+        try:
+            try:
+                obj_client.patch(
+                    body=patch,
+                    name=name,
+                    namespace=ns,
+                    content_type="application/strategic-merge-patch+json",
+                    _request_timeout=REQUEST_TIMEOUT,
+                )
+            except ApiException as e:
+                # custom resources do not support strategic merge patches,
+                # oc falls back to a merge patch as well
+                if e.status != 415:
+                    raise
+                obj_client.patch(
+                    body=patch,
+                    name=name,
+                    namespace=ns,
+                    content_type="application/merge-patch+json",
+                    _request_timeout=REQUEST_TIMEOUT,
+                )
+        except ApiException as e:
+            self._raise_for_write_error(e)
+        resource = OR({"kind": kind, "metadata": {"name": name}}, "", "")
+        return self._msg_to_process_reconcile_time(namespace, resource)
+
+    @OCDecorators.process_reconcile_time
+    def delete(
+        self, namespace: str, kind: str, name: str, cascade: bool = True
+    ) -> OCProcessReconcileTimeDecoratorMsg:
+        if not self.native_writes:
+            return super().delete.__wrapped__(  # type: ignore[attr-defined]
+                self, namespace, kind, name, cascade=cascade
+            )
+        obj_client, ns = self._get_write_client(namespace, kind)
+        try:
+            obj_client.delete(
+                name=name,
+                namespace=ns,
+                propagation_policy="Background" if cascade else "Orphan",
+                _request_timeout=REQUEST_TIMEOUT,
+            )
+        except NotFoundError as e:
+            raise StatusCodeError(f"[{self.server}]: {e}") from None
+        except ApiException as e:
+            self._raise_for_write_error(e)
+        # oc delete waits for the object to be gone, callers rely on that
+        # to re-create the object right away
+        self._wait_for_deletion(obj_client, name, ns)
+        resource = OR({"kind": kind, "metadata": {"name": name}}, "", "")
+        return self._msg_to_process_reconcile_time(namespace, resource)
+
+    def _wait_for_deletion(
+        self, obj_client: Resource, name: str, namespace: str | None
+    ) -> None:
+        deadline = time.monotonic() + REQUEST_TIMEOUT
+        while time.monotonic() < deadline:
+            try:
+                obj_client.get(
+                    name=name, namespace=namespace, _request_timeout=REQUEST_TIMEOUT
+                )
+            except NotFoundError:
+                return
+            time.sleep(1)
+        raise StatusCodeError(
+            f"[{self.server}]: timed out waiting for the deletion of {name}"
+        )
+
 
 OCClient = OCNative | OCCli
 
@@ -1518,6 +2094,15 @@ class OC:
 
         if use_native:
             OC.client_status.labels(cluster_name=cluster_name, native_client=True).inc()
+            native_writes_env = os.environ.get("USE_NATIVE_WRITES", "")
+            if len(native_writes_env) > 0:
+                native_writes = native_writes_env.lower() in {"true", "yes"}
+            else:
+                native_writes = get_feature_toggle_state(
+                    "openshift-resources-native-writes",
+                    context={"cluster_name": cluster_name},
+                    default=False,
+                )
             return OCNative(
                 cluster_name=cluster_name,
                 server=server,
@@ -1526,6 +2111,7 @@ class OC:
                 local=local,
                 insecure_skip_tls_verify=insecure_skip_tls_verify,
                 connection_parameters=connection_parameters,
+                native_writes=native_writes,
             )
 
         OC.client_status.labels(cluster_name=cluster_name, native_client=False).inc()
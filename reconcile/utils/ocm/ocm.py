@@ -3,10 +3,14 @@ from __future__ import annotations
 import functools
 from typing import TYPE_CHECKING, Any
 
-from sretoolbox.utils import retry
+from sretoolbox.utils import (
+    retry,
+    threaded,
+)
 
 import reconcile.utils.aws_helper as awsh
 from reconcile.gql_definitions.fragments.vault_secret import VaultSecret
+from reconcile.utils.constants import DEFAULT_THREAD_POOL_SIZE
 from reconcile.utils.ocm.clusters import get_node_pools
 from reconcile.utils.ocm.products import (
     OCMProduct,
@@ -17,11 +21,12 @@ from reconcile.utils.ocm_base_client import (
     OCMAPIClientConfiguration,
     OCMBaseClient,
     init_ocm_base_client,
+    next_pages,
 )
 from reconcile.utils.secret_reader import SecretReader
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping, MutableMapping
+    from collections.abc import Callable, Iterable, Mapping, MutableMapping
 
     from reconcile.ocm.types import OCMSpec
 
@@ -665,22 +670,28 @@ class OCM:
         return rs["kind"].endswith("List")
 
     def _get_json(
-        self, api: str, params: dict[str, Any] | None = None, page_size: int = 100
+        self,
+        api: str,
+        params: dict[str, Any] | None = None,
+        page_size: int = 100,
+        thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE,
     ) -> dict[str, Any]:
-        responses = []
         if not params:
             params = {}
         params["size"] = page_size
-        while True:
-            rs = self._do_get_request(api, params=params)
-            responses.append(rs)
-            if (
-                self._response_is_list(rs)
-                and rs.get("size", len(rs.get("items", []))) == params["size"]
-            ):
-                params["page"] = rs.get("page", 1) + 1
-            else:
-                break
+
+        def get_page(page: int) -> dict[str, Any]:
+            return self._do_get_request(api, params=params | {"page": page})
+
+        # the first page tells the total number of items,
+        # the remaining pages are fetched concurrently
+        responses = [self._do_get_request(api, params=params)]
+        while (
+            self._response_is_list(rs := responses[-1])
+            and rs.get("size", len(rs.get("items", []))) == page_size
+        ):
+            pages = next_pages(rs.get("page", 1), rs.get("total"), page_size)
+            responses.extend(threaded.run(get_page, pages, thread_pool_size))
 
         if self._response_is_list(responses[0]):
             items = []
@@ -919,6 +930,31 @@ class OCMMap:
         ocm = self.clusters_map[cluster]
         return self.ocm_map[ocm]
 
+    def get_for_clusters[T](
+        self,
+        clusters: Iterable[str],
+        getter: Callable[[OCM, str], T],
+        thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE,
+    ) -> dict[str, T]:
+        """
+        Calls getter with the OCM instance of each cluster concurrently.
+
+        :param clusters: cluster names
+        :param getter: function of the OCM instance and the cluster name
+        :param thread_pool_size: number of concurrent requests
+
+        :type clusters: list
+        :type getter: callable
+        :type thread_pool_size: int
+        """
+        cluster_names = list(clusters)
+        results = threaded.run(
+            lambda cluster: getter(self.get(cluster), cluster),
+            cluster_names,
+            thread_pool_size,
+        )
+        return dict(zip(cluster_names, results, strict=True))
+
     def clusters(self) -> list[str]:
         """Get list of cluster names initiated in the OCM map."""
         return [k for k, v in self.clusters_map.items() if v]
@@ -13,8 +13,12 @@ from requests import (
     Session,
     codes,
 )
-from sretoolbox.utils import retry
+from sretoolbox.utils import (
+    retry,
+    threaded,
+)
 
+from reconcile.utils.constants import DEFAULT_THREAD_POOL_SIZE
 from reconcile.utils.metrics import ocm_request
 from reconcile.utils.secret_reader import (
     HasSecret,
@@ -33,6 +37,21 @@ if TYPE_CHECKING:
 REQUEST_TIMEOUT_SEC = 60
 
 
+def next_pages(
+    page: int, total: int | None, page_size: int, max_pages: int | None = None
+) -> range:
+    """
+    Returns the pages following `page` of a list with `total` items.
+    At least the next page is returned, so lists without a total, or with
+    a total that is outdated by the time the last page is fetched, are
+    still paged through until a page is not full.
+    """
+    last_page = max(-(-(total or 0) // page_size), page + 1)
+    if max_pages is not None:
+        last_page = min(last_page, max_pages)
+    return range(page + 1, last_page + 1)
+
+
 class OCMBaseClient:
     """
     Thin client for OCM. This class takes care of authentication
@@ -90,25 +109,35 @@ class OCMBaseClient:
         params: dict[str, Any] | None = None,
         max_page_size: int = 100,
         max_pages: int | None = None,
+        thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE,
     ) -> Generator[dict[str, Any]]:
         """
         Note, that pagination is currently broken.
         Each call will return a random order, meaning pages are not consistent.
         ALWAYS by default try to use "orderBy: id", as id exists for every resource and has an index in the db.
+
+        The first page tells the total number of items, the remaining pages
+        are fetched concurrently.
         """
         params_copy = {} if not params else params.copy()
         params_copy["size"] = max_page_size
 
+        def get_page(page: int) -> dict[str, Any]:
+            return self.get(api_path, params=params_copy | {"page": page})
+
+        responses = [self.get(api_path, params=params_copy)]
         while True:
-            rs = self.get(api_path, params=params_copy)
-            yield from rs.get("items", [])
+            for rs in responses:
+                yield from rs.get("items", [])
+            rs = responses[-1]
             current_page = rs.get("page", 0)
             records_on_page = rs.get("size", len(rs.get("items", [])))
             if records_on_page < max_page_size:
                 return
             if max_pages is not None and current_page >= max_pages:
                 return
-            params_copy["page"] = current_page + 1
+            pages = next_pages(current_page, rs.get("total"), max_page_size, max_pages)
+            responses = threaded.run(get_page, pages, thread_pool_size)
 
     def post(
         self,
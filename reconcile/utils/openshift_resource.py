@@ -77,6 +77,24 @@ QONTRACT_ANNOTATIONS = {
 
 
 class OpenshiftResource:
+    """
+    A Kubernetes object managed by an integration.
+
+    The canonical form and sha256sum of the body are computed lazily and
+    cached. Assigning a new body invalidates the cache, code that mutates
+    the body in place must call invalidate_cache() afterwards.
+    """
+
+    __slots__ = (
+        "_body",
+        "_canonical_json",
+        "_sha256sum",
+        "caller_name",
+        "error_details",
+        "integration",
+        "integration_version",
+    )
+
     def __init__(
         self,
         body: dict[str, Any],
@@ -211,6 +229,19 @@ class OpenshiftResource:
             return True
         return val1 == val2
 
+    @property
+    def body(self) -> dict[str, Any]:
+        return self._body
+
+    @body.setter
+    def body(self, body: dict[str, Any]) -> None:
+        self._body = body
+        self.invalidate_cache()
+
+    def invalidate_cache(self) -> None:
+        self._canonical_json: str | None = None
+        self._sha256sum: str | None = None
+
     @property
     def name(self) -> str:
         # PipelineRun name can be empty when creating
@@ -351,9 +382,11 @@ class OpenshiftResource:
             openshift_resource: new OpenshiftResource object with
                 annotations.
         """
-        body = self.canonicalize(self.body) if canonicalize else self.body
-
-        sha256sum = self.calculate_sha256sum(self.serialize(body))
+        sha256sum = (
+            self.sha256sum()
+            if canonicalize
+            else self.calculate_sha256sum(self.serialize(self.body))
+        )
 
         # create new body object
         body = copy.deepcopy(self.body)
@@ -374,13 +407,21 @@ class OpenshiftResource:
         if self.caller_name:
             annotations[QONTRACT_ANNOTATION_CALLER_NAME] = self.caller_name
 
-        return OpenshiftResource(body, self.integration, self.integration_version)
+        annotated = OpenshiftResource(body, self.integration, self.integration_version)
+        if canonicalize:
+            # qontract annotations are not part of the canonical form
+            annotated._sha256sum = sha256sum
+        return annotated
 
-    def sha256sum(self) -> str:
-        body = self.annotate().body
+    def canonical_json(self) -> str:
+        if self._canonical_json is None:
+            self._canonical_json = self.serialize(self.canonicalize(self.body))
+        return self._canonical_json
 
-        annotations = body["metadata"]["annotations"]
-        return annotations["qontract.sha256sum"]
+    def sha256sum(self) -> str:
+        if self._sha256sum is None:
+            self._sha256sum = self.calculate_sha256sum(self.canonical_json())
+        return self._sha256sum
 
     def to_json(self) -> str:
         return self.serialize(self.body)
@@ -0,0 +1,201 @@
+"""In-process implementation of `oc process --local --ignore-unknown-parameters`.
+
+Processing an OpenShift Template with `oc` means forking a process and a
+JSON round trip per template. This module implements the subset of the
+template processing of openshift/library-go that our templates use:
+
+* parameter values from the caller take precedence over template defaults,
+  unknown parameters are ignored
+* `generate: expression` parameters (e.g. `[a-zA-Z0-9]{16}`)
+* required parameter checks
+* `${PARAM}` string substitution, also within map keys
+* `${{PARAM}}` non-string substitution, the value is parsed as JSON
+* hardcoded `metadata.namespace` fields are stripped
+* template `labels` are added to every object after substituting
+  `${PARAM}` in their keys and values, an object label with a different
+  value is an error (library-go ErrorOnDifferentDstKeyValue)
+
+The behaviour is verified against `oc process` by the differential tests in
+reconcile/test/utils/test_openshift_template.py.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import re
+import string
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+STRING_PARAMETER_RE = re.compile(r"\$\{([a-zA-Z0-9_]+?)\}")
+NON_STRING_PARAMETER_RE = re.compile(r"^\$\{\{([a-zA-Z0-9_]+)\}\}$")
+
+# generate expression syntax, see library-go pkg/template/generator
+GENERATOR_RE = re.compile(r"\[([a-zA-Z0-9\-\\]+)\](\{(\w+)\})")
+GENERATOR_EXPRESSION_RE = re.compile(
+    r"\[(\\w|\\d|\\a|\\A)|([a-zA-Z0-9]\-[a-zA-Z0-9])+\]"
+)
+GENERATOR_RANGE_RE = re.compile(r"([\\]?[a-zA-Z0-9]\-?[a-zA-Z0-9]?)")
+ALPHABET = string.ascii_lowercase
+NUMERALS = string.digits
+SYMBOLS = "~!@#$%^&*()-_+={}[]\\|<,>.?/\"';:`"
+
+_random = random.SystemRandom()
+
+
+class TemplateProcessingError(Exception):
+    pass
+
+
+def process(
+    template: Mapping[str, Any], parameters: Mapping[str, Any] | None = None
+) -> list[dict[str, Any]]:
+    """Process a template like `OCCli.process` does, without forking `oc`."""
+    values = _parameter_values(template, parameters or {})
+    labels = {
+        _evaluate(k, values)[0]: _evaluate(v, values)[0]
+        for k, v in (template.get("labels") or {}).items()
+    }
+    items = []
+    for obj in template.get("objects") or []:
+        item = _substitute(obj, values)
+        if _has_hardcoded_namespace(obj):
+            del item["metadata"]["namespace"]
+        if labels:
+            metadata = item.setdefault("metadata", {})
+            metadata["labels"] = _add_labels(metadata.get("labels") or {}, labels)
+        items.append(item)
+    return items
+
+
+def generate_value(expression: str) -> str:
+    """Generate a random value from an expression like `[a-zA-Z0-9]{16}`."""
+    value = expression
+    while m := GENERATOR_RE.search(value):
+        generator = m.group(0)
+        ranges = generator[: generator.rindex("{")]
+        if not GENERATOR_EXPRESSION_RE.search(ranges):
+            raise TemplateProcessingError(f"malformed expression syntax: {ranges}")
+        try:
+            length = int(m.group(3))
+        except ValueError:
+            length = 0
+        if not 0 < length <= 255:
+            raise TemplateProcessingError(
+                f"range must be within [1-255] characters ({length})"
+            )
+        alphabet = _alphabet(GENERATOR_RANGE_RE.findall(ranges))
+        generated = "".join(_random.choice(alphabet) for _ in range(length))
+        value = value.replace(generator, generated, 1)
+    return value
+
+
+def _alphabet(ranges: list[str]) -> str:
+    alphabet = ""
+    for r in ranges:
+        match r[:2]:
+            case "\\w":
+                alphabet += ALPHABET + ALPHABET.upper() + NUMERALS + "_"
+            case "\\d":
+                alphabet += NUMERALS
+            case "\\a":
+                alphabet += ALPHABET + ALPHABET.upper()
+            case "\\A":
+                alphabet += SYMBOLS
+            case _:
+                if len(r) != 3 or r[1] != "-" or r[0] > r[2]:
+                    raise TemplateProcessingError(f"invalid range specified: {r}")
+                alphabet += "".join(chr(c) for c in range(ord(r[0]), ord(r[2]) + 1))
+    # dict keeps the first occurrence, i.e. removes duplicates in order
+    return "".join(dict.fromkeys(alphabet))
+
+
+def _add_labels(
+    object_labels: Mapping[str, str], labels: Mapping[str, str]
+) -> dict[str, str]:
+    for key, value in labels.items():
+        if key in object_labels and object_labels[key] != value:
+            raise TemplateProcessingError(
+                f"label could not be applied: key {key} already exists "
+                f"with a different value ({object_labels[key]} != {value})"
+            )
+    return dict(object_labels) | dict(labels)
+
+
+def _parameter_values(
+    template: Mapping[str, Any], parameters: Mapping[str, Any]
+) -> dict[str, str]:
+    values = {}
+    for param in template.get("parameters") or []:
+        name = param["name"]
+        if name in parameters:
+            # same formatting as the `NAME=value` arguments passed to `oc`
+            value = str(parameters[name])
+        else:
+            value = "" if param.get("value") is None else str(param["value"])
+            if not value and param.get("generate") == "expression":
+                value = generate_value(str(param.get("from") or ""))
+        if param.get("required") and not value:
+            raise TemplateProcessingError(
+                f"parameter {name} is required and must be specified"
+            )
+        values[name] = value
+    return values
+
+
+def _has_hardcoded_namespace(obj: Mapping[str, Any]) -> bool:
+    # a namespace is only kept if it is a parameter reference
+    metadata = obj.get("metadata")
+    if not isinstance(metadata, dict):
+        return False
+    namespace = metadata.get("namespace")
+    return bool(namespace) and not STRING_PARAMETER_RE.search(str(namespace))
+
+
+def _evaluate(value: str, values: Mapping[str, str]) -> tuple[str, bool]:
+    """Substitute parameter references in value.
+
+    Returns the new value and whether it has to be used as a string.
+    """
+    if (m := NON_STRING_PARAMETER_RE.search(value)) and m.group(1) in values:
+        return value.replace(m.group(0), values[m.group(1)], 1), False
+
+    result = value
+    for m in STRING_PARAMETER_RE.finditer(value):
+        if m.group(1) in values:
+            result = result.replace(m.group(0), values[m.group(1)], 1)
+    return result, True
+
+
+def _parse_float(value: str) -> float | int:
+    # numbers are float64 in Go, integral values are rendered without decimals
+    f = float(value)
+    return int(f) if f.is_integer() and abs(f) < 1e21 else f
+
+
+def _reject_constant(value: str) -> Any:
+    raise ValueError(f"invalid JSON constant {value}")
+
+
+def _substitute(value: Any, values: Mapping[str, str]) -> Any:
+    if isinstance(value, str):
+        result, as_string = _evaluate(value, values)
+        if as_string:
+            return result
+        try:
+            return json.loads(
+                result, parse_float=_parse_float, parse_constant=_reject_constant
+            )
+        except ValueError:
+            return result
+    if isinstance(value, dict):
+        return {
+            _evaluate(k, values)[0] if isinstance(k, str) else k: _substitute(v, values)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [_substitute(v, values) for v in value]
+    return value
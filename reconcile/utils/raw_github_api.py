@@ -1,11 +1,83 @@
+from __future__ import annotations
+
 import os
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import requests
 from sretoolbox.utils import retry
 
+from reconcile.utils.metrics import (
+    github_rate_limit,
+    github_rate_limit_remaining,
+    github_request,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
 Headers = dict[str, str | bytes | None]
 
+ORG_TEAMS_QUERY = """
+query($org: String!, $after: String) {
+  organization(login: $org) {
+    teams(first: 100, after: $after) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        slug
+        members(first: 100) {
+          pageInfo { hasNextPage endCursor }
+          nodes { login }
+        }
+        invitations(first: 100) {
+          pageInfo { hasNextPage endCursor }
+          nodes { invitee { login } }
+        }
+      }
+    }
+  }
+}
+"""
+
+TEAM_MEMBERS_QUERY = """
+query($org: String!, $team: String!, $after: String) {
+  organization(login: $org) {
+    team(slug: $team) {
+      connection: members(first: 100, after: $after) {
+        pageInfo { hasNextPage endCursor }
+        nodes { login }
+      }
+    }
+  }
+}
+"""
+
+TEAM_INVITATIONS_QUERY = """
+query($org: String!, $team: String!, $after: String) {
+  organization(login: $org) {
+    team(slug: $team) {
+      connection: invitations(first: 100, after: $after) {
+        pageInfo { hasNextPage endCursor }
+        nodes { invitee { login } }
+      }
+    }
+  }
+}
+"""
+
+
+class GithubGraphQLError(Exception):
+    pass
+
+
+def _member_logins(nodes: list[dict[str, Any]]) -> list[str]:
+    return [n["login"] for n in nodes]
+
+
+def _invitation_logins(nodes: list[dict[str, Any]]) -> list[str]:
+    # invitations by email have no invitee
+    return [n["invitee"]["login"] for n in nodes if n.get("invitee")]
+
 
 class RawGithubApi:
     """
@@ -16,13 +88,16 @@ class RawGithubApi:
     """
 
     BASE_URL = os.environ.get("GITHUB_API", "https://api.github.com")
+    # GitHub Enterprise serves REST at /api/v3 and GraphQL at /api/graphql
+    GRAPHQL_URL = BASE_URL.removesuffix("/v3") + "/graphql"
     BASE_HEADERS = {
         "Accept": "application/vnd.github.v3+json,"
         "application/vnd.github.dazzler-preview+json"
     }
 
-    def __init__(self, password: str) -> None:
+    def __init__(self, password: str, org: str = "") -> None:
         self.password = password
+        self.org = org
 
     def headers(self, headers: Headers | None = None) -> Headers:
         if headers is None:
@@ -32,18 +107,51 @@ class RawGithubApi:
         new_headers["Authorization"] = "token %s" % (self.password,)
         return new_headers
 
+    def _record_rate_limit(self, res: requests.Response) -> None:
+        resource = res.headers.get("X-RateLimit-Resource", "core")
+        github_request.labels(org=self.org, resource=resource).inc()
+        if "X-RateLimit-Remaining" in res.headers:
+            github_rate_limit_remaining.labels(org=self.org, resource=resource).set(
+                int(res.headers["X-RateLimit-Remaining"])
+            )
+        if "X-RateLimit-Limit" in res.headers:
+            github_rate_limit.labels(org=self.org, resource=resource).set(
+                int(res.headers["X-RateLimit-Limit"])
+            )
+
+    def _get(self, url: str, headers: Headers) -> requests.Response:
+        res = requests.get(url, headers=headers, timeout=60)
+        self._record_rate_limit(res)
+        res.raise_for_status()
+        return res
+
     def patch(self, url: str) -> requests.Response:
         res = requests.patch(url, headers=self.headers(), timeout=60)
+        self._record_rate_limit(res)
         res.raise_for_status()
         return res
 
+    @retry()
+    def graphql(self, query: str, variables: Mapping[str, Any]) -> dict[str, Any]:
+        res = requests.post(
+            self.GRAPHQL_URL,
+            json={"query": query, "variables": variables},
+            headers=self.headers(),
+            timeout=60,
+        )
+        self._record_rate_limit(res)
+        res.raise_for_status()
+        result = res.json()
+        if result.get("errors"):
+            raise GithubGraphQLError(result["errors"])
+        return result["data"]
+
     @retry()
     def query(self, url: str, headers: Headers | None = None) -> Any:
         if headers is None:
             headers = {}
         h = self.headers(headers)
-        res = requests.get(self.BASE_URL + url, headers=h, timeout=60)
-        res.raise_for_status()
+        res = self._get(self.BASE_URL + url, h)
         result = res.json()
 
         if isinstance(result, list):
@@ -51,15 +159,13 @@ class RawGithubApi:
             while "last" in res.links and "next" in res.links:
                 if res.links["last"]["url"] == res.links["next"]["url"]:
                     req_url = res.links["next"]["url"]
-                    res = requests.get(req_url, headers=h, timeout=60)
-                    res.raise_for_status()
+                    res = self._get(req_url, h)
 
                     elements.extend(element for element in res.json())
                     return elements
 
                 req_url = res.links["next"]["url"]
-                res = requests.get(req_url, headers=h, timeout=60)
-                res.raise_for_status()
+                res = self._get(req_url, h)
 
                 elements.extend(element for element in res.json())
 
@@ -76,6 +182,65 @@ class RawGithubApi:
             if login is not None
         ]
 
+    def team_members(self, org_name: str) -> dict[str, list[str]]:
+        """
+        Returns the members and pending invitations of all teams of an org,
+        keyed by team name. A few paginated GraphQL queries replace a REST
+        request per team and page.
+        """
+        teams: dict[str, list[str]] = {}
+        after: str | None = None
+        while True:
+            data = self.graphql(ORG_TEAMS_QUERY, {"org": org_name, "after": after})
+            connection = data["organization"]["teams"]
+            for team in connection["nodes"]:
+                members = _member_logins(team["members"]["nodes"])
+                if team["members"]["pageInfo"]["hasNextPage"]:
+                    members.extend(
+                        self._team_connection(
+                            TEAM_MEMBERS_QUERY,
+                            org_name,
+                            team["slug"],
+                            team["members"]["pageInfo"]["endCursor"],
+                            _member_logins,
+                        )
+                    )
+                members.extend(_invitation_logins(team["invitations"]["nodes"]))
+                if team["invitations"]["pageInfo"]["hasNextPage"]:
+                    members.extend(
+                        self._team_connection(
+                            TEAM_INVITATIONS_QUERY,
+                            org_name,
+                            team["slug"],
+                            team["invitations"]["pageInfo"]["endCursor"],
+                            _invitation_logins,
+                        )
+                    )
+                teams[team["name"]] = members
+            if not connection["pageInfo"]["hasNextPage"]:
+                return teams
+            after = connection["pageInfo"]["endCursor"]
+
+    def _team_connection(
+        self,
+        query: str,
+        org_name: str,
+        team_slug: str,
+        after: str,
+        logins: Callable[[list[dict[str, Any]]], list[str]],
+    ) -> list[str]:
+        result: list[str] = []
+        cursor: str | None = after
+        while cursor:
+            data = self.graphql(
+                query, {"org": org_name, "team": team_slug, "after": cursor}
+            )
+            connection = data["organization"]["team"]["connection"]
+            result.extend(logins(connection["nodes"]))
+            page_info = connection["pageInfo"]
+            cursor = page_info["endCursor"] if page_info["hasNextPage"] else None
+        return result
+
     def repo_invitations(self) -> list[dict[str, Any]]:
         return self.query("/user/repository_invitations")
 
@@ -1,16 +1,18 @@
-import logging
-import multiprocessing
-from collections.abc import Callable, Iterable, Mapping
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from typing import Any
 
-from deepdiff import DeepHash
+import jsonpath_ng
+from jsonpath_ng import Fields
 from jsonpath_ng.ext.parser import parse
 
 from reconcile.change_owners.diff import (
     Diff,
     DiffType,
-    extract_diffs,
+    extract_identifier_from_object,
 )
 from reconcile.utils.jsonpath import apply_constraint_to_path
 from reconcile.utils.runtime.integration import (
@@ -74,102 +76,131 @@ def find_changed_shards(
     return affected_shards
 
 
-EXTRACT_TASK_RESULT_KEY_DIFFS = "diffs"
-EXTRACT_TASK_RESULT_KEY_ERROR = "error"
-
-
-def _extract_diffs_task(
-    extraction_function: Callable[
-        [Mapping[str, Any], Mapping[str, Any]], Iterable[Diff]
-    ],
-    previous_desired_state: Mapping[str, Any],
-    current_desired_state: Mapping[str, Any],
-    return_value: dict,
-) -> None:
-    """
-    A multiprocessing task that extracts diffs from two desired states
-    and stores them in a return value dictionary.
-    """
-    try:
-        diffs = extraction_function(previous_desired_state, current_desired_state)
-        return_value[EXTRACT_TASK_RESULT_KEY_DIFFS] = diffs
-    except BaseException as e:
-        return_value[EXTRACT_TASK_RESULT_KEY_ERROR] = e
-
-
-class DiffDetectionTimeoutError(Exception):
-    """
-    Raised when the fine grained diff detection takes too long.
-    """
-
-
-class DiffDetectionFailureError(Exception):
-    """
-    Raised when the fine grained diff detection fails.
-    """
-
-
-def extract_diffs_with_timeout(
-    extraction_function: Callable[
-        [Mapping[str, Any], Mapping[str, Any]], Iterable[Diff]
-    ],
-    previous_desired_state: Mapping[str, Any],
-    current_desired_state: Mapping[str, Any],
-    timeout_seconds: int,
-) -> list[Diff]:
-    """
-    Extracts diffs from two desired states using a dedicated extraction function.
-    If the timeout is reached, a `DiffDetectionTimeout` exception is raised.
-
-    The diff extraction is performed in a separate process for the sole purpose
-    to be able to enforce a timeout. This is necessary because the diff extraction
-    can take a long time for large desired states. Stoping the process is reasonable
-    for multiple reasons:
-        * the process can potentially take minutes to complete. that would deminish
-          the value derived from the detected diffs (e.g. sharded runs)
-        * the process can potentially take a lot of memory the longer it runs,
-          which would put more pressure on the system executing the process, e.g.
-          Jenkins
-        * experience has shown that the diff extraction process yields the most
-          valueable results when it is fast. if it takes too long, the results
-          yield contain too many diffs to be meaningful for followup processing
-    """
-    ctx = multiprocessing.get_context("fork")
-    m = ctx.Manager()
-    result_value = m.dict()
-
-    process = ctx.Process(
-        target=_extract_diffs_task,
-        args=(
-            extraction_function,
-            previous_desired_state,
-            current_desired_state,
-            result_value,
-        ),
-    )
-    process.start()
-    process.join(timeout_seconds)
-    if process.is_alive():
-        logging.info(
-            f"timeout {timeout_seconds}s reached to find fine grained diffs. "
-            "no shard detection or sharded runs will be performed."
-        )
-        process.terminate()
-        process.join()
-        raise DiffDetectionTimeoutError()
-
-    if EXTRACT_TASK_RESULT_KEY_DIFFS in result_value:
-        return result_value[EXTRACT_TASK_RESULT_KEY_DIFFS]
-
-    original_error = result_value.get(EXTRACT_TASK_RESULT_KEY_ERROR)
-    if original_error:
-        raise DiffDetectionFailureError() from original_error
-
-    # not every error situation of the diff extraction process
-    # will result in an exception. the lack of a result is an error
-    # indicator as well. in those cases, we raise at least
-    # a generic exception to indicate that something went wrong
-    raise DiffDetectionFailureError("unknown error during fine grained diff detection")
+@dataclass(frozen=True)
+class HashTree:
+    """
+    A merkle tree over a desired state. Every node carries the hash of its
+    subtree, so two trees can be compared by descending only into the subtrees
+    whose hashes differ.
+
+    Lists are hashed independent of the order of their items, the same way
+    the early exit comparison always treated them.
+    """
+
+    digest: str
+    value: Any
+    children: Mapping[str, HashTree] | Sequence[HashTree] | None = None
+
+    @classmethod
+    def build(cls, value: Any) -> HashTree:
+        h = hashlib.sha256()
+        children: dict[str, HashTree] | list[HashTree] | None
+        match value:
+            case Mapping():
+                children = {str(k): cls.build(v) for k, v in value.items()}
+                h.update(b"d")
+                for k in sorted(children):
+                    h.update(f"{len(k)}:{k}".encode())
+                    h.update(children[k].digest.encode())
+            case list() | tuple():
+                children = [cls.build(v) for v in value]
+                h.update(b"l")
+                for digest in sorted(c.digest for c in children):
+                    h.update(digest.encode())
+            case _:
+                children = None
+                h.update(f"s{type(value).__name__}:{value!r}".encode())
+        return cls(digest=h.hexdigest(), value=value, children=children)
+
+
+def _child_path(path: jsonpath_ng.JSONPath, child: str | int) -> jsonpath_ng.JSONPath:
+    node = jsonpath_ng.Index(child) if isinstance(child, int) else Fields(child)
+    return node if isinstance(path, jsonpath_ng.Root) else path.child(node)
+
+
+def _diff_trees(
+    path: jsonpath_ng.JSONPath, old: HashTree, new: HashTree
+) -> Iterator[Diff]:
+    if old.digest == new.digest:
+        return
+    if isinstance(old.children, Mapping) and isinstance(new.children, Mapping):
+        for key, old_child in old.children.items():
+            key_path = _child_path(path, key)
+            if (new_child := new.children.get(key)) is None:
+                yield Diff(key_path, DiffType.REMOVED, old=old_child.value, new=None)
+            else:
+                yield from _diff_trees(key_path, old_child, new_child)
+        for key, new_child in new.children.items():
+            if key not in old.children:
+                yield Diff(
+                    _child_path(path, key),
+                    DiffType.ADDED,
+                    old=None,
+                    new=new_child.value,
+                )
+    elif isinstance(old.children, Sequence) and isinstance(new.children, Sequence):
+        yield from _diff_lists(path, old.children, new.children)
+    else:
+        yield Diff(path, DiffType.CHANGED, old=old.value, new=new.value)
+
+
+def _diff_lists(
+    path: jsonpath_ng.JSONPath, old: Sequence[HashTree], new: Sequence[HashTree]
+) -> Iterator[Diff]:
+    # unchanged items are matched by their hash regardless of their position
+    unmatched_new: dict[str, list[int]] = {}
+    for i, item in enumerate(new):
+        unmatched_new.setdefault(item.digest, []).append(i)
+    old_left = []
+    for i, item in enumerate(old):
+        if unmatched_new.get(item.digest):
+            unmatched_new[item.digest].pop(0)
+        else:
+            old_left.append(i)
+    new_left = sorted(i for indexes in unmatched_new.values() for i in indexes)
+
+    # changed items are matched by their identifier, items without one only
+    # if they kept their position
+    def identity(item: HashTree, index: int) -> tuple[bool, Any]:
+        if identifier := extract_identifier_from_object(item.value):
+            return True, identifier
+        return False, index
+
+    # several items can share an identifier, prefer the one in the same
+    # position
+    new_by_identity: dict[tuple[bool, Any], list[int]] = {}
+    for i in new_left:
+        new_by_identity.setdefault(identity(new[i], i), []).append(i)
+    for i in old_left:
+        candidates = new_by_identity.get(identity(old[i], i))
+        j = None
+        if candidates:
+            j = i if i in candidates else candidates[0]
+            candidates.remove(j)
+        if j == i:
+            yield from _diff_trees(_child_path(path, i), old[i], new[j])
+            continue
+        # the item moved or is gone, report it at its old and new position
+        # so the shards of both are looked up correctly
+        yield Diff(_child_path(path, i), DiffType.REMOVED, old=old[i].value, new=None)
+        if j is not None:
+            yield Diff(_child_path(path, j), DiffType.ADDED, old=None, new=new[j].value)
+    for j in sorted(j for indexes in new_by_identity.values() for j in indexes):
+        yield Diff(_child_path(path, j), DiffType.ADDED, old=None, new=new[j].value)
+
+
+def diff_hash_trees(old: HashTree, new: HashTree) -> list[Diff]:
+    """
+    Extracts the diffs between two desired states. The result is equivalent to
+    `extract_diffs` but only the subtrees with different hashes are visited.
+    """
+    if old.value and new.value:
+        return list(_diff_trees(jsonpath_ng.Root(), old, new))
+    if old.value:
+        return [Diff(jsonpath_ng.Root(), DiffType.REMOVED, old=old.value, new=None)]
+    if new.value:
+        return [Diff(jsonpath_ng.Root(), DiffType.ADDED, old=None, new=new.value)]
+    return []
 
 
 def build_desired_state_diff(
@@ -183,44 +214,25 @@ def build_desired_state_diff(
     shards introduced by the change between the two desired states.
     """
     # is there even a difference?
-    previous_hash = DeepHash(previous_desired_state)
-    current_hash = DeepHash(current_desired_state)
-    desired_state_diff_found = previous_hash.get(
-        previous_desired_state
-    ) != current_hash.get(current_desired_state)
+    previous_tree = HashTree.build(previous_desired_state)
+    current_tree = HashTree.build(current_desired_state)
+    desired_state_diff_found = previous_tree.digest != current_tree.digest
 
     shards = set()
-    exract_diff_timeout_seconds = 10
-    try:
-        if desired_state_diff_found and sharding_config:
-            # detect shards based on fine grained diffs
-            diffs = extract_diffs_with_timeout(
-                extraction_function=extract_diffs,
-                previous_desired_state=previous_desired_state,
-                current_desired_state=current_desired_state,
-                timeout_seconds=exract_diff_timeout_seconds,
-            )
-            changed_shards = find_changed_shards(
-                diffs=diffs,
-                previous_desired_state=previous_desired_state,
-                current_desired_state=current_desired_state,
-                sharding_config=sharding_config,
-            )
-            if changed_shards:
-                # let the integration decide if the sharding proposal is fine
-                if sharding_config.sharded_run_review(
-                    ShardedRunProposal(proposed_shards=changed_shards)
-                ):
-                    shards = changed_shards
-    except DiffDetectionTimeoutError:
-        logging.warning(
-            f"unable to extract fine grained diffs for shard extraction "
-            f"within {exract_diff_timeout_seconds} seconds. continue without sharding"
-        )
-    except DiffDetectionFailureError as e:
-        logging.warning(
-            f"unable to extract fine grained diffs for shard extraction: {e}"
+    if desired_state_diff_found and sharding_config:
+        # detect shards based on fine grained diffs
+        changed_shards = find_changed_shards(
+            diffs=diff_hash_trees(previous_tree, current_tree),
+            previous_desired_state=previous_desired_state,
+            current_desired_state=current_desired_state,
+            sharding_config=sharding_config,
         )
+        if changed_shards:
+            # let the integration decide if the sharding proposal is fine
+            if sharding_config.sharded_run_review(
+                ShardedRunProposal(proposed_shards=changed_shards)
+            ):
+                shards = changed_shards
 
     return DesiredStateDiff(
         previous_desired_state=previous_desired_state,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import base64
+import functools
 import hashlib
 import itertools
 import json
@@ -30,9 +31,11 @@ from sretoolbox.utils import (
 
 from reconcile.github_org import get_default_config
 from reconcile.status import RunningState
-from reconcile.utils import helm
+from reconcile.utils import content_cache, helm, image_cache, openshift_template
+from reconcile.utils.content_cache import ContentCache
 from reconcile.utils.datetime_util import utc_now
 from reconcile.utils.github_api import GithubRepositoryApi
+from reconcile.utils.image_cache import ImageManifest
 from reconcile.utils.json import json_dumps
 from reconcile.utils.oc import (
     OCLocal,
@@ -45,6 +48,7 @@ from reconcile.utils.openshift_resource import (
     ResourceNotManagedError,
     fully_qualified_kind,
 )
+from reconcile.utils.openshift_template import TemplateProcessingError
 from reconcile.utils.promotion_state import (
     PromotionData,
     PromotionState,
@@ -101,6 +105,12 @@ TARGET_CONFIG_HASH = "target_config_hash"
 TEMPLATE_API_VERSION = "template.openshift.io/v1"
 UNIQUE_SAAS_FILE_ENV_COMBO_LEN = 56
 REQUEST_TIMEOUT = 60
+TEMPLATE_CACHE_MAX_MEMORY_BYTES = int(
+    os.environ.get("SAAS_TEMPLATE_CACHE_MAX_MEMORY_BYTES", str(128 * 1024 * 1024))
+)
+TEMPLATE_CACHE_MAX_DISK_BYTES = int(
+    os.environ.get("SAAS_TEMPLATE_CACHE_MAX_DISK_BYTES", str(1024 * 1024 * 1024))
+)
 
 
 def is_commit_sha(ref: str) -> bool:
@@ -108,6 +118,20 @@ def is_commit_sha(ref: str) -> bool:
     return bool(re.search(r"^[0-9a-f]{40}$", ref))
 
 
+@functools.cache
+def template_cache() -> ContentCache:
+    """Return the process-wide cache of templates keyed by (url, path, commit sha).
+
+    The on-disk tier is enabled by SAAS_TEMPLATE_CACHE_DIR.
+    """
+    return ContentCache(
+        name="saas_template",
+        max_memory_bytes=TEMPLATE_CACHE_MAX_MEMORY_BYTES,
+        cache_dir=os.environ.get("SAAS_TEMPLATE_CACHE_DIR"),
+        max_disk_bytes=TEMPLATE_CACHE_MAX_DISK_BYTES,
+    )
+
+
 # saas_name, resource_template_name, resource_template_url, target_uid
 RtRef = tuple[str, str, str, str]
 Resource = dict[str, Any]
@@ -182,6 +206,10 @@ class SaasHerder:
         self.validate_planned_data = self._get_saas_file_feature_enabled(
             "validate_planned_data", default=True
         )
+        # process openshift templates in-process instead of forking `oc process`
+        self.native_template_processing = os.environ.get(
+            "SAAS_NATIVE_TEMPLATE_PROCESSING", ""
+        ).lower() in {"true", "yes"}
 
     def __enter__(self) -> Self:
         return self
@@ -757,12 +785,22 @@ class SaasHerder:
         self, url: str, path: str, ref: str, github: Github
     ) -> tuple[Any, str]:
         commit_sha = self._get_commit_sha(url, ref, github)
+        # the content of a path at a commit sha never changes
+        key = content_cache.cache_key("file", url, path, commit_sha)
+        if (content := template_cache().get(key)) is None:
+            content = self._fetch_file_contents(url, path, commit_sha, github)
+            template_cache().set(key, content)
+
+        return yaml.safe_load(content), commit_sha
 
+    def _fetch_file_contents(
+        self, url: str, path: str, commit_sha: str, github: Github
+    ) -> bytes:
         repo_info = VCS.parse_repo_url(url)
         match repo_info.platform:
             case "github":
                 repo = github.get_repo(repo_info.name)
-                content = GithubRepositoryApi.get_raw_file(
+                return GithubRepositoryApi.get_raw_file(
                     repo=repo,
                     path=path,
                     ref=commit_sha,
@@ -772,7 +810,7 @@ class SaasHerder:
                     raise Exception("gitlab is not initialized")
                 if not (project := self.gitlab.get_project(url)):
                     raise Exception(f"Could not find gitlab project for {url}")
-                content = self.gitlab.get_raw_file(
+                return self.gitlab.get_raw_file(
                     project=project,
                     path=path,
                     ref=commit_sha,
@@ -780,14 +818,29 @@ class SaasHerder:
             case _:
                 raise Exception(f"Only GitHub and GitLab are supported: {url}")
 
-        return yaml.safe_load(content), commit_sha
-
     @retry()
     def _get_directory_contents(
         self, url: str, path: str, ref: str, github: Github
     ) -> tuple[list[Any], str]:
         commit_sha = self._get_commit_sha(url, ref, github)
+        key = content_cache.cache_key("directory", url, path, commit_sha)
+        if (data := template_cache().get(key)) is not None:
+            contents = [base64.b64decode(c) for c in json.loads(data)]
+        else:
+            contents = self._fetch_directory_contents(url, path, commit_sha, github)
+            template_cache().set(
+                key,
+                json.dumps([base64.b64encode(c).decode() for c in contents]).encode(),
+            )
+
         resources: list[Any] = []
+        for content in contents:
+            resources.extend(yaml.safe_load_all(content))
+        return resources, commit_sha
+
+    def _fetch_directory_contents(
+        self, url: str, path: str, commit_sha: str, github: Github
+    ) -> list[bytes]:
         repo_info = VCS.parse_repo_url(url)
         match repo_info.platform:
             case "github":
@@ -795,15 +848,14 @@ class SaasHerder:
                 directory = repo.get_contents(path, commit_sha)
                 if isinstance(directory, ContentFile):
                     raise TypeError(f"Path {path} and sha {commit_sha} is a file!")
-                for f in directory:
-                    file_path = os.path.join(path, f.name)
-                    raw_file = GithubRepositoryApi.get_raw_file(
+                return [
+                    GithubRepositoryApi.get_raw_file(
                         repo=repo,
-                        path=file_path,
+                        path=os.path.join(path, f.name),
                         ref=commit_sha,
                     )
-                    result_resources = yaml.safe_load_all(raw_file)
-                    resources.extend(result_resources)
+                    for f in directory
+                ]
             case "gitlab":
                 if not self.gitlab:
                     raise Exception("gitlab is not initialized")
@@ -814,16 +866,14 @@ class SaasHerder:
                     ref=commit_sha,
                     path=path,
                 )
-                for content in dir_contents.values():
-                    result_resources = yaml.safe_load_all(content)
-                    resources.extend(result_resources)
+                return list(dir_contents.values())
             case _:
                 raise Exception(f"Only GitHub and GitLab are supported: {url}")
 
-        return resources, commit_sha
-
     @retry()
     def _get_commit_sha(self, url: str, ref: str, github: Github) -> str:
+        if is_commit_sha(ref):
+            return ref
         repo_info = VCS.parse_repo_url(url)
         match repo_info.platform:
             case "github":
@@ -982,13 +1032,20 @@ class SaasHerder:
                 if need_image_digest:
                     consolidated_parameters["IMAGE_DIGEST"] = img.digest
 
-            oc = OCLocal("cluster", None, None, local=True)
             try:
-                resources: Iterable[Mapping[str, Any]] = oc.process(
-                    template=self._pre_process_template(template),
-                    parameters=consolidated_parameters,
-                )
-            except StatusCodeError as e:
+                resources: Iterable[Mapping[str, Any]]
+                if self.native_template_processing:
+                    resources = openshift_template.process(
+                        template=self._pre_process_template(template),
+                        parameters=consolidated_parameters,
+                    )
+                else:
+                    oc = OCLocal("cluster", None, None, local=True)
+                    resources = oc.process(
+                        template=self._pre_process_template(template),
+                        parameters=consolidated_parameters,
+                    )
+            except (StatusCodeError, TemplateProcessingError) as e:
                 logging.error(f"{error_prefix} error processing template: {e!s}")
 
         elif provider == "directory":
@@ -1123,7 +1180,7 @@ class SaasHerder:
         image_patterns: Iterable[str],
         image_auth: ImageAuth,
         error_prefix: str,
-    ) -> Image | None:
+    ) -> ImageManifest | None:
         if not image_patterns:
             logging.error(
                 f"{error_prefix} imagePatterns is empty (does not contain {image})"
@@ -1171,17 +1228,33 @@ class SaasHerder:
         auth_server: str | Any,
         timeout: int,
         error_prefix: str,
-    ) -> Image | None:
-        try:
+    ) -> ImageManifest | None:
+        def fetch() -> ImageManifest | None:
+            # a per-image response cache lets the digest lookup reuse
+            # the manifest response of the existence check
             img = Image(
                 full_image_path,
                 username=username,
                 password=password,
                 auth_server=auth_server,
                 timeout=timeout,
+                response_cache={},
+            )
+            if not img:
+                return None
+            return ImageManifest(
+                url=full_image_path, digest=img.digest, url_digest=img.url_digest
+            )
+
+        tag = image_cache.image_tag(full_image_path)
+        try:
+            manifest = image_cache.get_cache().get(
+                image_cache.cache_key(full_image_path, username, password, auth_server),
+                fetch,
+                immutable=bool(tag and is_commit_sha(tag)),
             )
-            if img:
-                return img
+            if manifest:
+                return manifest
             else:
                 logging.error(
                     f"{error_prefix} Image : {full_image_path} does not exist"
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import contextlib
+import functools
+import itertools
 import json
 import logging
 import os
@@ -13,8 +15,10 @@ from typing import (
 )
 
 import boto3
+from botocore.config import Config
 from botocore.errorfactory import ClientError
 from pydantic import BaseModel
+from sretoolbox.utils import threaded
 
 from reconcile.gql_definitions.common.app_interface_state_settings import (
     AppInterfaceStateConfigurationS3V1,
@@ -27,7 +31,9 @@ from reconcile.typed_queries.app_interface_vault_settings import (
     get_app_interface_vault_settings,
 )
 from reconcile.typed_queries.get_state_aws_account import get_state_aws_account
+from reconcile.utils import content_cache
 from reconcile.utils.aws_api import aws_config_file_path
+from reconcile.utils.content_cache import ContentCache
 from reconcile.utils.json import json_dumps
 from reconcile.utils.secret_reader import (
     SecretReaderBase,
@@ -35,10 +41,19 @@ from reconcile.utils.secret_reader import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Generator, Mapping
+    from collections.abc import Callable, Generator, Iterator, Mapping
 
     from mypy_boto3_s3 import S3Client
 
+STATE_THREAD_POOL_SIZE = int(os.environ.get("STATE_THREAD_POOL_SIZE", "10"))
+STATE_CACHE_ENABLED = os.environ.get("STATE_CACHE", "").lower() in {"true", "yes"}
+STATE_CACHE_MAX_MEMORY_BYTES = int(
+    os.environ.get("STATE_CACHE_MAX_MEMORY_BYTES", str(64 * 1024 * 1024))
+)
+STATE_CACHE_MAX_DISK_BYTES = int(
+    os.environ.get("STATE_CACHE_MAX_DISK_BYTES", str(512 * 1024 * 1024))
+)
+
 
 class StateInaccessibleError(Exception):
     pass
@@ -58,6 +73,7 @@ def init_state(
         integration=integration,
         bucket=s3_settings.bucket,
         client=s3_settings.build_client(),
+        cache=get_state_cache() if STATE_CACHE_ENABLED else None,
     )
 
 
@@ -69,6 +85,11 @@ class S3StateConfiguration(BaseModel):
     def build_client(self) -> S3Client:
         pass
 
+    @staticmethod
+    def client_config() -> Config:
+        # one connection per concurrent request of State.iter_all
+        return Config(max_pool_connections=STATE_THREAD_POOL_SIZE)
+
 
 class S3CredsBasedStateConfiguration(S3StateConfiguration):
     access_key_id: str
@@ -80,7 +101,7 @@ class S3CredsBasedStateConfiguration(S3StateConfiguration):
             aws_secret_access_key=self.secret_access_key,
             region_name=self.region,
         )
-        return session.client("s3")
+        return session.client("s3", config=self.client_config())
 
 
 class S3ProfileBasedStateConfiguration(S3StateConfiguration):
@@ -88,7 +109,7 @@ class S3ProfileBasedStateConfiguration(S3StateConfiguration):
 
     def build_client(self) -> S3Client:
         session = boto3.Session(profile_name=self.profile, region_name=self.region)
-        return session.client("s3")
+        return session.client("s3", config=self.client_config())
 
 
 def acquire_state_settings(
@@ -219,6 +240,57 @@ def acquire_state_settings(
     )
 
 
+@dataclass(frozen=True)
+class CachedStateObject:
+    etag: str
+    body: bytes
+    metadata: dict[str, str]
+
+
+class StateCache:
+    """
+    Local copies of state objects. Entries are revalidated with a
+    conditional GET on every read, so they are never served stale.
+    """
+
+    def __init__(self, content: ContentCache) -> None:
+        self.content = content
+
+    @staticmethod
+    def _key(bucket: str, key: str) -> str:
+        return content_cache.cache_key(bucket, key)
+
+    def get(self, bucket: str, key: str) -> CachedStateObject | None:
+        data = self.content.get(self._key(bucket, key))
+        if data is None:
+            return None
+        header, _, body = data.partition(b"\n")
+        attrs = json.loads(header)
+        return CachedStateObject(
+            etag=attrs["etag"], body=body, metadata=attrs["metadata"]
+        )
+
+    def set(self, bucket: str, key: str, obj: CachedStateObject) -> None:
+        header = json_dumps({"etag": obj.etag, "metadata": obj.metadata})
+        self.content.set(self._key(bucket, key), f"{header}\n".encode() + obj.body)
+
+    def delete(self, bucket: str, key: str) -> None:
+        self.content.delete(self._key(bucket, key))
+
+
+@functools.cache
+def get_state_cache() -> StateCache:
+    """Return the process-wide state cache, the disk tier is enabled by STATE_CACHE_DIR."""
+    return StateCache(
+        ContentCache(
+            name="state",
+            max_memory_bytes=STATE_CACHE_MAX_MEMORY_BYTES,
+            cache_dir=os.environ.get("STATE_CACHE_DIR"),
+            max_disk_bytes=STATE_CACHE_MAX_DISK_BYTES,
+        )
+    )
+
+
 class AbortStateTransactionError(Exception):
     """Raise to abort a state transaction."""
 
@@ -236,15 +308,24 @@ class State:
     :param accounts: Graphql AWS accounts query results
     :param settings: App Interface settings
 
+    :param cache: (optional) local cache of state objects, revalidated by ETag
+
     :raises StateInaccessibleException: if the bucket is missing
     or not accessible
     """
 
-    def __init__(self, integration: str, bucket: str, client: S3Client) -> None:
+    def __init__(
+        self,
+        integration: str,
+        bucket: str,
+        client: S3Client,
+        cache: StateCache | None = None,
+    ) -> None:
         """Initiates S3 client from AWSApi."""
         self.state_path = f"state/{integration}" if integration else "state"
         self.bucket = bucket
         self.client = client
+        self.cache = cache
 
         # check if the bucket exists
         try:
@@ -305,12 +386,14 @@ class State:
                 f"in bucket {self.bucket} - {details!s}"
             ) from None
 
-    def ls(self) -> list[str]:
+    def ls(self, prefix: str = "") -> list[str]:
         """
         Returns a list of keys in the state
+
+        :param prefix: (optional) only list keys starting with prefix
         """
         objects = self.client.list_objects_v2(
-            Bucket=self.bucket, Prefix=f"{self.state_path}/"
+            Bucket=self.bucket, Prefix=f"{self.state_path}/{prefix}"
         )
 
         if "Contents" not in objects:
@@ -321,7 +404,7 @@ class State:
         while objects["IsTruncated"]:
             objects = self.client.list_objects_v2(
                 Bucket=self.bucket,
-                Prefix=f"{self.state_path}/",
+                Prefix=f"{self.state_path}/{prefix}",
                 ContinuationToken=objects["NextContinuationToken"],
             )
 
@@ -346,19 +429,40 @@ class State:
 
         :type key: string
         """
-        if not force and self.exists(key):
-            raise KeyError(f"[state] key {key} already exists in {self.state_path}")
-        self._set(key, value, metadata=metadata)
+        try:
+            self._set(key, value, metadata=metadata, overwrite=force)
+        except ClientError as details:
+            if details.response["Error"]["Code"] == "PreconditionFailed":
+                raise KeyError(
+                    f"[state] key {key} already exists in {self.state_path}"
+                ) from None
+            raise
 
     def _set(
-        self, key: str, value: Any, metadata: Mapping[str, str] | None = None
+        self,
+        key: str,
+        value: Any,
+        metadata: Mapping[str, str] | None = None,
+        overwrite: bool = True,
     ) -> None:
-        self.client.put_object(
+        key_path = f"{self.state_path}/{key}"
+        body = json_dumps(value).encode()
+        # a conditional write fails if the key exists, no need for a HEAD request
+        response = self.client.put_object(
             Bucket=self.bucket,
-            Key=f"{self.state_path}/{key}",
-            Body=json_dumps(value),
+            Key=key_path,
+            Body=body,
             Metadata=metadata or {},
+            **({} if overwrite else {"IfNoneMatch": "*"}),
         )
+        if self.cache:
+            self.cache.set(
+                self.bucket,
+                key_path,
+                CachedStateObject(
+                    etag=response["ETag"], body=body, metadata=dict(metadata or {})
+                ),
+            )
 
     def rm(self, key: str) -> None:
         """
@@ -371,6 +475,8 @@ class State:
         if not self.exists(key):
             raise KeyError(f"[state] key {key} does not exists in {self.state_path}")
         self.client.delete_object(Bucket=self.bucket, Key=f"{self.state_path}/{key}")
+        if self.cache:
+            self.cache.delete(self.bucket, f"{self.state_path}/{key}")
 
     def get(self, key: str, *args: Any) -> Any:
         """
@@ -394,22 +500,60 @@ class State:
         """
         Gets all keys and values from the state in the specified path.
         """
-        return {
-            k.replace(f"{path}/", "").strip("/"): self.get(k.lstrip("/"))
-            for k in self.ls()
-            if k.startswith(f"/{path}")
-        }
+        return dict(self.iter_all(path))
+
+    def iter_all(
+        self, path: str, thread_pool_size: int = STATE_THREAD_POOL_SIZE
+    ) -> Iterator[tuple[str, Any]]:
+        """
+        Yields all keys and values from the state in the specified path.
+
+        Values are fetched concurrently in batches of thread_pool_size, so
+        only one batch is held in memory at a time.
+
+        :param path: path to get the keys and values from
+        :param thread_pool_size: (optional) number of concurrent requests
+        """
+        for batch in itertools.batched(self.ls(path), thread_pool_size, strict=False):
+            values = threaded.run(
+                self.get, [k.lstrip("/") for k in batch], thread_pool_size
+            )
+            for k, value in zip(batch, values, strict=True):
+                yield k.replace(f"{path}/", "").strip("/"), value
 
     def __getitem__(self, item: str) -> Any:
+        key_path = f"{self.state_path}/{item}"
+        cached = self.cache.get(self.bucket, key_path) if self.cache else None
         try:
             response = self.client.get_object(
-                Bucket=self.bucket, Key=f"{self.state_path}/{item}"
+                Bucket=self.bucket,
+                Key=key_path,
+                **({"IfNoneMatch": cached.etag} if cached else {}),
             )
-            return json.loads(response["Body"].read())
+            body = response["Body"].read()
+            if self.cache:
+                self.cache.set(
+                    self.bucket,
+                    key_path,
+                    CachedStateObject(
+                        etag=response["ETag"],
+                        body=body,
+                        metadata=response.get("Metadata", {}),
+                    ),
+                )
         except ClientError as details:
-            if details.response["Error"]["Code"] == "NoSuchKey":
-                raise KeyError(item) from None
-            raise
+            match details.response["Error"]["Code"]:
+                case "304" if cached:
+                    # not modified
+                    body = cached.body
+                case "NoSuchKey":
+                    if self.cache:
+                        self.cache.delete(self.bucket, key_path)
+                    raise KeyError(item) from None
+                case _:
+                    raise
+        try:
+            return json.loads(body)
         except json.decoder.JSONDecodeError:
             raise KeyError(item) from None
 
@@ -5,6 +5,7 @@ import logging
 import re
 import shutil
 import tempfile
+import time
 from collections import defaultdict
 from contextlib import contextmanager
 from dataclasses import dataclass
@@ -34,6 +35,7 @@ from reconcile.typed_queries.app_interface_custom_messages import (
 )
 from reconcile.utils.aws_helper import get_region_from_availability_zone
 from reconcile.utils.datetime_util import ensure_utc, utc_now
+from reconcile.utils.metrics import terraform_init_duration
 
 if TYPE_CHECKING:
     from collections.abc import (
@@ -153,8 +155,20 @@ class TerraformClient:
             TerraformSpec(name=name, working_dir=wd)
             for name, wd in self.working_dirs.items()
         ]
+        # the first init of every provider version populates the shared
+        # plugin cache, all others only link the providers from it and can
+        # run concurrently
+        specs_by_version: dict[str | None, list[TerraformSpec]] = defaultdict(list)
         for spec in self.specs:
-            self.terraform_init(spec)
+            version = self.accounts.get(spec.name, {}).get("providerVersion")
+            specs_by_version[version].append(spec)
+        rest = []
+        with lean_tf.plugin_cache_lock():
+            for first, *others in specs_by_version.values():
+                self.terraform_init(first)
+                rest.extend(others)
+        with lean_tf.plugin_cache_lock(shared=True):
+            threaded.run(self.terraform_init, rest, self.thread_pool_size)
 
     @contextmanager
     def _terraform_log_file(
@@ -169,9 +183,15 @@ class TerraformClient:
 
     @retry(exceptions=TerraformCommandError)
     def terraform_init(self, spec: TerraformSpec) -> None:
+        start = time.monotonic()
         with self._terraform_log_file(spec.working_dir) as (f, env):
-            return_code, stdout, stderr = lean_tf.init(spec.working_dir, env=env)
+            return_code, stdout, stderr = lean_tf.init(
+                spec.working_dir, env=env | lean_tf.plugin_cache_env()
+            )
             log = f.read().decode("utf-8")
+        terraform_init_duration.labels(
+            integration=self.integration, account=spec.name
+        ).observe(time.monotonic() - start)
         error = self.check_output(spec.name, "init", return_code, stdout, stderr, log)
         if error:
             raise TerraformCommandError(
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 import re
 from typing import TYPE_CHECKING
 
+from sretoolbox.utils import threaded
+
 from reconcile.gql_definitions.jenkins_configs import jenkins_configs
 from reconcile.gql_definitions.jenkins_configs.jenkins_configs import (
     JenkinsConfigsQueryData,
@@ -27,7 +30,13 @@ from reconcile.typed_queries.app_interface_vault_settings import (
     get_app_interface_vault_settings,
 )
 from reconcile.utils import gql
+from reconcile.utils.constants import DEFAULT_THREAD_POOL_SIZE
+from reconcile.utils.metrics import (
+    vault_replication_pending_secrets,
+    vault_replication_secrets,
+)
 from reconcile.utils.secret_reader import SecretReaderBase, create_secret_reader
+from reconcile.utils.state import init_state
 from reconcile.utils.vault import (
     SecretAccessForbiddenError,
     SecretNotFoundError,
@@ -166,9 +175,15 @@ def write_dummy_versions(
 
 
 def copy_vault_secret(
-    dry_run: bool, source_vault: VaultClient, dest_vault: VaultClient, path: str
-) -> None:
-    """Copies a secret from the source vault to the destination vault"""
+    dry_run: bool,
+    source_vault: VaultClient,
+    dest_vault: VaultClient,
+    path: str,
+    replicated_version: int | None = None,
+) -> int | None:
+    """Copies a secret from the source vault to the destination vault and returns
+    the replicated version of a V2 secret. The destination is not checked if the
+    source version was already replicated."""
     secret_dict = {"path": path, "version": "LATEST"}
 
     try:
@@ -187,7 +202,10 @@ def copy_vault_secret(
         # we want to be aware of it, but not cause a failure of the complete
         # integration
         logging.error(["replicate_vault_secret", "no versions found for secret", path])
-        return
+        return None
+
+    if version is not None and version == replicated_version:
+        return version
 
     try:
         dest_data, dest_version = dest_vault.read_all_with_version(secret_dict)
@@ -208,7 +226,7 @@ def copy_vault_secret(
             source_version=version,
             path=path,
         )
-        return
+        return version
     except SecretNotFoundError:
         # Handle case where secret doesn't exist at all in destination vault
         logging.info([
@@ -224,7 +242,7 @@ def copy_vault_secret(
             source_version=version,
             path=path,
         )
-        return
+        return version
 
     # If we reach here, we successfully read the destination secret
     if dest_version is None or version is None:
@@ -232,7 +250,7 @@ def copy_vault_secret(
         if source_data == dest_data:
             # If the secret is the same in both vaults, we don't need
             # to copy it again
-            return
+            return None
 
         write_dict = {"path": path, "data": source_data}
         logging.info(["replicate_vault_secret", path])
@@ -250,6 +268,7 @@ def copy_vault_secret(
             current_source_version=version,
             path=path,
         )
+    return version
 
 
 def check_invalid_paths(
@@ -383,11 +402,58 @@ def get_vault_credentials(
     return vault_creds
 
 
+def replicate_secrets(
+    dry_run: bool,
+    source_vault: VaultClient,
+    dest_vault: VaultClient,
+    path_list: Iterable[str],
+    index: dict[str, int],
+    source: str = "",
+    destination: str = "",
+    thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE,
+) -> None:
+    """Replicates the secrets concurrently and updates the index of replicated
+    versions. Secrets with a source version present in the index are skipped."""
+    paths = list(path_list)
+    pending = vault_replication_pending_secrets.labels(
+        source=source, destination=destination
+    )
+    pending.set(len(paths))
+
+    def replicate(path: str) -> int | None:
+        replicated_version = index.get(path)
+        version = copy_vault_secret(
+            dry_run, source_vault, dest_vault, path, replicated_version
+        )
+        result = (
+            "skipped"
+            if version is not None and version == replicated_version
+            else "replicated"
+        )
+        vault_replication_secrets.labels(
+            source=source, destination=destination, result=result
+        ).inc()
+        pending.dec()
+        return version
+
+    versions = threaded.run(replicate, paths, thread_pool_size)
+    # secrets that are not replicated anymore are dropped from the index
+    index.clear()
+    index.update({
+        path: version
+        for path, version in zip(paths, versions, strict=True)
+        if version is not None
+    })
+
+
 def replicate_paths(
     dry_run: bool,
     source_vault: VaultClient,
     dest_vault: VaultClient,
     replications: VaultReplicationConfigV1,
+    source: str = "",
+    index: dict[str, int] | None = None,
+    thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE,
 ) -> None:
     """For each path present in the definition of the vault instance, replicate
     the secrets from the source vault to the destination vault"""
@@ -395,16 +461,16 @@ def replicate_paths(
     if replications.paths is None:
         return
 
+    path_list: list[str] = []
     for path in replications.paths:
         if isinstance(path, VaultReplicationJenkinsV1):
             policy_paths = get_policy_paths(path.policy) if path.policy else None
             jenkins_query_data = jenkins_configs.query(query_func=gql.get_api().query)
-            path_list = get_jenkins_secret_list(
+            jenkins_path_list = get_jenkins_secret_list(
                 source_vault, path.jenkins_instance.name, jenkins_query_data
             )
-            check_invalid_paths(path_list, policy_paths)
-            for vault_path in path_list:
-                copy_vault_secret(dry_run, source_vault, dest_vault, vault_path)
+            check_invalid_paths(jenkins_path_list, policy_paths)
+            path_list.extend(jenkins_path_list)
 
         elif isinstance(path, VaultReplicationPolicyV1):
             if path.policy is None:
@@ -414,9 +480,19 @@ def replicate_paths(
                     "Policy is required when using policy provider"
                 )
             policy_paths = get_policy_paths(path.policy)
-            path_list = get_policy_secret_list(source_vault, policy_paths)
-            for vault_path in path_list:
-                copy_vault_secret(dry_run, source_vault, dest_vault, vault_path)
+            path_list.extend(get_policy_secret_list(source_vault, policy_paths))
+
+    replicate_secrets(
+        dry_run=dry_run,
+        source_vault=source_vault,
+        dest_vault=dest_vault,
+        # a secret can be listed by multiple paths
+        path_list=dict.fromkeys(path_list),
+        index={} if index is None else index,
+        source=source,
+        destination=replications.vault_instance.name,
+        thread_pool_size=thread_pool_size,
+    )
 
 
 def _get_start_end_secret(path: str) -> tuple[str, str]:
@@ -468,14 +544,24 @@ def get_secrets_from_templated_path(path: str, vault_list: Iterable[str]) -> lis
     return secret_list
 
 
-def run(dry_run: bool) -> None:
+def index_key(source: str, replication: VaultReplicationConfigV1) -> str:
+    """State key of the index of replicated versions. Several replications can
+    share the source and destination vault, so their paths are part of the key."""
+    paths = replication.model_dump_json(include={"paths"})
+    paths_hash = hashlib.sha256(paths.encode()).hexdigest()
+    return f"index/{source}/{replication.vault_instance.name}/{paths_hash}"
+
+
+def run(dry_run: bool, thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE) -> None:
     gqlapi = gql.get_api()
     vault_settings = get_app_interface_vault_settings(query_func=gqlapi.query)
     secret_reader = create_secret_reader(use_vault=vault_settings.vault)
     vault_instances = (
         vault_instances_query(query_func=gqlapi.query).vault_instances or []
     )
+    state = init_state(integration=QONTRACT_INTEGRATION, secret_reader=secret_reader)
 
+    index_keys = set()
     for instance in vault_instances:
         if instance.replication:
             for replication in instance.replication:
@@ -487,6 +573,10 @@ def run(dry_run: bool) -> None:
                     replication.dest_auth,
                     replication.vault_instance.address,
                 )
+                # source versions that are present in the destination vault
+                key = index_key(instance.name, replication)
+                index_keys.add(key)
+                index: dict[str, int] = state.get(key, {})
 
                 # Private class VaultClient is used because the public class is
                 # defined as a singleton, and we need to create multiple instances
@@ -508,4 +598,14 @@ def run(dry_run: bool) -> None:
                         source_vault=source_vault,
                         dest_vault=dest_vault,
                         replications=replication,
+                        source=instance.name,
+                        index=index,
+                        thread_pool_size=thread_pool_size,
                     )
+                if not dry_run:
+                    state.add(key, index, force=True)
+
+    if not dry_run:
+        # indexes of replications that were changed or removed
+        for key in {k.lstrip("/") for k in state.ls("index/")} - index_keys:
+            state.rm(key)
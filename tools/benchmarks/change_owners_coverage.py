@@ -0,0 +1,180 @@
+"""Measure the wall time of the change-owners coverage on a synthetic MR,
+the way `change_owners.cover_changes` processes self-service roles for every
+changed file.
+
+Usage:
+
+    python -m tools.benchmarks.change_owners_coverage \\
+        --files 5000 --schemas 20 --change-types 200 --roles 50
+
+Every file gets a changed and an added field. Every change-type is bound to
+every file of its context schema through a schema-wide self-service role.
+"""
+
+import time
+from typing import TYPE_CHECKING, Any
+
+import click
+
+from reconcile.change_owners.bundle import (
+    QontractServerDatafileDiff,
+    QontractServerDiff,
+)
+from reconcile.change_owners.change_types import init_change_type_processors
+from reconcile.change_owners.changes import parse_bundle_changes
+from reconcile.change_owners.self_service_roles import (
+    cover_changes_with_self_service_roles,
+)
+from reconcile.gql_definitions.change_owners.queries import change_types
+from reconcile.gql_definitions.change_owners.queries.self_service_roles import (
+    ChangeTypeV1,
+    RoleV1,
+    SelfServiceConfigV1,
+    UserV1,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from reconcile.change_owners.bundle import FileDiffResolver
+
+
+def schema(i: int) -> str:
+    return f"/benchmark/schema-{i}-1.yml"
+
+
+def datafile(i: int, revision: int) -> dict[str, Any]:
+    content: dict[str, Any] = {
+        "name": f"file-{i}",
+        "spec": {"replicas": revision, "labels": {"app": f"app-{i}"}},
+        "owners": [{"$ref": f"/owners/owner-{o}.yml"} for o in range(5)],
+        "items": [{"name": f"item-{n}", "value": n} for n in range(20)],
+    }
+    if revision:
+        content["spec"]["labels"]["revision"] = str(revision)
+    return content
+
+
+def bundle_diff(files: int, schemas: int) -> QontractServerDiff:
+    datafiles = {}
+    for i in range(files):
+        path = f"/benchmark/file-{i}.yml"
+        datafiles[path] = QontractServerDatafileDiff(
+            datafilepath=path,
+            datafileschema=schema(i % schemas),
+            old=datafile(i, 0) | {"$schema": schema(i % schemas), "path": path},
+            new=datafile(i, 1) | {"$schema": schema(i % schemas), "path": path},
+        )
+    return QontractServerDiff(datafiles=datafiles, resources={})
+
+
+def change_type(i: int, schemas: int) -> change_types.ChangeTypeV1:
+    selectors = ["spec.replicas", "spec.labels", f"items[{i % 20}].value"]
+    if i % 4 == 0:
+        # templated expressions are rendered for every context file
+        selectors.append("owners[?(@.'$ref'=='{{ ctx_file_path }}')]")
+    return change_types.ChangeTypeV1(
+        name=f"change-type-{i}",
+        labels=None,
+        description="benchmark",
+        priority="urgent",
+        contextType="datafile",
+        contextSchema=schema(i % schemas),
+        disabled=False,
+        restrictive=False,
+        changes=[
+            change_types.ChangeTypeChangeDetectorJsonPathProviderV1(
+                provider="jsonPath",
+                changeSchema=None,
+                jsonPathSelectors=selectors,
+                context=None,
+            )
+        ],
+        implicitOwnership=[],
+        inherit=[],
+    )
+
+
+def role(i: int, change_type_names: list[str], schemas: int) -> RoleV1:
+    return RoleV1(
+        name=f"role-{i}",
+        labels=None,
+        path=f"/roles/role-{i}.yml",
+        self_service=[
+            SelfServiceConfigV1(
+                change_type=ChangeTypeV1(
+                    name=name, contextSchema=schema(int(name.rsplit("-")[-1]) % schemas)
+                ),
+                datafiles=None,
+                resources=None,
+            )
+            for name in change_type_names
+        ],
+        users=[
+            UserV1(
+                name=f"user-{i}", org_username=f"user-{i}", tag_on_merge_requests=False
+            )
+        ],
+        bots=[],
+        permissions=[],
+        memberSources=None,
+        expirationDate=None,
+    )
+
+
+class NoFileDiffResolver:
+    def lookup_file_diff(self, file_ref: Any) -> tuple[None, None]:
+        return None, None
+
+
+def timed(label: str, func: Callable[[], Any]) -> Any:
+    start = time.monotonic()
+    result = func()
+    click.echo(f"{label:<24} {time.monotonic() - start:>8.2f}s")
+    return result
+
+
+@click.command()
+@click.option("--files", default=5000, show_default=True, help="Changed datafiles")
+@click.option("--schemas", default=20, show_default=True, help="Distinct schemas")
+@click.option(
+    "--change-types",
+    "change_type_count",
+    default=200,
+    show_default=True,
+    help="Change-types, distributed over the schemas",
+)
+@click.option(
+    "--roles",
+    "role_count",
+    default=50,
+    show_default=True,
+    help="Self-service roles, distributed over the change-types",
+)
+def main(files: int, schemas: int, change_type_count: int, role_count: int) -> None:
+    file_diff_resolver: FileDiffResolver = NoFileDiffResolver()
+    processors = list(
+        init_change_type_processors(
+            [change_type(i, schemas) for i in range(change_type_count)],
+            file_diff_resolver,
+        ).values()
+    )
+    names = [p.name for p in processors]
+    roles = [role(i, names[i::role_count], schemas) for i in range(role_count)]
+
+    changes = timed(
+        "parse bundle changes",
+        lambda: parse_bundle_changes(bundle_diff(files, schemas)),
+    )
+    timed(
+        "cover changes",
+        lambda: cover_changes_with_self_service_roles(
+            roles=roles, change_type_processors=processors, bundle_changes=changes
+        ),
+    )
+    covered = sum(1 for c in changes if c.all_changes_covered())
+    click.echo(f"{covered}/{len(changes)} changed files covered")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Compare the wall time of `OC.apply` as called by
+`reconcile.openshift_base.apply`: client-side `oc apply` subprocesses
+(OCCli) and server-side apply through the dynamic client (OCNative). The
+last stage applies natively over objects created by `oc apply`, which
+moves their client-side managed fields to the server-side apply manager.
+
+Usage:
+
+    OC_TOKEN=... python -m tools.benchmarks.oc_apply \\
+        --server https://api.cluster:6443 --namespace benchmark --count 200
+
+The namespace must exist. All ConfigMaps created by the benchmark are
+deleted afterwards.
+"""
+
+import time
+from typing import TYPE_CHECKING
+
+import click
+
+from reconcile.status import RunningState
+from reconcile.utils.oc import OCCli, OCNative
+from reconcile.utils.openshift_resource import OpenshiftResource as OR
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+INTEGRATION = "benchmark-oc-apply"
+
+
+def configmaps(prefix: str, count: int) -> list[OR]:
+    return [
+        OR(
+            {
+                "apiVersion": "v1",
+                "kind": "ConfigMap",
+                "metadata": {"name": f"{prefix}-{i}"},
+                "data": {"key": f"value-{i}"},
+            },
+            INTEGRATION,
+            "0.1.0",
+        ).annotate()
+        for i in range(count)
+    ]
+
+
+def timed(label: str, count: int, func: Callable[[], None]) -> None:
+    start = time.monotonic()
+    func()
+    duration = time.monotonic() - start
+    click.echo(
+        f"{label:<28} {count:>6} objects {duration:>8.2f}s "
+        f"{count / duration:>8.1f} objects/s"
+    )
+
+
+@click.command()
+@click.option("--server", required=True, help="API server URL of the cluster")
+@click.option("--token", envvar="OC_TOKEN", required=True, help="Bearer token")
+@click.option("--namespace", required=True, help="Namespace to apply into")
+@click.option("--count", default=100, show_default=True, help="Number of objects")
+def main(server: str, token: str, namespace: str, count: int) -> None:
+    running_state = RunningState()
+    running_state.integration = INTEGRATION
+    running_state.timestamp = time.time()
+
+    oc_cli = OCCli("benchmark", server, token, init_api_resources=True)
+    oc_native = OCNative("benchmark", server, token, native_writes=True)
+
+    def apply(oc: OCCli, resources: list[OR]) -> Callable[[], None]:
+        def run() -> None:
+            for r in resources:
+                oc.apply(namespace, r)
+
+        return run
+
+    def delete(oc: OCCli, resources: list[OR]) -> Callable[[], None]:
+        def run() -> None:
+            for r in resources:
+                oc.delete(namespace, r.kind, r.name)
+
+        return run
+
+    for label, oc in (("oc apply", oc_cli), ("native apply", oc_native)):
+        resources = configmaps(f"benchmark-{type(oc).__name__.lower()}", count)
+        timed(label, count, apply(oc, resources))
+        timed(f"{label} (no-op)", count, apply(oc, resources))
+        timed(f"delete ({label})", count, delete(oc, resources))
+
+    resources = configmaps("benchmark-upgrade", count)
+    apply(oc_cli, resources)()
+    timed("native apply (upgrade)", count, apply(oc_native, resources))
+    timed("native apply (upgraded)", count, apply(oc_native, resources))
+    delete(oc_native, resources)()
+
+    oc_native.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Measure the cost of hashing and annotating OpenshiftResources the way
+`openshift_base.realize_data` does for an inventory of desired and current
+objects.
+
+Usage:
+
+    python -m tools.benchmarks.openshift_resource_hash --count 100000
+
+With --trace-memory the peak memory allocated while building the inventory
+and running the hot loop is reported as well (slower).
+"""
+
+import time
+import tracemalloc
+from typing import TYPE_CHECKING, Any
+
+import click
+
+from reconcile.utils.openshift_resource import OpenshiftResource as OR
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+INTEGRATION = "benchmark-openshift-resource-hash"
+INTEGRATION_VERSION = "0.1.0"
+
+
+def deployment(i: int) -> dict[str, Any]:
+    return {
+        "apiVersion": "apps/v1",
+        "kind": "Deployment",
+        "metadata": {
+            "name": f"deployment-{i}",
+            "labels": {"app": f"app-{i}", "component": "api"},
+            "annotations": {"deployment.kubernetes.io/revision": "3"},
+        },
+        "spec": {
+            "replicas": 3,
+            "selector": {"matchLabels": {"app": f"app-{i}"}},
+            "template": {
+                "metadata": {"labels": {"app": f"app-{i}"}},
+                "spec": {
+                    "containers": [
+                        {
+                            "name": "api",
+                            "image": f"quay.io/org/app-{i}:{i:040x}",
+                            "env": [
+                                {"name": f"ENV_{j}", "value": f"value-{j}"}
+                                for j in range(10)
+                            ],
+                            "resources": {
+                                "requests": {"cpu": "100m", "memory": "256Mi"},
+                                "limits": {"cpu": "1", "memory": "512Mi"},
+                            },
+                        }
+                    ]
+                },
+            },
+        },
+    }
+
+
+def configmap(i: int) -> dict[str, Any]:
+    return {
+        "apiVersion": "v1",
+        "kind": "ConfigMap",
+        "metadata": {"name": f"configmap-{i}"},
+        "data": {f"key-{j}": f"value-{i}-{j}" * 4 for j in range(20)},
+    }
+
+
+def secret(i: int) -> dict[str, Any]:
+    return {
+        "apiVersion": "v1",
+        "kind": "Secret",
+        "type": "Opaque",
+        "metadata": {"name": f"secret-{i}"},
+        "data": {f"key-{j}": "dmFsdWU=" * 8 for j in range(5)},
+    }
+
+
+def service(i: int) -> dict[str, Any]:
+    return {
+        "apiVersion": "v1",
+        "kind": "Service",
+        "metadata": {"name": f"service-{i}"},
+        "spec": {
+            "type": "ClusterIP",
+            "selector": {"app": f"app-{i}"},
+            "ports": [{"name": "http", "port": 8080, "targetPort": 8080}],
+        },
+    }
+
+
+BUILDERS = (deployment, configmap, secret, service)
+
+
+def inventory(count: int) -> list[tuple[OR, OR]]:
+    """Desired objects and their annotated current counterparts."""
+    pairs = []
+    for i in range(count):
+        build = BUILDERS[i % len(BUILDERS)]
+        desired = OR(build(i), INTEGRATION, INTEGRATION_VERSION)
+        annotated = OR(build(i), INTEGRATION, INTEGRATION_VERSION).annotate()
+        current = OR(annotated.body, INTEGRATION, INTEGRATION_VERSION)
+        pairs.append((desired, current))
+    return pairs
+
+
+def realize(pairs: list[tuple[OR, OR]]) -> None:
+    # mirrors the hash checks of the 3-way diff and the annotation on apply
+    for desired, current in pairs:
+        if (
+            not current.has_valid_sha256sum()
+            or current.annotations.get("qontract.sha256sum") != desired.sha256sum()
+        ):
+            desired.annotate()
+
+
+def timed(label: str, count: int, func: Callable[[], Any]) -> Any:
+    start = time.monotonic()
+    result = func()
+    duration = time.monotonic() - start
+    click.echo(
+        f"{label:<20} {count:>7} objects {duration:>8.2f}s "
+        f"{count / duration:>10.1f} objects/s"
+    )
+    return result
+
+
+@click.command()
+@click.option("--count", default=100_000, show_default=True, help="Number of objects")
+@click.option("--trace-memory", is_flag=True, help="Report peak memory allocations")
+def main(count: int, trace_memory: bool) -> None:
+    if trace_memory:
+        tracemalloc.start()
+
+    pairs = timed("build inventory", count, lambda: inventory(count))
+    timed("realize (cold)", count, lambda: realize(pairs))
+    timed("realize (warm)", count, lambda: realize(pairs))
+
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        click.echo(f"peak memory {peak / 1024 / 1024:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Compare the wall time of processing OpenShift templates with
+`oc process` subprocesses (OCLocal) and in-process (openshift_template),
+the way `SaasHerder._process_template` does for every target.
+
+Usage:
+
+    python -m tools.benchmarks.openshift_template_process \\
+        --template openshift/qontract-manager.yaml --count 500
+
+Requires the `oc` binary unless --skip-oc is passed.
+"""
+
+import time
+from typing import TYPE_CHECKING, Any
+
+import click
+import yaml
+
+from reconcile.utils import openshift_template
+from reconcile.utils.oc import OCLocal
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def parameters(template: dict[str, Any], i: int) -> dict[str, str]:
+    # every target gets its own parameter values
+    return {p["name"]: f"value-{i}" for p in template.get("parameters") or []} | {
+        "IMAGE_TAG": f"{i:07x}"
+    }
+
+
+def timed(label: str, count: int, func: Callable[[], None]) -> None:
+    start = time.monotonic()
+    func()
+    duration = time.monotonic() - start
+    click.echo(
+        f"{label:<20} {count:>6} templates {duration:>8.2f}s "
+        f"{count / duration:>8.1f} templates/s"
+    )
+
+
+@click.command()
+@click.option(
+    "--template",
+    "template_path",
+    default="openshift/qontract-manager.yaml",
+    show_default=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Template to process",
+)
+@click.option("--count", default=200, show_default=True, help="Number of targets")
+@click.option("--skip-oc", is_flag=True, help="Only benchmark in-process processing")
+def main(template_path: str, count: int, skip_oc: bool) -> None:
+    with open(template_path, encoding="utf-8") as f:
+        template = yaml.safe_load(f)
+
+    def native() -> None:
+        for i in range(count):
+            openshift_template.process(template, parameters(template, i))
+
+    def oc_process() -> None:
+        oc = OCLocal("cluster", None, None, local=True)
+        for i in range(count):
+            oc.process(template, parameters(template, i))
+
+    timed("in-process", count, native)
+    if not skip_oc:
+        timed("oc process", count, oc_process)
+
+
+if __name__ == "__main__":
+    main()